@@ -66,6 +66,16 @@ DATABASES = {
 
 DATABASE_ROUTERS = ["backend.dbrouters.AuthRouter"]
 
+# Seconds before cached vocabularies are reloaded even without a
+# vocabulary_changed notification (see trials.vocabulary).
+VOCABULARY_CACHE_TTL = int(os.environ.get("VOCABULARY_CACHE_TTL", "300"))
+VOCABULARY_CACHE_LISTEN = os.environ.get("VOCABULARY_CACHE_LISTEN", "1") == "1"
+
+# Cache-Control lifetimes (seconds) of the public trial detail pages, for
+# browsers and for shared caches such as a CDN. Both revalidate with ETags.
+TRIAL_DETAIL_MAX_AGE = int(os.environ.get("TRIAL_DETAIL_MAX_AGE", "60"))
+TRIAL_DETAIL_SHARED_MAX_AGE = int(os.environ.get("TRIAL_DETAIL_SHARED_MAX_AGE", "300"))
+
 PASSWORD_HASHERS = [
     "django.contrib.auth.hashers.PBKDF2PasswordHasher",
     "backend.hashers.sha1_hasher.LegacySHA1PasswordHasher",
@@ -3,11 +3,28 @@
 from django.contrib import admin
 from django.urls import path
 
-from trials.views import TrialCreateView, TrialListView
+from trials.views import (
+    TrialAutocompleteView,
+    TrialCreateView,
+    TrialDetailJsonView,
+    TrialDetailView,
+    TrialExportView,
+    TrialListView,
+    TrialSearchView,
+)
 
 
 urlpatterns = [
     path("", TrialListView.as_view(), name="trial-list"),
     path("trials/create/", TrialCreateView.as_view(), name="trial-create"),
+    path("trials/search/", TrialSearchView.as_view(), name="trial-search"),
+    path("trials/export/", TrialExportView.as_view(), name="trial-export"),
+    path(
+        "trials/autocomplete/<str:source>/",
+        TrialAutocompleteView.as_view(),
+        name="trial-autocomplete",
+    ),
+    path("trials/<str:register_id>.json", TrialDetailJsonView.as_view(), name="trial-detail-json"),
+    path("trials/<str:register_id>/", TrialDetailView.as_view(), name="trial-detail"),
     path("admin/", admin.site.urls),
 ]
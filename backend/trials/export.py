@@ -0,0 +1,192 @@
+"""Streaming NDJSON/CSV export of public trials."""
+
+from __future__ import annotations
+
+import csv
+import io
+import zlib
+from datetime import datetime, time
+from typing import Any, Iterator, Sequence
+
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from .payloads import iter_trial_payload_texts, iter_trial_payloads
+
+EXPORT_FORMATS = ("ndjson", "csv")
+
+CONTENT_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+CSV_COLUMNS = (
+    "ct_id",
+    "register_id",
+    "public_title",
+    "scientific_title",
+    "recruitment_status",
+    "study_phase",
+    "primary_sponsor",
+    "countries",
+    "conditions",
+    "interventions",
+    "brief_summary",
+    "created_at",
+    "updated_at",
+)
+
+# Child collections read by _csv_row; the rest are never aggregated.
+CSV_SECTIONS = ("locations", "conditions", "interventions")
+
+# Output is flushed to the consumer whenever this many bytes are buffered.
+FLUSH_BYTES = 64 * 1024
+
+
+def iter_export(
+    export_format: str,
+    *,
+    since: datetime | None = None,
+    compress: bool = False,
+    sections: Sequence[str] | None = None,
+    stats: dict[str, int] | None = None,
+) -> Iterator[bytes]:
+    """Yield the public registry as ``export_format`` in byte chunks.
+
+    Trials come from a server-side cursor and are written as they arrive, so
+    memory use does not grow with the registry. The stream runs in one
+    transaction, which keeps the cursor from being materialized up front and
+    gives the export a consistent snapshot. ``since`` restricts the export
+    to trials whose ``updated_at`` is later than the given instant. With
+    ``compress`` the stream is gzip-encoded on the fly. ``sections`` limits
+    NDJSON documents to those child collections (validate it with
+    ``payloads.parse_sections`` first); CSV rows always use ``CSV_SECTIONS``.
+    ``stats["trials"]`` is updated with the number of trials written, if given.
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {export_format}")
+    with transaction.atomic():
+        yield from _iter_encoded(export_format, since, compress, sections, stats)
+
+
+def _iter_encoded(
+    export_format: str,
+    since: datetime | None,
+    compress: bool,
+    sections: Sequence[str] | None,
+    stats: dict[str, int] | None,
+) -> Iterator[bytes]:
+    lines = _iter_ndjson(since, sections) if export_format == "ndjson" else _iter_csv(since)
+    compressor = zlib.compressobj(wbits=31) if compress else None
+    buffer = bytearray()
+    count = 0
+    for line in lines:
+        buffer += line
+        count += 1
+        if len(buffer) >= FLUSH_BYTES:
+            chunk = compressor.compress(bytes(buffer)) if compressor else bytes(buffer)
+            buffer.clear()
+            if chunk:
+                yield chunk
+    if export_format == "csv" and count:
+        count -= 1  # header row
+    if stats is not None:
+        stats["trials"] = count
+    tail = bytes(buffer)
+    if compressor:
+        tail = compressor.compress(tail) + compressor.flush()
+    if tail:
+        yield tail
+
+
+def parse_since(value: str | None) -> datetime | None:
+    """Parse an ISO date or datetime; dates mean midnight, naive values local time."""
+    if not value:
+        return None
+    parsed = parse_datetime(value)
+    if parsed is None:
+        day = parse_date(value)
+        if day is None:
+            raise ValueError(f"Invalid since value: {value}")
+        parsed = datetime.combine(day, time.min)
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an ``Accept-Encoding`` header allows gzip, honouring q-values.
+
+    ``gzip;q=0`` refuses gzip; a ``*`` entry applies when gzip is not listed.
+    """
+    qualities: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, *params = item.split(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+    for coding in ("gzip", "x-gzip", "*"):
+        if coding in qualities:
+            return qualities[coding] > 0
+    return False
+
+
+def _iter_ndjson(since: datetime | None, sections: Sequence[str] | None) -> Iterator[bytes]:
+    payloads = iter_trial_payload_texts(updated_since=since, public_only=True, sections=sections)
+    for _, payload in payloads:
+        yield payload.encode("utf-8") + b"\n"
+
+
+def _iter_csv(since: datetime | None) -> Iterator[bytes]:
+    text = io.StringIO()
+    writer = csv.writer(text)
+
+    def render(row: tuple[Any, ...]) -> bytes:
+        writer.writerow(row)
+        value = text.getvalue()
+        text.seek(0)
+        text.truncate()
+        return value.encode("utf-8")
+
+    yield render(CSV_COLUMNS)
+    payloads = iter_trial_payloads(updated_since=since, public_only=True, sections=CSV_SECTIONS)
+    for _, payload in payloads:
+        yield render(_csv_row(payload))
+
+
+def _csv_row(payload: dict[str, Any]) -> tuple[Any, ...]:
+    status = payload.get("recruitment_status") or {}
+    phase = payload.get("study_phase") or {}
+    sponsor = payload.get("primary_sponsor") or {}
+    countries = dict.fromkeys(
+        (location.get("country") or {}).get("code") or "" for location in payload.get("locations", [])
+    )
+    return (
+        payload.get("ct_id"),
+        payload.get("register_id"),
+        payload.get("public_title"),
+        payload.get("scientific_title"),
+        status.get("code"),
+        phase.get("code"),
+        sponsor.get("name"),
+        _join(countries),
+        _join(condition.get("condition_name") for condition in payload.get("conditions", [])),
+        _join(intervention.get("name") for intervention in payload.get("interventions", [])),
+        payload.get("brief_summary"),
+        payload.get("created_at"),
+        payload.get("updated_at"),
+    )
+
+
+def _join(values: Any) -> str:
+    return "; ".join(value for value in values if value)
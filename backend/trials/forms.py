@@ -8,6 +8,8 @@ from django import forms
 from django.forms import BaseFormSet, formset_factory
 from django.utils.translation import gettext_lazy as _
 
+from .widgets import AutocompleteSelect, AutocompleteTextInput
+
 
 ChoiceList = Sequence[Tuple[Union[str, int], str]]
 
@@ -42,7 +44,9 @@ class TrialForm(forms.Form):
         label=_("Lead sponsor name"),
         required=False,
         max_length=255,
+        widget=AutocompleteTextInput("institutions", value_field="lead_sponsor_id"),
     )
+    lead_sponsor_id = forms.IntegerField(required=False, widget=forms.HiddenInput)
     lead_sponsor_type = forms.CharField(
         label=_("Lead sponsor type"),
         required=False,
@@ -74,7 +78,11 @@ class TrialForm(forms.Form):
 
 
 class TrialCountryForm(forms.Form):
-    country_id = forms.ChoiceField(label=_("Country"), choices=())
+    country_id = forms.ChoiceField(
+        label=_("Country"),
+        choices=(),
+        widget=AutocompleteSelect("countries"),
+    )
     city = forms.CharField(label=_("City"), required=False, max_length=255)
     site_name = forms.CharField(label=_("Site name"), required=False, max_length=255)
 
@@ -119,7 +127,12 @@ class InterventionForm(forms.Form):
 
 
 class TrialConditionForm(forms.Form):
-    condition_name = forms.CharField(label=_("Condition name"), max_length=255)
+    condition_name = forms.CharField(
+        label=_("Condition name"),
+        max_length=255,
+        widget=AutocompleteTextInput("conditions", value_field="mesh_term"),
+    )
+    mesh_term = forms.CharField(required=False, max_length=50, widget=forms.HiddenInput)
     condition_category_id = forms.ChoiceField(
         label=_("Condition category"),
         required=False,
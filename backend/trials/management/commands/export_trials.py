@@ -0,0 +1,69 @@
+"""Export the public registry as NDJSON or CSV."""
+
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from trials.export import EXPORT_FORMATS, iter_export, parse_since
+from trials.payloads import TRIAL_SECTIONS, parse_sections
+
+
+class Command(BaseCommand):
+    help = "Stream public trials as NDJSON or CSV, optionally gzip-compressed."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--format",
+            choices=EXPORT_FORMATS,
+            default="ndjson",
+            help="Output format (default: ndjson).",
+        )
+        parser.add_argument(
+            "--since",
+            help="Only export trials whose updated_at is later than this ISO date or datetime.",
+        )
+        parser.add_argument(
+            "--sections",
+            help=(
+                "Comma-separated child collections to include in NDJSON documents "
+                f"({', '.join(TRIAL_SECTIONS)}); all of them by default."
+            ),
+        )
+        parser.add_argument(
+            "--output",
+            "-o",
+            help="Write to this file instead of standard output.",
+        )
+        parser.add_argument(
+            "--gzip",
+            action="store_true",
+            help="Gzip-compress the output while streaming.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        try:
+            since = parse_since(options["since"])
+            sections = parse_sections(options["sections"])
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+        stats: dict[str, int] = {}
+        chunks = iter_export(
+            options["format"],
+            since=since,
+            compress=options["gzip"],
+            sections=sections,
+            stats=stats,
+        )
+        if options["output"]:
+            with open(options["output"], "wb") as handle:
+                for chunk in chunks:
+                    handle.write(chunk)
+        else:
+            for chunk in chunks:
+                sys.stdout.buffer.write(chunk)
+            sys.stdout.buffer.flush()
+        self.stderr.write(self.style.SUCCESS(f"Exported {stats.get('trials', 0)} trials."))
+
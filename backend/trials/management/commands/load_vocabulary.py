@@ -0,0 +1,57 @@
+"""Bulk-load CSV/TSV vocabulary files with COPY and a set-based upsert."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection, transaction
+
+# The loader lives with the other database tooling at the repository root.
+REPOSITORY_ROOT = Path(settings.BASE_DIR).resolve().parent
+if str(REPOSITORY_ROOT) not in sys.path:
+    sys.path.append(str(REPOSITORY_ROOT))
+
+from database.load_vocabulary import (  # noqa: E402
+    VOCABULARIES,
+    load_vocabulary_dir,
+    load_vocabulary_file,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Load a vocabulary (country, institution, icd10, mesh, decs) from a CSV or TSV file, "
+        "or every <vocabulary>.csv/.tsv[.gz] file of a directory."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("vocabulary", nargs="?", choices=list(VOCABULARIES))
+        parser.add_argument("path", nargs="?", help="CSV or TSV file, optionally gzipped.")
+        parser.add_argument(
+            "--dir",
+            dest="directory",
+            help="Load every <vocabulary>.csv/.tsv[.gz] file found in this directory.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        directory = options["directory"]
+        vocabulary = options["vocabulary"]
+        path = options["path"]
+        if bool(directory) == bool(vocabulary and path):
+            raise CommandError("Pass either a vocabulary and a file, or --dir.")
+        try:
+            with transaction.atomic(), connection.cursor() as cursor:
+                if directory:
+                    results = load_vocabulary_dir(cursor, Path(directory))
+                else:
+                    results = [load_vocabulary_file(cursor, vocabulary, Path(path))]
+        except (OSError, ValueError) as exc:
+            raise CommandError(str(exc)) from exc
+        if not results:
+            self.stdout.write("No vocabulary files found.")
+        for result in results:
+            self.stdout.write(self.style.SUCCESS(result.summary()))
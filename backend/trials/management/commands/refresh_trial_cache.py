@@ -0,0 +1,42 @@
+"""Rebuild stale entries of the trial payload cache."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connection, transaction
+
+
+class Command(BaseCommand):
+    help = "Rebuild stale or missing ct_payload_cache rows in batches."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of trials rebuilt per transaction (default: 500).",
+        )
+        parser.add_argument(
+            "--max-batches",
+            type=int,
+            default=None,
+            help="Stop after this many batches even if stale rows remain.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        batch_size: int = options["batch_size"]
+        max_batches: int | None = options["max_batches"]
+        total = 0
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute("SELECT refresh_trial_payload_cache(%s)", [batch_size])
+                refreshed = int(cursor.fetchone()[0])
+            if not refreshed:
+                break
+            batches += 1
+            total += refreshed
+            self.stdout.write(f"Refreshed {refreshed} trial payloads (batch {batches}).")
+        self.stdout.write(self.style.SUCCESS(f"Refreshed {total} trial payloads in total."))
@@ -0,0 +1,58 @@
+"""Report hit ratio and staleness of the trial payload cache."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connection
+
+STATUS_QUERY = """
+    SELECT
+        COUNT(*),
+        COUNT(pc.ct_id) FILTER (WHERE NOT pc.is_stale),
+        COUNT(pc.ct_id) FILTER (WHERE pc.is_stale),
+        COUNT(*) FILTER (WHERE pc.ct_id IS NULL),
+        MAX(NOW() - pc.invalidated_at) FILTER (WHERE pc.is_stale),
+        MIN(pc.built_at)
+    FROM ct AS c
+    LEFT JOIN ct_payload_cache AS pc ON pc.ct_id = c.id
+"""
+
+
+class Command(BaseCommand):
+    help = "Show hit ratio and staleness of ct_payload_cache."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--reset-counters",
+            action="store_true",
+            help="Reset the hit/miss counters after reporting.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute(STATUS_QUERY)
+            total, fresh, stale, missing, oldest_stale, oldest_build = cursor.fetchone()
+            hits = self._counter(cursor, "ct_payload_cache_hit_seq")
+            misses = self._counter(cursor, "ct_payload_cache_miss_seq")
+            if options["reset_counters"]:
+                cursor.execute("ALTER SEQUENCE ct_payload_cache_hit_seq RESTART")
+                cursor.execute("ALTER SEQUENCE ct_payload_cache_miss_seq RESTART")
+
+        reads = hits + misses
+        ratio = f"{hits / reads:.1%}" if reads else "n/a"
+        self.stdout.write(f"Trials:            {total}")
+        self.stdout.write(f"Fresh entries:     {fresh}")
+        self.stdout.write(f"Stale entries:     {stale}")
+        self.stdout.write(f"Never built:       {missing}")
+        self.stdout.write(f"Oldest stale for:  {oldest_stale or '-'}")
+        self.stdout.write(f"Oldest build:      {oldest_build or '-'}")
+        self.stdout.write(f"Reads (hit/miss):  {hits}/{misses}")
+        self.stdout.write(f"Hit ratio:         {ratio}")
+
+    @staticmethod
+    def _counter(cursor: Any, sequence: str) -> int:
+        cursor.execute(f"SELECT last_value, is_called FROM {sequence}")
+        last_value, is_called = cursor.fetchone()
+        return int(last_value) if is_called else 0
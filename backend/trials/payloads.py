@@ -0,0 +1,198 @@
+"""Helpers for reading full trial documents from PostgreSQL."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Iterable, Iterator, Optional, Sequence
+
+from django.db import connection, transaction
+
+DEFAULT_CHUNK_SIZE = 200
+
+# Child collections that can be requested individually. The scalar fields
+# (titles, status, phase, sponsor, timestamps) are always included.
+TRIAL_SECTIONS = (
+    "locations",
+    "interventions",
+    "conditions",
+    "documents",
+    "contacts",
+    "identifiers",
+    "status_history",
+)
+
+# Enough for a list card or a CSV row: title, status and countries.
+SUMMARY_SECTIONS = ("locations",)
+
+
+def iter_trial_payloads(
+    ct_ids: Sequence[int] | None = None,
+    *,
+    updated_since: datetime | None = None,
+    public_only: bool = False,
+    sections: Iterable[str] | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Yield ``(ct_id, payload)`` pairs from ``get_full_trials_json_auto_multilang``.
+
+    Rows are streamed through a server-side cursor in chunks of ``chunk_size``
+    so exporting the whole registry keeps memory usage flat. Passing neither
+    ``ct_ids`` nor a filter selects every trial. ``sections`` limits the
+    documents to those child collections (see ``TRIAL_SECTIONS``); the others
+    are neither queried nor present. ``None`` includes all of them.
+    """
+    rows = _iter_payload_rows(
+        "payload",
+        ct_ids,
+        updated_since=updated_since,
+        public_only=public_only,
+        sections=sections,
+        chunk_size=chunk_size,
+    )
+    for ct_id, raw_payload in rows:
+        yield ct_id, _load_payload(raw_payload)
+
+
+def iter_trial_payload_texts(
+    ct_ids: Sequence[int] | None = None,
+    *,
+    updated_since: datetime | None = None,
+    public_only: bool = False,
+    sections: Iterable[str] | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[tuple[int, str]]:
+    """Like :func:`iter_trial_payloads` but yield the payload as JSON text.
+
+    Avoids a decode/encode round trip when the document is written out as is.
+    """
+    return _iter_payload_rows(
+        "payload::text",
+        ct_ids,
+        updated_since=updated_since,
+        public_only=public_only,
+        sections=sections,
+        chunk_size=chunk_size,
+    )
+
+
+def parse_sections(value: str | Iterable[str] | None) -> list[str] | None:
+    """Validate requested sections given as a list or a comma-separated string.
+
+    Returns ``None`` (every section) for ``None``, and the sections in
+    ``TRIAL_SECTIONS`` order otherwise; an empty string selects none.
+    Unknown names raise ``ValueError``.
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.split(",")
+    requested = {name.strip() for name in value if name.strip()}
+    unknown = requested.difference(TRIAL_SECTIONS)
+    if unknown:
+        raise ValueError(
+            f"Unknown sections: {', '.join(sorted(unknown))}. "
+            f"Choose from: {', '.join(TRIAL_SECTIONS)}."
+        )
+    return [name for name in TRIAL_SECTIONS if name in requested]
+
+
+def _iter_payload_rows(
+    column: str,
+    ct_ids: Sequence[int] | None,
+    *,
+    updated_since: datetime | None,
+    public_only: bool,
+    sections: Iterable[str] | None,
+    chunk_size: int,
+) -> Iterator[tuple[int, Any]]:
+    # In autocommit mode Django declares the cursor WITH HOLD, and PostgreSQL
+    # materializes the whole result before returning the first row. Inside a
+    # transaction the rows really stream. No savepoint is needed when a caller
+    # already holds one open.
+    with transaction.atomic(savepoint=False), connection.chunked_cursor() as cursor:
+        cursor.execute(
+            f"SELECT ct_id, {column} FROM get_full_trials_json_auto_multilang("
+            "%s::bigint[], %s, %s, %s::text[])",
+            [
+                list(ct_ids) if ct_ids is not None else None,
+                updated_since,
+                public_only,
+                parse_sections(sections),
+            ],
+        )
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            for ct_id, value in rows:
+                yield int(ct_id), value
+
+
+def get_trial_payload(ct_id: int) -> dict[str, Any]:
+    """Return one trial document, served from ``ct_payload_cache`` when fresh."""
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT get_cached_trial_json(%s)", [ct_id])
+        row = cursor.fetchone()
+    return _load_payload(row[0])
+
+
+def get_trial_payload_text(ct_id: int) -> str:
+    """Like :func:`get_trial_payload` but return the document as JSON text."""
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT get_cached_trial_json(%s)::text", [ct_id])
+        row = cursor.fetchone()
+    return row[0]
+
+
+@dataclass(frozen=True)
+class TrialVersion:
+    """Cache validators of one public trial, read without building its payload."""
+
+    ct_id: int
+    etag: str
+    last_modified: datetime
+
+
+TRIAL_VERSION_QUERY = """
+    SELECT
+        c.id,
+        c.updated_at,
+        pc.invalidated_at,
+        CASE WHEN NOT pc.is_stale THEN pc.content_hash END
+    FROM ct AS c
+    LEFT JOIN ct_payload_cache AS pc ON pc.ct_id = c.id
+    WHERE c.register_id = %s
+      AND c.is_public
+"""
+
+
+def get_trial_version(register_id: str) -> Optional[TrialVersion]:
+    """Return the validators of a public trial, or ``None`` if there is none.
+
+    A fresh ``ct_payload_cache`` row supplies the md5 of the exact document.
+    Otherwise the tag is derived from ``ct.updated_at`` and the cache's
+    ``invalidated_at``, which every change to the trial or its child rows
+    advances. Callers read the version before the payload, so a concurrent
+    edit can only cost an extra full response, never a wrong 304.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(TRIAL_VERSION_QUERY, [register_id])
+        row = cursor.fetchone()
+    if row is None:
+        return None
+    ct_id, updated_at, invalidated_at, content_hash = row
+    if content_hash is None:
+        invalidated = invalidated_at.isoformat() if invalidated_at else ""
+        stamp = f"{ct_id}:{updated_at.isoformat()}:{invalidated}"
+        content_hash = "v" + hashlib.md5(stamp.encode("utf-8")).hexdigest()
+    last_modified = max(updated_at, invalidated_at) if invalidated_at else updated_at
+    return TrialVersion(int(ct_id), content_hash, last_modified)
+
+
+def _load_payload(raw_payload: Any) -> dict[str, Any]:
+    if isinstance(raw_payload, str):
+        return json.loads(raw_payload)
+    return raw_payload
@@ -1,17 +1,31 @@
 from __future__ import annotations
 
 import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
 from typing import Any
+from urllib.parse import urlencode
 
+from django.conf import settings
 from django.db import connection
 from django.db import transaction
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import HttpRequest, HttpResponse
-from django.shortcuts import redirect
+from django.http import (
+    Http404,
+    HttpRequest,
+    HttpResponse,
+    HttpResponseBadRequest,
+    JsonResponse,
+    StreamingHttpResponse,
+)
+from django.shortcuts import redirect, render
 from django.urls import reverse_lazy
-from django.views.generic import TemplateView
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from django.views.generic import TemplateView, View
 from django.utils.translation import gettext_lazy as _
 
+from .export import CONTENT_TYPES, EXPORT_FORMATS, accepts_gzip, iter_export, parse_since
 from .forms import (
     InterventionFormSet,
     TrialConditionFormSet,
@@ -19,50 +33,264 @@ from .forms import (
     TrialDocumentFormSet,
     TrialForm,
 )
+from .payloads import (
+    TrialVersion,
+    get_trial_payload,
+    get_trial_payload_text,
+    get_trial_version,
+    parse_sections,
+)
+from .vocabulary import get_vocabulary
 
 
 class TrialListView(TemplateView):
     template_name = "admin/trials_list.html"
+    page_size = 25
+    filter_params = ("status", "phase", "country", "q")
 
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
+        filters = {
+            name: self.request.GET.get(name, "").strip() for name in self.filter_params
+        }
+        direction = "prev" if self.request.GET.get("before") else "next"
+        cursor = _decode_cursor(self.request.GET.get("before") or self.request.GET.get("after"))
+        if cursor is None:
+            direction = "next"
+
         trials: list[dict[str, Any]] = []
+        filter_choices: dict[str, list[tuple[Any, str]]] = {}
         load_error = False
         try:
-            payload = self._call_list_trials()
+            rows = self._call_list_trials_page(filters, cursor, direction)
+            filter_choices = self._load_filter_choices()
         except Exception:  # pragma: no cover - defensive; logging could be added later
-            payload = []
+            rows = []
             load_error = True
 
-        if isinstance(payload, list):
-            trials = [item for item in payload if isinstance(item, dict)]
-        elif isinstance(payload, dict):
-            trials = [payload]
+        has_more = len(rows) > self.page_size
+        if direction == "prev":
+            trials = rows[1:] if has_more else rows
+            has_previous, has_next = has_more, True
+        else:
+            trials = rows[: self.page_size]
+            has_previous, has_next = cursor is not None, has_more
 
-        headers: list[str] = []
-        if trials:
-            headers = list(trials[0].keys())
+        previous_url = next_url = None
+        if trials and has_previous:
+            previous_url = self._page_url(filters, before=_encode_cursor(trials[0]))
+        if trials and has_next:
+            next_url = self._page_url(filters, after=_encode_cursor(trials[-1]))
 
         context.update({
             "trials": trials,
-            "headers": headers,
+            "filters": filters,
+            "filter_choices": filter_choices,
+            "previous_url": previous_url,
+            "next_url": next_url,
             "load_error": load_error,
         })
         return context
 
-    def _call_list_trials(self) -> Any:
-        with connection.cursor() as cursor:
-            cursor.callproc("list_trials")
-            row = cursor.fetchone()
-        if not row:
-            return []
-        raw_payload = row[0]
-        if isinstance(raw_payload, str):
-            try:
-                return json.loads(raw_payload)
-            except json.JSONDecodeError:
-                return []
-        return raw_payload
+    def _call_list_trials_page(
+        self,
+        filters: dict[str, str],
+        cursor: tuple[datetime, int] | None,
+        direction: str,
+    ) -> list[dict[str, Any]]:
+        updated_at, ct_id = cursor if cursor else (None, None)
+        with connection.cursor() as db_cursor:
+            db_cursor.callproc(
+                "list_trials_page",
+                [
+                    updated_at,
+                    ct_id,
+                    direction,
+                    self.page_size,
+                    filters.get("status") or None,
+                    filters.get("phase") or None,
+                    filters.get("country") or None,
+                    filters.get("q") or None,
+                ],
+            )
+            columns = [column[0] for column in db_cursor.description]
+            return [dict(zip(columns, row)) for row in db_cursor.fetchall()]
+
+    def _load_filter_choices(self) -> dict[str, list[tuple[Any, str]]]:
+        return {
+            "statuses": list(get_vocabulary("vocabulary_recruitment_status").code_choices),
+            "phases": list(get_vocabulary("vocabulary_study_phase").code_choices),
+            "countries": list(get_vocabulary("vocabulary_country").code_choices),
+        }
+
+    def _page_url(self, filters: dict[str, str], **cursor: str) -> str:
+        params = {name: value for name, value in filters.items() if value}
+        params.update(cursor)
+        return f"{self.request.path}?{urlencode(params)}"
+
+
+class TrialSearchView(View):
+    """Return ranked full-text search results as JSON."""
+
+    page_size = 20
+
+    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        query = request.GET.get("q", "").strip()
+        try:
+            offset = max(int(request.GET.get("offset", 0)), 0)
+        except ValueError:
+            offset = 0
+        results: list[dict[str, Any]] = []
+        if query:
+            with connection.cursor() as cursor:
+                cursor.callproc("search_trials", [query, self.page_size, offset])
+                columns = [column[0] for column in cursor.description]
+                results = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        return JsonResponse({
+            "query": query,
+            "offset": offset,
+            "next_offset": offset + self.page_size if len(results) == self.page_size else None,
+            "results": results,
+        })
+
+
+class TrialAutocompleteView(View):
+    """Return capped prefix/trigram suggestions for the trial form widgets.
+
+    ``/trials/autocomplete/<source>/?q=...&limit=...`` answers with
+    ``{"query": ..., "results": [{"value", "label", "detail"}, ...]}``.
+    """
+
+    procedures = {
+        "institutions": "autocomplete_institutions",
+        "countries": "autocomplete_countries",
+        "conditions": "autocomplete_conditions",
+    }
+    default_limit = 10
+    max_limit = 20
+    max_query_length = 100
+
+    def get(self, request: HttpRequest, source: str, *args: Any, **kwargs: Any) -> HttpResponse:
+        procedure = self.procedures.get(source)
+        if procedure is None:
+            raise Http404(f"Unknown autocomplete source: {source}")
+        query = request.GET.get("q", "").strip()[: self.max_query_length]
+        try:
+            limit = int(request.GET.get("limit", self.default_limit))
+        except ValueError:
+            limit = self.default_limit
+        limit = min(max(limit, 1), self.max_limit)
+        results: list[dict[str, Any]] = []
+        if query:
+            with connection.cursor() as cursor:
+                cursor.callproc(procedure, [query, limit])
+                results = [
+                    {"value": value, "label": label, "detail": detail}
+                    for value, label, detail in cursor.fetchall()
+                ]
+        response = JsonResponse({"query": query, "results": results})
+        response["Cache-Control"] = "private, max-age=60"
+        return response
+
+
+class TrialExportView(View):
+    """Stream the public registry as NDJSON or CSV.
+
+    ``?format=ndjson|csv`` selects the format and ``?since=`` limits the
+    export to trials updated after the given ISO date or datetime.
+    ``?sections=locations,conditions`` trims NDJSON documents to those child
+    collections. The body is gzip-encoded while streaming when the client
+    accepts it.
+    """
+
+    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        export_format = request.GET.get("format", "ndjson")
+        if export_format not in EXPORT_FORMATS:
+            return HttpResponseBadRequest(f"Unsupported format: {export_format}")
+        try:
+            since = parse_since(request.GET.get("since"))
+            sections = parse_sections(request.GET.get("sections"))
+        except ValueError as exc:
+            return HttpResponseBadRequest(str(exc))
+        compress = accepts_gzip(request.headers.get("Accept-Encoding", ""))
+        response = StreamingHttpResponse(
+            iter_export(export_format, since=since, compress=compress, sections=sections),
+            content_type=CONTENT_TYPES[export_format],
+        )
+        response["Content-Disposition"] = f'attachment; filename="trials.{export_format}"'
+        response["Vary"] = "Accept-Encoding"
+        if compress:
+            response["Content-Encoding"] = "gzip"
+        return response
+
+
+class TrialDetailJsonView(View):
+    """Serve the public document of one trial, keyed by ``register_id``.
+
+    The validators are read first (see ``payloads.get_trial_version``), so a
+    matching ``If-None-Match`` or ``If-Modified-Since`` is answered with 304
+    before any payload is loaded. ``Cache-Control`` lets a CDN or reverse
+    proxy keep hot trials and revalidate them cheaply.
+    """
+
+    representation = "json"
+
+    def get(self, request: HttpRequest, register_id: str, *args: Any, **kwargs: Any) -> HttpResponse:
+        version = get_trial_version(register_id)
+        if version is None:
+            raise Http404(f"No public trial {register_id}")
+        etag = quote_etag(f"{version.etag}-{self.representation}")
+        last_modified = int(version.last_modified.timestamp())
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = self.render_trial(request, version)
+        response["ETag"] = etag
+        response["Last-Modified"] = http_date(last_modified)
+        patch_cache_control(
+            response,
+            public=True,
+            max_age=getattr(settings, "TRIAL_DETAIL_MAX_AGE", 60),
+            s_maxage=getattr(settings, "TRIAL_DETAIL_SHARED_MAX_AGE", 300),
+        )
+        return response
+
+    def render_trial(self, request: HttpRequest, version: TrialVersion) -> HttpResponse:
+        return HttpResponse(
+            get_trial_payload_text(version.ct_id), content_type="application/json"
+        )
+
+
+class TrialDetailView(TrialDetailJsonView):
+    """HTML rendering of the same document.
+
+    The template is standalone rather than extending the admin base, which
+    reads the session for its user tools and would make responses vary by
+    cookie.
+    """
+
+    representation = "html"
+
+    def render_trial(self, request: HttpRequest, version: TrialVersion) -> HttpResponse:
+        return render(
+            request, "admin/trial_detail.html", {"trial": get_trial_payload(version.ct_id)}
+        )
+
+
+def _encode_cursor(row: dict[str, Any]) -> str:
+    """Serialize the ``(updated_at, ct_id)`` keyset position of a listing row."""
+    raw = json.dumps([row["updated_at"].isoformat(), row["ct_id"]])
+    return urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(token: str | None) -> tuple[datetime, int] | None:
+    """Parse a cursor produced by :func:`_encode_cursor`, ignoring bad input."""
+    if not token:
+        return None
+    try:
+        updated_at, ct_id = json.loads(urlsafe_b64decode(token.encode("ascii")))
+        return datetime.fromisoformat(updated_at), int(ct_id)
+    except (ValueError, TypeError):
+        return None
 
 
 class TrialCreateView(LoginRequiredMixin, TemplateView):
@@ -106,11 +334,13 @@ class TrialCreateView(LoginRequiredMixin, TemplateView):
         if trial_valid and country_valid and intervention_valid and condition_valid and document_valid:
             try:
                 with transaction.atomic():
-                    trial_id = self._create_trial(trial_form.cleaned_data)
-                    self._save_countries(trial_id, country_formset.cleaned_data)
-                    self._save_interventions(trial_id, intervention_formset.cleaned_data)
-                    self._save_conditions(trial_id, condition_formset.cleaned_data)
-                    self._save_documents(trial_id, document_formset.cleaned_data)
+                    self._create_trial(
+                        trial_form.cleaned_data,
+                        countries=country_formset.cleaned_data,
+                        interventions=intervention_formset.cleaned_data,
+                        conditions=condition_formset.cleaned_data,
+                        documents=document_formset.cleaned_data,
+                    )
             except Exception:  # pragma: no cover - defensive; logging could be added later
                 context = self._build_context(
                     trial_form,
@@ -205,133 +435,87 @@ class TrialCreateView(LoginRequiredMixin, TemplateView):
         return TrialDocumentFormSet(data=data, prefix="documents")
 
     def _load_reference_data(self) -> dict[str, list[tuple[Any, str]]]:
-        reference_data: dict[str, list[tuple[Any, str]]] = {
-            "recruitment_statuses": [],
-            "study_phases": [],
-            "countries": [],
-            "intervention_types": [],
-            "condition_categories": [],
+        return {
+            "recruitment_statuses": list(get_vocabulary("vocabulary_recruitment_status").code_choices),
+            "study_phases": list(get_vocabulary("vocabulary_study_phase").code_choices),
+            "countries": list(get_vocabulary("vocabulary_country").id_choices),
+            "intervention_types": list(get_vocabulary("vocabulary_intervention_type").id_choices),
+            "condition_categories": list(get_vocabulary("vocabulary_condition_category").id_choices),
         }
-        with connection.cursor() as cursor:
-            cursor.execute(
-                "SELECT code, COALESCE(description, code)"
-                " FROM vocabulary_recruitment_status ORDER BY description, code"
-            )
-            reference_data["recruitment_statuses"] = [(row[0], row[1]) for row in cursor.fetchall()]
 
-            cursor.execute(
-                "SELECT code, COALESCE(description, code)"
-                " FROM vocabulary_study_phase ORDER BY description, code"
-            )
-            reference_data["study_phases"] = [(row[0], row[1]) for row in cursor.fetchall()]
-
-            cursor.execute(
-                "SELECT id, name FROM vocabulary_country ORDER BY name"
-            )
-            reference_data["countries"] = [(row[0], row[1]) for row in cursor.fetchall()]
-
-            cursor.execute(
-                "SELECT id, COALESCE(description, code)"
-                " FROM vocabulary_intervention_type ORDER BY description, code"
-            )
-            reference_data["intervention_types"] = [(row[0], row[1]) for row in cursor.fetchall()]
-
-            cursor.execute(
-                "SELECT id, COALESCE(name, code)"
-                " FROM vocabulary_condition_category ORDER BY name, code"
-            )
-            reference_data["condition_categories"] = [(row[0], row[1]) for row in cursor.fetchall()]
-
-        return reference_data
-
-    def _create_trial(self, cleaned_data: dict[str, Any]) -> int:
+    def _create_trial(
+        self,
+        cleaned_data: dict[str, Any],
+        *,
+        countries: list[dict[str, Any]],
+        interventions: list[dict[str, Any]],
+        conditions: list[dict[str, Any]],
+        documents: list[dict[str, Any]],
+    ) -> int:
+        recruitment_statuses = get_vocabulary("vocabulary_recruitment_status")
+        study_phases = get_vocabulary("vocabulary_study_phase")
+        document = {
+            "register_id": cleaned_data.get("public_identifier"),
+            "public_title": cleaned_data.get("official_title"),
+            "recruitment_status_id": recruitment_statuses.id_for_code(
+                cleaned_data.get("recruitment_status_code")
+            ),
+            "study_phase_id": study_phases.id_for_code(cleaned_data.get("study_phase_code")),
+            "brief_summary": cleaned_data.get("brief_summary") or None,
+            "primary_sponsor": {
+                "id": cleaned_data.get("lead_sponsor_id"),
+                "name": cleaned_data.get("lead_sponsor_name") or None,
+                "type": cleaned_data.get("lead_sponsor_type") or None,
+                "email": cleaned_data.get("lead_sponsor_email") or None,
+            },
+            "locations": [
+                {
+                    "country_id": int(form_data["country_id"]),
+                    "city": form_data.get("city") or None,
+                    "site_name": form_data.get("site_name") or None,
+                }
+                for form_data in _submitted(countries)
+                if form_data.get("country_id")
+            ],
+            "interventions": [
+                {
+                    "intervention_type_id": int(form_data["intervention_type_id"]),
+                    "name": form_data["name"],
+                    "description": form_data.get("description") or None,
+                }
+                for form_data in _submitted(interventions)
+                if form_data.get("intervention_type_id") and form_data.get("name")
+            ],
+            "conditions": [
+                {
+                    "condition_name": form_data["condition_name"],
+                    "condition_category_id": (
+                        int(form_data["condition_category_id"])
+                        if form_data.get("condition_category_id")
+                        else None
+                    ),
+                    "mesh_term": form_data.get("mesh_term") or None,
+                }
+                for form_data in _submitted(conditions)
+                if form_data.get("condition_name")
+            ],
+            "documents": [
+                {
+                    "document_type": form_data["document_type"],
+                    "url": form_data["document_url"],
+                    "is_confidential": bool(form_data.get("is_confidential")),
+                }
+                for form_data in _submitted(documents)
+                if form_data.get("document_type") and form_data.get("document_url")
+            ],
+        }
         with connection.cursor() as cursor:
-            cursor.callproc(
-                "create_trial",
-                [
-                    cleaned_data.get("public_identifier"),
-                    cleaned_data.get("official_title"),
-                    cleaned_data.get("recruitment_status_code"),
-                    cleaned_data.get("study_phase_code") or None,
-                    cleaned_data.get("brief_summary") or None,
-                    cleaned_data.get("lead_sponsor_name") or None,
-                    cleaned_data.get("lead_sponsor_type") or None,
-                    cleaned_data.get("lead_sponsor_email") or None,
-                    None,
-                ],
-            )
-            cursor.execute(
-                "SELECT trial_id FROM trials WHERE public_identifier = %s ORDER BY trial_id DESC LIMIT 1",
-                [cleaned_data.get("public_identifier")],
-            )
+            cursor.execute("SELECT create_trial_from_json(%s::jsonb)", [json.dumps(document)])
             row = cursor.fetchone()
-        if not row:
+        if not row or row[0] is None:
             raise ValueError("Failed to determine the created trial identifier")
         return int(row[0])
 
-    def _save_countries(self, trial_id: int, cleaned_data: list[dict[str, Any]]) -> None:
-        with connection.cursor() as cursor:
-            for form_data in cleaned_data:
-                if not form_data or form_data.get("DELETE"):
-                    continue
-                country_id = form_data.get("country_id")
-                if not country_id:
-                    continue
-                city = form_data.get("city") or None
-                site_name = form_data.get("site_name") or None
-                cursor.execute(
-                    "INSERT INTO trial_countries (trial_id, country_id, city, site_name)"
-                    " VALUES (%s, %s, %s, %s)",
-                    [trial_id, int(country_id), city, site_name],
-                )
-
-    def _save_interventions(self, trial_id: int, cleaned_data: list[dict[str, Any]]) -> None:
-        with connection.cursor() as cursor:
-            for form_data in cleaned_data:
-                if not form_data or form_data.get("DELETE"):
-                    continue
-                intervention_type_id = form_data.get("intervention_type_id")
-                name = form_data.get("name")
-                if not intervention_type_id or not name:
-                    continue
-                description = form_data.get("description") or None
-                cursor.execute(
-                    "INSERT INTO interventions (trial_id, intervention_type_id, name, description)"
-                    " VALUES (%s, %s, %s, %s)",
-                    [trial_id, int(intervention_type_id), name, description],
-                )
 
-    def _save_conditions(self, trial_id: int, cleaned_data: list[dict[str, Any]]) -> None:
-        with connection.cursor() as cursor:
-            for form_data in cleaned_data:
-                if not form_data or form_data.get("DELETE"):
-                    continue
-                condition_name = form_data.get("condition_name")
-                if not condition_name:
-                    continue
-                condition_category_id = form_data.get("condition_category_id") or None
-                cursor.execute(
-                    "INSERT INTO trial_conditions (trial_id, condition_category_id, condition_name)"
-                    " VALUES (%s, %s, %s)",
-                    [
-                        trial_id,
-                        int(condition_category_id) if condition_category_id else None,
-                        condition_name,
-                    ],
-                )
-
-    def _save_documents(self, trial_id: int, cleaned_data: list[dict[str, Any]]) -> None:
-        with connection.cursor() as cursor:
-            for form_data in cleaned_data:
-                if not form_data or form_data.get("DELETE"):
-                    continue
-                document_type = form_data.get("document_type")
-                document_url = form_data.get("document_url")
-                if not document_type or not document_url:
-                    continue
-                is_confidential = bool(form_data.get("is_confidential"))
-                cursor.execute(
-                    "INSERT INTO trial_documents (trial_id, document_type, document_url, is_confidential)"
-                    " VALUES (%s, %s, %s, %s)",
-                    [trial_id, document_type, document_url, is_confidential],
-                )
+def _submitted(cleaned_data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return [form_data for form_data in cleaned_data if form_data and not form_data.get("DELETE")]
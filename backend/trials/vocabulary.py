@@ -0,0 +1,210 @@
+"""Process-wide cache of the controlled vocabularies.
+
+All ``vocabulary_*`` code lists are loaded in a single query and kept in
+memory until a ``vocabulary_changed`` notification arrives (see
+``notify_vocabulary_change`` in ``database/sql/supporting_objects.sql``) or
+the TTL expires, whichever happens first. ``vocabulary_institution`` and
+``vocabulary_condition`` are not included: they are registries and
+terminologies loaded in bulk rather than code lists, and changes to them do
+not invalidate the cache.
+"""
+
+from __future__ import annotations
+
+import logging
+import select
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional
+
+import psycopg2
+from django.conf import settings
+from django.db import connection, connections
+
+LOGGER = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = "vocabulary_changed"
+
+VOCABULARY_TABLES = (
+    "vocabulary_country",
+    "vocabulary_recruitment_status",
+    "vocabulary_study_phase",
+    "vocabulary_condition_category",
+    "vocabulary_intervention_category",
+    "vocabulary_intervention_type",
+    "vocabulary_intervention_subtype",
+    "vocabulary_intervention",
+    "vocabulary_institution_type",
+    "vocabulary_institution_scope",
+    "vocabulary_institution_nature",
+    "vocabulary_secondary_identify_type",
+)
+
+VOCABULARY_QUERY = """
+    SELECT 'vocabulary_country', id, iso_alpha2, name FROM vocabulary_country
+    UNION ALL
+    SELECT 'vocabulary_recruitment_status', id, code, COALESCE(description, code)
+    FROM vocabulary_recruitment_status
+    UNION ALL
+    SELECT 'vocabulary_study_phase', id, code, COALESCE(description, code)
+    FROM vocabulary_study_phase
+    UNION ALL
+    SELECT 'vocabulary_condition_category', id, code, COALESCE(name, code)
+    FROM vocabulary_condition_category
+    UNION ALL
+    SELECT 'vocabulary_intervention_category', id, code, COALESCE(name, code)
+    FROM vocabulary_intervention_category
+    UNION ALL
+    SELECT 'vocabulary_intervention_type', id, code, COALESCE(description, code)
+    FROM vocabulary_intervention_type
+    UNION ALL
+    SELECT 'vocabulary_intervention_subtype', s.id, t.code || ':' || s.code, s.name
+    FROM vocabulary_intervention_subtype AS s
+    JOIN vocabulary_intervention_type AS t ON t.id = s.intervention_type_id
+    UNION ALL
+    SELECT 'vocabulary_intervention', id, code, name FROM vocabulary_intervention
+    UNION ALL
+    SELECT 'vocabulary_institution_type', id, code, name FROM vocabulary_institution_type
+    UNION ALL
+    SELECT 'vocabulary_institution_scope', id, code, name FROM vocabulary_institution_scope
+    UNION ALL
+    SELECT 'vocabulary_institution_nature', id, code, name FROM vocabulary_institution_nature
+    UNION ALL
+    SELECT 'vocabulary_secondary_identify_type', id, code, name
+    FROM vocabulary_secondary_identify_type
+"""
+
+
+@dataclass(frozen=True)
+class VocabularyTable:
+    """Lookup maps and prebuilt form choices for one vocabulary table."""
+
+    name: str
+    code_to_id: Mapping[str, int]
+    id_to_code: Mapping[int, Optional[str]]
+    id_to_label: Mapping[int, str]
+    code_choices: tuple[tuple[str, str], ...]
+    id_choices: tuple[tuple[str, str], ...]
+
+    @classmethod
+    def from_rows(cls, name: str, rows: list[tuple[int, Optional[str], str]]) -> "VocabularyTable":
+        ordered = sorted(rows, key=lambda row: (row[2], row[1] or ""))
+        return cls(
+            name=name,
+            code_to_id={code: row_id for row_id, code, _ in ordered if code is not None},
+            id_to_code={row_id: code for row_id, code, _ in ordered},
+            id_to_label={row_id: label for row_id, _, label in ordered},
+            code_choices=tuple((code, label) for _, code, label in ordered if code is not None),
+            id_choices=tuple((str(row_id), label) for row_id, _, label in ordered),
+        )
+
+    def id_for_code(self, code: Optional[str]) -> Optional[int]:
+        if not code:
+            return None
+        try:
+            return self.code_to_id[code]
+        except KeyError:
+            raise ValueError(f"Unknown {self.name} code: {code}") from None
+
+
+class VocabularyCache:
+    """Thread-safe holder of the loaded vocabularies."""
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._tables: dict[str, VocabularyTable] | None = None
+        self._loaded_at = 0.0
+        self._listener: _VocabularyListener | None = None
+
+    def get(self, name: str) -> VocabularyTable:
+        tables = self._tables
+        if tables is None or time.monotonic() - self._loaded_at > self.ttl:
+            tables = self._reload()
+        try:
+            return tables[name]
+        except KeyError:
+            raise KeyError(f"Vocabulary {name} is not cached") from None
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._tables = None
+
+    def _reload(self) -> dict[str, VocabularyTable]:
+        with self._lock:
+            if self._tables is not None and time.monotonic() - self._loaded_at <= self.ttl:
+                return self._tables
+            self._start_listener()
+            rows: dict[str, list[tuple[int, Optional[str], str]]] = {
+                name: [] for name in VOCABULARY_TABLES
+            }
+            with connection.cursor() as cursor:
+                cursor.execute(VOCABULARY_QUERY)
+                for table, row_id, code, label in cursor.fetchall():
+                    rows[table].append((int(row_id), code, label))
+            tables = {
+                name: VocabularyTable.from_rows(name, table_rows)
+                for name, table_rows in rows.items()
+            }
+            self._tables = tables
+            self._loaded_at = time.monotonic()
+            LOGGER.debug("Loaded %d vocabulary tables", len(tables))
+            return tables
+
+    def _start_listener(self) -> None:
+        if self._listener is not None or not getattr(settings, "VOCABULARY_CACHE_LISTEN", True):
+            return
+        params = dict(connections["default"].get_connection_params())
+        params.pop("cursor_factory", None)
+        self._listener = _VocabularyListener(self, params)
+        self._listener.start()
+
+
+class _VocabularyListener(threading.Thread):
+    """Background LISTEN loop that invalidates the cache on NOTIFY."""
+
+    poll_interval = 60.0
+    retry_delay = 30.0
+
+    def __init__(self, cache: VocabularyCache, params: dict[str, Any]) -> None:
+        super().__init__(name="vocabulary-listener", daemon=True)
+        self.cache = cache
+        self.params = params
+
+    def run(self) -> None:  # pragma: no cover - requires a live database
+        while True:
+            try:
+                self._listen()
+            except psycopg2.Error as exc:
+                LOGGER.warning("Vocabulary listener disconnected: %s", exc)
+            time.sleep(self.retry_delay)
+
+    def _listen(self) -> None:  # pragma: no cover - requires a live database
+        pg_conn = psycopg2.connect(**self.params)
+        try:
+            pg_conn.autocommit = True
+            with pg_conn.cursor() as cursor:
+                cursor.execute(f"LISTEN {NOTIFY_CHANNEL}")
+            # Changes may have been missed while disconnected.
+            self.cache.invalidate()
+            while True:
+                if select.select([pg_conn], [], [], self.poll_interval) == ([], [], []):
+                    continue
+                pg_conn.poll()
+                if pg_conn.notifies:
+                    tables = {notify.payload for notify in pg_conn.notifies}
+                    pg_conn.notifies.clear()
+                    LOGGER.debug("Vocabulary change notified for %s", ", ".join(sorted(tables)))
+                    if tables.intersection(VOCABULARY_TABLES):
+                        self.cache.invalidate()
+        finally:
+            pg_conn.close()
+
+
+vocabulary_cache = VocabularyCache(ttl=getattr(settings, "VOCABULARY_CACHE_TTL", 300))
+
+
+def get_vocabulary(name: str) -> VocabularyTable:
+    """Return the cached vocabulary table ``name`` (e.g. ``vocabulary_country``)."""
+    return vocabulary_cache.get(name)
@@ -0,0 +1,90 @@
+"""Form widgets backed by the ``trial-autocomplete`` JSON endpoints.
+
+The markup only carries ``data-autocomplete*`` attributes; the script in
+``admin/trial_form.html`` fetches suggestions while the user types and
+fills a ``<datalist>`` with them. Choosing a suggestion copies its value into
+the hidden input named by ``data-autocomplete-target``.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from django import forms
+from django.urls import reverse
+from django.utils.html import format_html
+
+
+def _autocomplete_url(source: str) -> str:
+    return reverse("trial-autocomplete", args=[source])
+
+
+class AutocompleteTextInput(forms.TextInput):
+    """Free-text input with suggestions.
+
+    ``value_field`` names a sibling field (a hidden input in the same form)
+    that receives the value of the chosen suggestion, e.g. the institution id
+    for a sponsor name. Editing the text clears it again.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        *,
+        value_field: Optional[str] = None,
+        attrs: Optional[dict[str, Any]] = None,
+    ) -> None:
+        super().__init__(attrs)
+        self.source = source
+        self.value_field = value_field
+
+    def get_context(self, name: str, value: Any, attrs: Optional[dict[str, Any]]) -> dict[str, Any]:
+        context = super().get_context(name, value, attrs)
+        widget_attrs = context["widget"]["attrs"]
+        widget_attrs.setdefault("autocomplete", "off")
+        widget_attrs["data-autocomplete"] = _autocomplete_url(self.source)
+        if self.value_field:
+            prefix, _, _ = name.rpartition("-")
+            widget_attrs["data-autocomplete-target"] = (
+                f"{prefix}-{self.value_field}" if prefix else self.value_field
+            )
+        return context
+
+
+class AutocompleteSelect(forms.Widget):
+    """Replacement for a ``<select>`` over a large vocabulary.
+
+    The selected id travels in a hidden input under the field name; the
+    visible, unnamed text box shows its label, looked up in ``choices``
+    (set by ``ChoiceField`` as usual) so nothing but the current value is
+    rendered.
+    """
+
+    def __init__(self, source: str, attrs: Optional[dict[str, Any]] = None) -> None:
+        super().__init__(attrs)
+        self.source = source
+        self.choices: Any = ()
+
+    def render(
+        self,
+        name: str,
+        value: Any,
+        attrs: Optional[dict[str, Any]] = None,
+        renderer: Any = None,
+    ) -> str:
+        final_attrs = self.build_attrs(self.attrs, attrs)
+        input_id = final_attrs.get("id") or f"id_{name}"
+        value = "" if value is None else str(value)
+        label = next((text for key, text in self.choices if str(key) == value and value), "")
+        return format_html(
+            '<input type="hidden" name="{}" id="{}_value" value="{}">'
+            '<input type="text" id="{}" value="{}" autocomplete="off"'
+            ' data-autocomplete="{}" data-autocomplete-target="{}">',
+            name,
+            input_id,
+            value,
+            input_id,
+            label,
+            _autocomplete_url(self.source),
+            name,
+        )
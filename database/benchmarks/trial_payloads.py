@@ -0,0 +1,123 @@
+"""Benchmark summary against full payloads from ``get_full_trials_json_auto_multilang``.
+
+Usage::
+
+    python -m database.benchmarks.trial_payloads
+    python -m database.benchmarks.trial_payloads --page-size 100 --sections locations,conditions
+    python -m database.benchmarks.trial_payloads --explain
+
+Connects with the same environment variables as ``database.bootstrap`` and
+only reads. Each projection is timed for one listing page (the most recently
+updated public trials) and for the whole public registry; the best of
+``--repeat`` runs is reported with the size of the JSON produced.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from typing import List, Optional, Sequence
+
+import psycopg2
+
+from database.bootstrap import build_dsn
+
+PAYLOAD_QUERY = """
+    SELECT count(*), COALESCE(sum(octet_length(payload::text)), 0)
+    FROM get_full_trials_json_auto_multilang(%s::bigint[], NULL, TRUE, %s::text[])
+"""
+
+PAGE_IDS_QUERY = """
+    SELECT array_agg(id)
+    FROM (
+        SELECT id
+        FROM ct
+        WHERE is_public
+        ORDER BY updated_at DESC, id DESC
+        LIMIT %s
+    ) AS page
+"""
+
+
+def _time(
+    cursor,
+    label: str,
+    ct_ids: Optional[List[int]],
+    sections: Optional[Sequence[str]],
+    repeat: int,
+) -> float:
+    best = float("inf")
+    rows = size = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        cursor.execute(PAYLOAD_QUERY, [ct_ids, list(sections) if sections is not None else None])
+        rows, size = cursor.fetchone()
+        best = min(best, time.perf_counter() - started)
+    print(f"{label:<28} {best * 1000:9.1f} ms  {rows:7d} trials  {size / 1e6:8.2f} MB")
+    return best
+
+
+def _explain(cursor, ct_ids: Optional[List[int]], sections: Sequence[str]) -> None:
+    cursor.execute(
+        "EXPLAIN (ANALYZE, COSTS OFF, TIMING OFF) " + PAYLOAD_QUERY, [ct_ids, list(sections)]
+    )
+    for (line,) in cursor.fetchall():
+        print(f"  {line}")
+
+
+def _compare(
+    cursor,
+    scope: str,
+    ct_ids: Optional[List[int]],
+    sections: Sequence[str],
+    repeat: int,
+) -> None:
+    print(f"{scope}:")
+    full = _time(cursor, "  full payload", ct_ids, None, repeat)
+    summary = _time(cursor, f"  sections={','.join(sections) or '-'}", ct_ids, sections, repeat)
+    print(f"  speed-up: {full / summary:.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--page-size", type=int, default=25, help="Trials in the page scenario.")
+    parser.add_argument(
+        "--sections",
+        default="locations",
+        help="Comma-separated sections of the summary projection (default: locations).",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per projection; best is kept.")
+    parser.add_argument(
+        "--skip-registry", action="store_true", help="Only time the page scenario."
+    )
+    parser.add_argument(
+        "--explain",
+        action="store_true",
+        help="Print the summary plan for the page (skipped sections show a false one-time filter).",
+    )
+    args = parser.parse_args()
+    sections = [name.strip() for name in args.sections.split(",") if name.strip()]
+
+    connection = psycopg2.connect(build_dsn())
+    try:
+        connection.set_session(readonly=True)
+        with connection.cursor() as cursor:
+            cursor.execute(PAGE_IDS_QUERY, [args.page_size])
+            page_ids = cursor.fetchone()[0] or []
+            if not page_ids:
+                print("No public trials to benchmark.")
+                return
+            # Warm the cache so the first projection timed is not penalised.
+            cursor.execute(PAYLOAD_QUERY, [page_ids, None])
+            _compare(cursor, f"Page of {len(page_ids)} trials", page_ids, sections, args.repeat)
+            if not args.skip_registry:
+                _compare(cursor, "Public registry", None, sections, args.repeat)
+            if args.explain:
+                print("Summary plan (page):")
+                _explain(cursor, page_ids, sections)
+    finally:
+        connection.rollback()
+        connection.close()
+
+
+if __name__ == "__main__":
+    main()
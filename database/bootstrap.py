@@ -15,25 +15,34 @@ Example usage::
     export DB_PASSWORD=secret
     python -m database.bootstrap
 
-The script consults ``database/sql/tables.json`` to determine which schema
-files require execution. Entries flagged with ``"updated": false`` trigger the
-corresponding SQL file, after which the metadata is updated automatically. Seed
-data is loaded after the schema and supporting objects are created.
+The script applies the files listed in ``database/sql/tables.json`` and
+``database/stored_procedures/procedures.json``. Every statement is hashed and
+the hashes already applied are kept in the ``schema_deployment`` table, so a
+rerun executes only statements that are new or were edited (``--force``
+re-applies everything). Session settings and ``DO`` blocks always run. Seed data is loaded after the schema and supporting
+objects are created.
 """
 
 from __future__ import annotations
 
+import argparse
+import hashlib
 import os
 import re
+import threading
+import time
 from collections import OrderedDict
-from datetime import date
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, List, Optional, Set, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple, Union
 
 import psycopg2
+import psycopg2.extras
 
-from database.sql.catalog import load_table_catalog, save_table_catalog
-from database.stored_procedures.config import load_config, save_config
+from database.load_vocabulary import load_vocabulary_dir
+from database.sql.catalog import load_table_catalog
+from database.stored_procedures.config import load_config
 
 BASE_DIR = Path(__file__).resolve().parent
 SQL_DIR = BASE_DIR / "sql"
@@ -41,6 +50,8 @@ STORED_PROCEDURES_DIR = BASE_DIR / "stored_procedures"
 
 SUPPORTING_FILES = [
     "supporting_objects.sql",
+    "trial_search_objects.sql",
+    "autocomplete_objects.sql",
     "vocabulary_seed.sql",
 ]
 
@@ -98,59 +109,147 @@ CREATE_OBJECT_RE = re.compile(
 )
 
 
-def _split_statements(sql: str) -> List[str]:
-    statements: List[str] = []
-    current: List[str] = []
-    in_single = False
-    in_double = False
-    dollar_tag: Optional[str] = None
-    i = 0
-    while i < len(sql):
-        ch = sql[i]
-        if dollar_tag:
-            if sql.startswith(dollar_tag, i):
-                current.append(dollar_tag)
-                i += len(dollar_tag)
-                dollar_tag = None
-                continue
-            current.append(ch)
-            i += 1
-            continue
+# Tokens that can hide a ``;`` or end a statement. Everything between them is
+# plain SQL and is skipped by ``search`` without being examined in Python.
+# As in PostgreSQL, a ``$`` that follows an identifier character (``a$b$c``)
+# never opens a dollar quote.
+_STATEMENT_TOKEN_RE = re.compile(
+    r"""
+      (?P<line_comment>--[^\n]*)
+    | (?P<block_comment>/\*)
+    | (?P<dollar>(?<![\w$])\$(?:[A-Za-z_\u0080-\uffff][\w\u0080-\uffff]*)?\$)
+    | (?P<escape_string>(?<![\w$])[Ee]'[^'\\]*(?:(?:\\.|'')[^'\\]*)*(?:'|\Z))
+    | (?P<string>'[^']*(?:''[^']*)*(?:'|\Z))
+    | (?P<identifier>"[^"]*(?:""[^"]*)*(?:"|\Z))
+    | (?P<semicolon>;)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+# Statement text up to the next comment, dollar quote or ``;``, strings
+# included, consumed in a single match.
+_PLAIN_RUN_RE = re.compile(
+    r"""
+    (?:
+        [^;'"$/\-Ee]+
+      | (?<![\w$])[Ee]'[^'\\]*(?:(?:\\.|'')[^'\\]*)*'
+      | [Ee](?!')
+      | (?<=[\w$])[Ee]
+      | '[^']*(?:''[^']*)*'
+      | "[^"]*(?:""[^"]*)*"
+      | -(?!-)
+      | /(?!\*)
+      | (?<=[\w$])\$
+      | \$(?![A-Za-z_\u0080-\uffff][\w\u0080-\uffff]*\$|\$)
+    )*
+    """,
+    re.VERBOSE,
+)
+_BLOCK_COMMENT_RE = re.compile(r"/\*|\*/")
+_NON_SPACE_RE = re.compile(r"\S")
+# Longest token prefix that may be cut by a chunk boundary (``$tag$``, ``E'``).
+_TOKEN_LOOKAHEAD = 64
+STATEMENT_CHUNK_SIZE = 1 << 20
+
+
+def _block_comment_end(text: str, pos: int) -> Optional[int]:
+    """Return the offset after the ``*/`` closing a (possibly nested) comment."""
+    depth = 1
+    for match in _BLOCK_COMMENT_RE.finditer(text, pos):
+        depth += 1 if match.group() == "/*" else -1
+        if depth == 0:
+            return match.end()
+    return None
 
-        if ch == "'" and not in_double:
-            in_single = not in_single
-            current.append(ch)
-            i += 1
+
+def iter_statements(
+    source: Union[str, TextIO], chunk_size: int = STATEMENT_CHUNK_SIZE
+) -> Iterator[str]:
+    """Yield the statements of ``source`` (a string or text stream) one at a time.
+
+    The text is scanned with a regex for the tokens that matter: ``--`` and
+    nested ``/* */`` comments, quoted identifiers, standard and ``E''``
+    strings, dollar quotes and ``;``. Streams are read ``chunk_size``
+    characters at a time and only the unfinished statement is kept in
+    memory. Leading comments are dropped; comments inside a statement are
+    kept. Statements consisting only of comments are skipped.
+    """
+    if isinstance(source, str):
+        chunks: Iterator[str] = iter((source,))
+    else:
+        chunks = iter(lambda: source.read(chunk_size), "")
+    buffer = ""
+    pos = 0
+    start: Optional[int] = None
+    eof = False
+
+    def read_more() -> None:
+        nonlocal buffer, pos, start, eof
+        chunk = next(chunks, "")
+        if not chunk:
+            eof = True
+            return
+        keep = start if start is not None else pos
+        buffer = buffer[keep:] + chunk
+        pos -= keep
+        if start is not None:
+            start = 0
+
+    def mark_code(end: int) -> None:
+        nonlocal start
+        if start is None:
+            found = _NON_SPACE_RE.search(buffer, pos, end)
+            if found:
+                start = found.start()
+
+    while True:
+        run_end = _PLAIN_RUN_RE.match(buffer, pos).end()
+        if not eof and run_end > len(buffer) - _TOKEN_LOOKAHEAD:
+            read_more()
             continue
-        if ch == '"' and not in_single:
-            in_double = not in_double
-            current.append(ch)
-            i += 1
+        if run_end > pos:
+            mark_code(run_end)
+            pos = run_end
+        match = _STATEMENT_TOKEN_RE.search(buffer, pos)
+        if not eof and (
+            match is None
+            or match.start() > len(buffer) - _TOKEN_LOOKAHEAD
+            or (match.end() == len(buffer) and match.lastgroup != "semicolon")
+        ):
+            read_more()
             continue
-        if ch == "$" and not in_single and not in_double:
-            end = i + 1
-            while end < len(sql) and (sql[end].isalnum() or sql[end] == "_"):
-                end += 1
-            if end < len(sql) and sql[end] == "$":
-                tag = sql[i : end + 1]
-                dollar_tag = tag
-                current.append(tag)
-                i = end + 1
+        if match is None:
+            break
+        kind = match.lastgroup
+        mark_code(match.start())
+        if kind == "line_comment":
+            pos = match.end()
+        elif kind == "block_comment":
+            end = _block_comment_end(buffer, match.end())
+            if end is None and not eof:
+                read_more()
                 continue
-        if ch == ";" and not in_single and not in_double:
-            statement = "".join(current).strip()
-            if statement:
-                statements.append(statement)
-            current = []
-            i += 1
-            continue
-        current.append(ch)
-        i += 1
-
-    tail = "".join(current).strip()
-    if tail:
-        statements.append(tail)
-    return statements
+            pos = len(buffer) if end is None else end
+        elif kind == "dollar":
+            tag = match.group()
+            close = buffer.find(tag, match.end())
+            if close < 0 and not eof:
+                read_more()
+                continue
+            mark_code(match.end())
+            pos = len(buffer) if close < 0 else close + len(tag)
+        elif kind == "semicolon":
+            if start is not None:
+                yield buffer[start : match.start()].rstrip()
+            start = None
+            pos = match.end()
+        else:
+            mark_code(match.end())
+            pos = match.end()
+    mark_code(len(buffer))
+    if start is not None:
+        tail = buffer[start:].rstrip()
+        if tail:
+            yield tail
 
 
 def _normalize_sql(sql: str) -> str:
@@ -174,125 +273,240 @@ def _schema_and_name(identifier: str) -> Tuple[Optional[str], str]:
     return None, identifier.strip('"')
 
 
-_HAS_PG_GET_TABLEDEF: Optional[bool] = None
-
+# Canonical spellings for type aliases accepted in function signatures, so
+# file signatures match ``oidvectortypes`` output from the catalog.
+_TYPE_ALIASES = {
+    "int": "integer",
+    "int4": "integer",
+    "int2": "smallint",
+    "int8": "bigint",
+    "serial": "integer",
+    "bigserial": "bigint",
+    "bool": "boolean",
+    "float4": "real",
+    "float8": "double precision",
+    "float": "double precision",
+    "decimal": "numeric",
+    "varchar": "character varying",
+    "char": "character",
+    "timestamp": "timestamp without time zone",
+    "timestamptz": "timestamp with time zone",
+    "time": "time without time zone",
+    "timetz": "time with time zone",
+}
+
+RELATIONS_QUERY = """
+SELECT
+    CASE c.relkind WHEN 'v' THEN 'VIEW' WHEN 'm' THEN 'MATERIALIZED VIEW' ELSE 'TABLE' END,
+    n.nspname,
+    c.relname,
+    CASE c.relkind
+        WHEN 'v' THEN 'CREATE VIEW ' || c.oid::regclass || ' AS ' || pg_get_viewdef(c.oid, true)
+        WHEN 'm' THEN 'CREATE MATERIALIZED VIEW ' || c.oid::regclass || ' AS '
+            || pg_get_viewdef(c.oid, true)
+        ELSE {tabledef}
+    END,
+    c.reltuples
+FROM pg_class AS c
+JOIN pg_namespace AS n ON n.oid = c.relnamespace
+WHERE n.nspname = ANY(current_schemas(false))
+  AND c.relkind IN ('r', 'p', 'v', 'm')
+"""
 
-def _ensure_pg_get_tabledef(cursor) -> bool:
-    global _HAS_PG_GET_TABLEDEF
-    if _HAS_PG_GET_TABLEDEF is not None:
-        return _HAS_PG_GET_TABLEDEF
-    cursor.execute(
-        "SELECT EXISTS ("
-        "    SELECT 1"
-        "    FROM pg_proc p"
-        "    JOIN pg_namespace n ON n.oid = p.pronamespace"
-        "    WHERE n.nspname = 'pg_catalog'"
-        "      AND p.proname = 'pg_get_tabledef'"
-        ")"
-    )
-    _HAS_PG_GET_TABLEDEF = bool(cursor.fetchone()[0])
-    return _HAS_PG_GET_TABLEDEF
+ROUTINES_QUERY = """
+SELECT
+    CASE p.prokind WHEN 'p' THEN 'PROCEDURE' ELSE 'FUNCTION' END,
+    n.nspname,
+    p.proname,
+    oidvectortypes(p.proargtypes),
+    pg_get_functiondef(p.oid)
+FROM pg_proc AS p
+JOIN pg_namespace AS n ON n.oid = p.pronamespace
+WHERE n.nspname = ANY(current_schemas(false))
+  AND p.prokind IN ('f', 'p')
+"""
 
 
-def _existing_ddl(cursor, object_type: str, identifier: str, args: Optional[str]) -> Optional[str]:
-    object_type = object_type.upper()
-    if object_type in {"TABLE", "MATERIALIZED VIEW", "VIEW"}:
-        cursor.execute("SELECT to_regclass(%s)", (identifier,))
-        result = cursor.fetchone()
-        if not result or result[0] is None:
-            return None
-        regclass = str(result[0])
-        if object_type == "TABLE":
-            if not _ensure_pg_get_tabledef(cursor):
+class CatalogSnapshot:
+    """Definitions of the tables, views and routines visible on the search path.
+
+    Loaded with a few bulk catalog queries and indexed by
+    ``(type, name, args)`` so every ``CREATE`` statement is compared locally
+    instead of costing one or more round trips. Statements applied during
+    the run are recorded so the snapshot stays current.
+    """
+
+    def __init__(self, search_path: List[str]) -> None:
+        self.search_path = search_path
+        self.definitions: Dict[Tuple[str, str, Optional[str]], Dict[str, Optional[str]]] = {}
+        self.row_estimates: Dict[Tuple[str, str], float] = {}
+
+    @classmethod
+    def load(cls, cursor) -> "CatalogSnapshot":
+        cursor.execute(
+            "SELECT current_schemas(false), EXISTS ("
+            "    SELECT 1"
+            "    FROM pg_proc p"
+            "    JOIN pg_namespace n ON n.oid = p.pronamespace"
+            "    WHERE n.nspname = 'pg_catalog'"
+            "      AND p.proname = 'pg_get_tabledef'"
+            ")"
+        )
+        search_path, has_tabledef = cursor.fetchone()
+        snapshot = cls(list(search_path))
+        # Without pg_get_tabledef tables are known to exist but their
+        # definition cannot be compared, so they are always re-applied.
+        tabledef = "pg_get_tabledef(c.oid)" if has_tabledef else "NULL::text"
+        cursor.execute(RELATIONS_QUERY.format(tabledef=tabledef))
+        for object_type, schema, name, definition, reltuples in cursor.fetchall():
+            snapshot._add(object_type, schema, name, None, definition)
+            snapshot.row_estimates[(schema, name)] = float(reltuples)
+        cursor.execute(ROUTINES_QUERY)
+        for object_type, schema, name, args, definition in cursor.fetchall():
+            snapshot._add(object_type, schema, name, _canonical_args(args), definition)
+        return snapshot
+
+    def _add(
+        self,
+        object_type: str,
+        schema: str,
+        name: str,
+        args: Optional[str],
+        definition: Optional[str],
+    ) -> None:
+        self.definitions.setdefault((object_type, name, args), {})[schema] = definition
+
+    def _key(
+        self, object_type: str, identifier: str, args: Optional[str]
+    ) -> Tuple[Optional[str], Tuple[str, str, Optional[str]]]:
+        object_type = object_type.upper()
+        schema, name = _schema_and_name(identifier)
+        if not identifier.strip().startswith('"'):
+            name = name.lower()
+        if object_type in {"FUNCTION", "PROCEDURE"}:
+            normalized = _normalize_function_args(args) if args is not None else None
+            return schema, (object_type, name, normalized)
+        return schema, (object_type, name, None)
+
+    def definition(self, object_type: str, identifier: str, args: Optional[str]) -> Optional[str]:
+        """Return the current definition, resolving unqualified names via the search path."""
+        schema, key = self._key(object_type, identifier, args)
+        if key[0] in {"FUNCTION", "PROCEDURE"} and key[2] is None:
+            # Unparseable signature: only an unambiguous name can be compared.
+            matches = [
+                (schemas, candidate)
+                for candidate, schemas in self.definitions.items()
+                if candidate[:2] == key[:2]
+            ]
+            if len(matches) != 1 or len(matches[0][0]) != 1:
                 return None
-            cursor.execute("SELECT pg_get_tabledef(%s::regclass)", (regclass,))
-        elif object_type == "MATERIALIZED VIEW":
-            cursor.execute(
-                "SELECT 'CREATE MATERIALIZED VIEW ' || %s::regclass || ' AS ' || pg_get_viewdef(%s::regclass, true)",
-                (regclass, regclass),
-            )
-        else:
-            cursor.execute(
-                "SELECT 'CREATE VIEW ' || %s::regclass || ' AS ' || pg_get_viewdef(%s::regclass, true)",
-                (regclass, regclass),
-            )
-        row = cursor.fetchone()
-        return row[0] if row else None
+            (found_schema, definition), = matches[0][0].items()
+            return definition if schema in (None, found_schema) else None
+        by_schema = self.definitions.get(key, {})
+        if schema:
+            return by_schema.get(schema)
+        for candidate in self.search_path:
+            if candidate in by_schema:
+                return by_schema[candidate]
+        return None
 
-    if object_type in {"FUNCTION", "PROCEDURE"}:
+    def estimated_rows(self, identifier: str) -> float:
+        """Planner row estimate for an existing table (0 when unknown or never analysed)."""
         schema, name = _schema_and_name(identifier)
-        prokind = "f" if object_type == "FUNCTION" else "p"
-        params = [name]
-        query = [
-            "SELECT pg_get_functiondef(p.oid)",
-            "FROM pg_proc p",
-            "JOIN pg_namespace n ON n.oid = p.pronamespace",
-            "WHERE p.proname = %s",
-            "AND p.prokind = %s",
-        ]
-        params.append(prokind)
-        if schema:
-            query.append("AND n.nspname = %s")
-            params.append(schema)
-        if args is not None:
-            normalized_args = _normalize_function_args(args)
-            if normalized_args is not None:
-                query.append("AND pg_get_function_identity_arguments(p.oid) = %s")
-                params.append(normalized_args)
-        query.append("LIMIT 2")
-        cursor.execute("\n".join(query), params)
-        rows = cursor.fetchall()
-        if len(rows) != 1:
-            return None
-        return rows[0][0]
+        if not identifier.strip().startswith('"'):
+            name = name.lower()
+        for candidate in [schema] if schema else self.search_path:
+            if (candidate, name) in self.row_estimates:
+                return max(self.row_estimates[(candidate, name)], 0.0)
+        return 0.0
 
-    return None
+    def record(
+        self, object_type: str, identifier: str, args: Optional[str], statement: str
+    ) -> None:
+        """Remember ``statement`` as the definition just applied to the database."""
+        schema, key = self._key(object_type, identifier, args)
+        target = schema or (self.search_path[0] if self.search_path else "public")
+        self.definitions.setdefault(key, {})[target] = statement
+
+
+def _canonical_type(type_name: str) -> str:
+    type_name = re.sub(r"\s+", " ", type_name.strip().lower())
+    is_array = type_name.endswith("[]")
+    base = re.sub(r"\s*\(.*?\)", "", type_name.rstrip("[] "))
+    base = _TYPE_ALIASES.get(base, base)
+    return base + ("[]" if is_array else "")
+
+
+def _canonical_args(args: str) -> str:
+    return ", ".join(_canonical_type(part) for part in args.split(",") if part.strip())
 
 
 def _normalize_function_args(args: str) -> Optional[str]:
+    """Return the identity types of a signature (e.g. ``"bigint, text[]"``).
+
+    Parameter names, modes, defaults and type modifiers are dropped, OUT
+    parameters are left out (they are not part of the identity) and aliases
+    are canonicalised to match the catalog spelling.
+    """
     if args is None:
         return None
-    args = args.strip()
+    args = re.sub(r"\([^()]*\)", "", args).strip()
     if not args:
         return ""
     parts = []
     for raw in args.split(","):
-        token = raw.strip()
-        if not token:
-            continue
-        token = token.split("=")[0].strip()
+        token = re.split(r"\s+DEFAULT\s+|=", raw.strip(), maxsplit=1, flags=re.IGNORECASE)[0]
         words = token.split()
-        cleaned: List[str] = []
-        for word in words:
-            upper = word.upper()
-            if upper in {"IN", "OUT", "INOUT", "VARIADIC"}:
-                continue
-            cleaned.append(word)
+        if words and words[0].upper() == "OUT":
+            continue
+        cleaned = [word for word in words if word.upper() not in {"IN", "INOUT", "VARIADIC"}]
         if not cleaned:
             return None
-        # assume last elements describe the type possibly multi-word
-        # drop parameter name if more than one token
-        if len(cleaned) > 1:
-            type_tokens = cleaned[1:]
-        else:
-            type_tokens = cleaned
-        parts.append(" ".join(type_tokens))
+        # A leading word that is not a known type start is the parameter name.
+        type_tokens = cleaned[1:] if len(cleaned) > 1 and not _starts_type(cleaned) else cleaned
+        parts.append(_canonical_type(" ".join(type_tokens)))
     return ", ".join(parts)
 
 
+_MULTIWORD_TYPE_STARTS = {"double", "character", "timestamp", "time", "bit"}
+
+
+def _starts_type(words: List[str]) -> bool:
+    """Whether ``words`` is an unnamed multi-word type such as ``double precision``."""
+    return words[0].lower() in _MULTIWORD_TYPE_STARTS and words[1].lower() in {
+        "precision",
+        "varying",
+        "with",
+        "without",
+    }
+
+
+def _signature_args(statement: str, object_type: str) -> Optional[str]:
+    """Return the text between the parentheses following the routine name."""
+    match = re.search(rf"\b{object_type}\s+[^\s(]+\s*\(", statement, re.IGNORECASE)
+    if not match:
+        return None
+    depth = 1
+    for index in range(match.end(), len(statement)):
+        char = statement[index]
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth == 0:
+                return statement[match.end() : index]
+    return None
+
+
 def _identify_object(statement: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
     match = CREATE_OBJECT_RE.match(statement.lstrip())
     if not match:
         return None, None, None
-    object_type = match.group("type").upper().replace("  ", " ")
+    object_type = re.sub(r"\s+", " ", match.group("type").upper())
     name = match.group("name")
     args = None
     if object_type in {"FUNCTION", "PROCEDURE"}:
-        signature_match = re.search(r"\bFUNCTION\s+[^\s(]+\s*\((.*?)\)", statement, re.IGNORECASE | re.DOTALL)
-        if object_type == "PROCEDURE":
-            signature_match = re.search(r"\bPROCEDURE\s+[^\s(]+\s*\((.*?)\)", statement, re.IGNORECASE | re.DOTALL)
-        if signature_match:
-            args = signature_match.group(1)
+        args = _signature_args(statement, object_type)
     return object_type, name, args
 
 
@@ -302,62 +516,359 @@ def _definitions_equal(file_sql: str, database_sql: Optional[str]) -> bool:
     return _normalize_sql(file_sql) == _normalize_sql(database_sql)
 
 
+SCHEMA_DEPLOYMENT_DDL = """
+CREATE TABLE IF NOT EXISTS schema_deployment (
+    source_file TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    statement_index INTEGER NOT NULL,
+    object_name TEXT,
+    applied_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (source_file, content_hash)
+)
+"""
+
+
+# Session settings do not outlive the connection, and DO blocks in this tree
+# are idempotent guards that inspect the catalog (e.g. attach a trigger to
+# every vocabulary table). Both run on every deployment and are not logged.
+_ALWAYS_RUN_RE = re.compile(
+    r"^(?:SET|RESET|DO)\b|^SELECT\s+(?:pg_catalog\.)?set_config\s*\(",
+    re.IGNORECASE,
+)
+
+
+def runs_every_time(statement: str) -> bool:
+    """Whether ``statement`` bypasses the deployment log (see ``_ALWAYS_RUN_RE``)."""
+    return bool(_ALWAYS_RUN_RE.match(statement))
+
+
+def statement_hash(statement: str) -> str:
+    """Hash ``statement`` ignoring comments, whitespace and letter case."""
+    return hashlib.sha256(_normalize_sql(statement).encode("utf-8")).hexdigest()
+
+
+class DeploymentLog:
+    """Content hashes of the statements already applied, per source file.
+
+    Backed by ``schema_deployment``: a statement whose hash is recorded for
+    its file is skipped, so editing a file re-applies exactly the statements
+    that changed. Statements matched by :func:`runs_every_time` are never
+    recorded. With ``force`` every statement is re-applied (and re-recorded).
+    """
+
+    def __init__(self, applied: Dict[str, Set[str]], force: bool = False) -> None:
+        self.applied = applied
+        self.force = force
+
+    @classmethod
+    def load(cls, cursor, force: bool = False) -> "DeploymentLog":
+        cursor.execute(SCHEMA_DEPLOYMENT_DDL)
+        cursor.execute("SELECT source_file, content_hash FROM schema_deployment")
+        applied: Dict[str, Set[str]] = {}
+        for source_file, content_hash in cursor.fetchall():
+            applied.setdefault(source_file, set()).add(content_hash)
+        return cls(applied, force)
+
+    def is_applied(self, source_file: str, content_hash: str) -> bool:
+        return not self.force and content_hash in self.applied.get(source_file, ())
+
+    def save(
+        self,
+        cursor,
+        source_file: str,
+        records: List[Tuple[str, int, Optional[str]]],
+        current: Set[str],
+    ) -> None:
+        """Record the newly applied ``(hash, index, object)`` rows and forget removed statements."""
+        if records:
+            psycopg2.extras.execute_values(
+                cursor,
+                "INSERT INTO schema_deployment"
+                " (source_file, content_hash, statement_index, object_name) VALUES %s"
+                " ON CONFLICT (source_file, content_hash) DO UPDATE"
+                " SET statement_index = EXCLUDED.statement_index,"
+                " object_name = EXCLUDED.object_name, applied_at = NOW()",
+                [(source_file,) + record for record in records],
+            )
+        stale = self.applied.get(source_file, set()) - current
+        if stale:
+            cursor.execute(
+                "DELETE FROM schema_deployment"
+                " WHERE source_file = %s AND content_hash = ANY(%s)",
+                (source_file, sorted(stale)),
+            )
+        self.applied[source_file] = set(current)
+
+
+CREATE_INDEX_RE = re.compile(
+    r"^CREATE\s+(?P<unique>UNIQUE\s+)?INDEX\s+(?!CONCURRENTLY\b)"
+    r"(?:IF\s+NOT\s+EXISTS\s+)?(?P<name>[\w\.\"]+)\s+ON\s+(?:ONLY\s+)?(?P<table>[\w\.\"]+)",
+    re.IGNORECASE,
+)
+# Tables at least this large (planner estimate) get their new non-unique
+# indexes built with CREATE INDEX CONCURRENTLY after the main transaction.
+DEFAULT_CONCURRENT_INDEX_ROWS = 100_000
+
+_PRINT_LOCK = threading.Lock()
+
+
+@dataclass
+class StatementTiming:
+    source_file: str
+    index: int
+    label: str
+    outcome: str
+    seconds: float
+
+
+@dataclass
+class DeferredIndex:
+    """A ``CREATE INDEX`` on a large table, built concurrently after the transaction."""
+
+    source_file: str
+    index: int
+    content_hash: str
+    name: str
+    table: str
+    statement: str
+    columns: Tuple[str, ...] = ()
+
+
+@dataclass
+class DeploymentRun:
+    """State shared by the files applied in one bootstrap run."""
+
+    concurrent_index_rows: Optional[int] = DEFAULT_CONCURRENT_INDEX_ROWS
+    timings: List[StatementTiming] = field(default_factory=list)
+    deferred_indexes: List[DeferredIndex] = field(default_factory=list)
+
+    def defer_index(
+        self,
+        catalog: "CatalogSnapshot",
+        source_file: str,
+        index: int,
+        content_hash: str,
+        statement: str,
+    ) -> Optional[DeferredIndex]:
+        if self.concurrent_index_rows is None:
+            return None
+        match = CREATE_INDEX_RE.match(statement)
+        # Unique indexes stay in the transaction: later statements and the
+        # vocabulary loader use them as ON CONFLICT targets.
+        if not match or match.group("unique"):
+            return None
+        table = match.group("table")
+        if catalog.estimated_rows(table) < max(self.concurrent_index_rows, 1):
+            return None
+        deferred = DeferredIndex(
+            source_file,
+            index,
+            content_hash,
+            match.group("name"),
+            table,
+            statement,
+            _leading_index_columns(statement[match.end():]),
+        )
+        self.deferred_indexes.append(deferred)
+        return deferred
+
+
+_INDEX_COLUMNS_RE = re.compile(r"\s*(?:USING\s+\w+\s*)?\((?P<columns>[^()]*)\)", re.IGNORECASE)
+
+
+def _leading_index_columns(rest: str) -> Tuple[str, ...]:
+    """Plain column names that lead the key of a ``CREATE INDEX`` (text after the table)."""
+    match = _INDEX_COLUMNS_RE.match(rest)
+    if not match:
+        return ()
+    columns: List[str] = []
+    for element in match.group("columns").split(","):
+        words = element.split()
+        if not words or not re.fullmatch(r"[\w\"]+", words[0]):
+            break
+        columns.append(_object_name(words[0]))
+    return tuple(columns)
+
+
+def _statement_label(statement: str, object_type: Optional[str], name: Optional[str]) -> str:
+    if object_type and name:
+        return f"{object_type} {name}"
+    text = " ".join(statement.split())
+    return text if len(text) <= 60 else text[:57] + "..."
+
+
 def execute_file(
     cursor,
     path: Path,
     *,
     expected_tables: Optional[Set[str]] = None,
+    catalog: Optional[CatalogSnapshot] = None,
+    deployments: Optional[DeploymentLog] = None,
+    run: Optional[DeploymentRun] = None,
 ) -> bool:
-    with path.open("r", encoding="utf-8") as handle:
-        sql = handle.read()
-
-    statements = _split_statements(sql)
+    """Apply the new or changed statements of ``path`` and return whether any ran.
+
+    Output is printed as one block per file so parallel runs stay readable.
+    """
+    if catalog is None:
+        catalog = CatalogSnapshot.load(cursor)
+    if deployments is None:
+        deployments = DeploymentLog.load(cursor)
+    if run is None:
+        run = DeploymentRun(concurrent_index_rows=None)
     relative_path = path.relative_to(BASE_DIR)
-    print(f"Inspecting {relative_path} for changes ...")
+    source_file = relative_path.as_posix()
+    lines = [f"Inspecting {relative_path} for changes ..."]
 
     executed_any = False
+    unchanged = 0
+    hashes: Set[str] = set()
+    records: List[Tuple[str, int, Optional[str]]] = []
     seen_tables: Set[str] = set()
     unexpected_tables: Set[str] = set()
-    for statement in statements:
-        object_type, name, args = _identify_object(statement)
-        if object_type and name:
-            if object_type == "TABLE":
-                _, table_name = _schema_and_name(name)
-                seen_tables.add(table_name)
-                if expected_tables is not None and table_name not in expected_tables:
-                    unexpected_tables.add(table_name)
-            existing = _existing_ddl(cursor, object_type, name, args)
-            if _definitions_equal(statement, existing):
-                print(
-                    f"  Skipping {object_type} {name}: no changes detected."
+    try:
+        with path.open("r", encoding="utf-8") as handle:
+            for index, statement in enumerate(iter_statements(handle)):
+                if runs_every_time(statement):
+                    started = time.perf_counter()
+                    cursor.execute(statement)
+                    run.timings.append(
+                        StatementTiming(
+                            source_file,
+                            index,
+                            _statement_label(statement, None, None),
+                            "rerun",
+                            time.perf_counter() - started,
+                        )
+                    )
+                    continue
+                object_type, name, args = _identify_object(statement)
+                if object_type == "TABLE" and name:
+                    _, table_name = _schema_and_name(name)
+                    seen_tables.add(table_name)
+                    if expected_tables is not None and table_name not in expected_tables:
+                        unexpected_tables.add(table_name)
+                content_hash = statement_hash(statement)
+                hashes.add(content_hash)
+                if deployments.is_applied(source_file, content_hash):
+                    unchanged += 1
+                    continue
+                label = _statement_label(statement, object_type, name)
+                if run.defer_index(catalog, source_file, index, content_hash, statement):
+                    lines.append(f"  Deferring {label} to a concurrent build.")
+                    continue
+                records.append((content_hash, index, label if object_type else None))
+                if object_type and name:
+                    existing = catalog.definition(object_type, name, args)
+                    if _definitions_equal(statement, existing):
+                        lines.append(f"  Skipping {label}: no changes detected.")
+                        continue
+                started = time.perf_counter()
+                cursor.execute(statement)
+                run.timings.append(
+                    StatementTiming(
+                        source_file, index, label, "applied", time.perf_counter() - started
+                    )
                 )
-                continue
-        cursor.execute(statement)
-        executed_any = True
-        if object_type and name:
-            print(f"  Applied {object_type} {name}.")
-    if not executed_any:
-        print(f"  No changes required for {relative_path}.")
-
-    if expected_tables is not None:
-        missing_tables = expected_tables - seen_tables
-        if missing_tables:
-            missing_list = ", ".join(sorted(missing_tables))
-            print(
-                "  Warning: catalog lists tables not found in"
-                f" {relative_path}: {missing_list}."
+                executed_any = True
+                if object_type and name:
+                    catalog.record(object_type, name, args, statement)
+                    lines.append(f"  Applied {label}.")
+        deployments.save(cursor, source_file, records, hashes)
+        if unchanged:
+            lines.append(f"  {unchanged} statement(s) unchanged since the last deployment.")
+        if not executed_any:
+            lines.append(f"  No changes required for {relative_path}.")
+
+        if expected_tables is not None:
+            missing_tables = expected_tables - seen_tables
+            if missing_tables:
+                missing_list = ", ".join(sorted(missing_tables))
+                lines.append(
+                    "  Warning: catalog lists tables not found in"
+                    f" {relative_path}: {missing_list}."
+                )
+        if unexpected_tables:
+            unexpected_list = ", ".join(sorted(unexpected_tables))
+            lines.append(
+                "  Warning:"
+                f" {relative_path} defines tables missing from the catalog: {unexpected_list}."
             )
-    if unexpected_tables:
-        unexpected_list = ", ".join(sorted(unexpected_tables))
-        print(
-            "  Warning:"
-            f" {relative_path} defines tables missing from the catalog: {unexpected_list}."
-        )
+    finally:
+        with _PRINT_LOCK:
+            print("\n".join(lines), flush=True)
 
     return executed_any
 
 
-def deploy_tables(cursor) -> None:
+@dataclass
+class DeployUnit:
+    """One SQL file of the bootstrap and the object names it defines and uses."""
+
+    path: Path
+    expected_tables: Optional[Set[str]] = None
+    defines: Set[str] = field(default_factory=set)
+    references: Set[str] = field(default_factory=set)
+    ddl_targets: Set[str] = field(default_factory=set)
+
+
+_DEFINED_OBJECT_RE = re.compile(
+    r"^CREATE\s+(?:OR\s+REPLACE\s+)?(?:UNLOGGED\s+|TEMP(?:ORARY)?\s+)?"
+    r"(?:TABLE|VIEW|MATERIALIZED\s+VIEW|FUNCTION|PROCEDURE|SEQUENCE|TYPE|DOMAIN|EXTENSION)"
+    r"\s+(?:IF\s+NOT\s+EXISTS\s+)?(?P<name>[\w\.\"]+)",
+    re.IGNORECASE,
+)
+_DDL_TARGET_RE = re.compile(
+    r"^(?:ALTER\s+TABLE\s+(?:IF\s+EXISTS\s+)?(?:ONLY\s+)?(?P<altered>[\w\.\"]+)"
+    r"|CREATE\s+(?:UNIQUE\s+)?INDEX\b.*?\bON\s+(?:ONLY\s+)?(?P<indexed>[\w\.\"]+)"
+    r"|CREATE\s+(?:OR\s+REPLACE\s+)?(?:CONSTRAINT\s+)?TRIGGER\b.*?\bON\s+(?P<triggered>[\w\.\"]+))",
+    re.IGNORECASE | re.DOTALL,
+)
+_WORD_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+def _object_name(identifier: str) -> str:
+    return _schema_and_name(identifier)[1].lower()
+
+
+def scan_unit(path: Path, expected_tables: Optional[Set[str]] = None) -> DeployUnit:
+    """Collect the objects ``path`` creates, the words it mentions, and the tables it alters."""
+    unit = DeployUnit(path, expected_tables)
+    with path.open("r", encoding="utf-8") as handle:
+        for statement in iter_statements(handle):
+            defined = _DEFINED_OBJECT_RE.match(statement)
+            if defined:
+                unit.defines.add(_object_name(defined.group("name")))
+            target = _DDL_TARGET_RE.match(statement)
+            if target:
+                unit.ddl_targets.add(_object_name(next(filter(None, target.groups()))))
+            unit.references.update(word.lower() for word in _WORD_RE.findall(statement))
+    unit.references -= unit.defines
+    return unit
+
+
+def plan_units(units: List[DeployUnit]) -> Dict[int, Set[int]]:
+    """Map each unit to the earlier units it must wait for.
+
+    A unit depends on an earlier unit when it mentions an object that unit
+    creates (foreign keys, function bodies, triggers, seed inserts), or when
+    both run DDL against the same table. Only earlier units are considered,
+    so the graph is acyclic and never reorders the sequence the files have
+    always run in; it only lets unrelated files overlap.
+    """
+    dependencies: Dict[int, Set[int]] = {}
+    for position, unit in enumerate(units):
+        dependencies[position] = {
+            earlier
+            for earlier in range(position)
+            if unit.references & units[earlier].defines
+            or unit.ddl_targets & units[earlier].ddl_targets
+        }
+    return dependencies
+
+
+def collect_units() -> List[DeployUnit]:
+    """Return every file the bootstrap applies, in the order they have always run."""
     metadata = load_table_catalog()
     files: "OrderedDict[str, List[dict]]" = OrderedDict()
     for entry in metadata:
@@ -373,75 +884,339 @@ def deploy_tables(cursor) -> None:
             )
         files.setdefault(filename, []).append(entry)
 
-    modified = False
+    units: List[DeployUnit] = []
     for filename, entries in files.items():
         sql_path = SQL_DIR / filename
         if not sql_path.exists():
             raise FileNotFoundError(
                 f"Table SQL file missing: {sql_path}"
             )
+        units.append(scan_unit(sql_path, {entry["name"] for entry in entries}))
 
-        outdated = [entry for entry in entries if not entry.get("updated")]
-        if not outdated:
-            continue
-
-        expected = {entry["name"] for entry in entries}
-        execute_file(cursor, sql_path, expected_tables=expected)
-
-        today = date.today().isoformat()
-        for entry in outdated:
-            entry["updated"] = True
-            entry["date_update"] = today
-        modified = True
-
-    if modified:
-        save_table_catalog(metadata)
-
-
-def deploy_stored_procedures(cursor) -> None:
-    metadata = load_config()
-    modified = False
-
-    for entry in metadata:
-        if entry.get("updated"):
-            continue
+    units.extend(scan_unit(path) for path in iter_sql_files(SUPPORTING_FILES))
 
+    for entry in load_config():
         filename = entry.get("filename")
         if not filename:
             raise ValueError(
                 f"Stored procedure metadata for {entry.get('name', '<unknown>')} is missing a filename."
             )
-
         sql_path = STORED_PROCEDURES_DIR / filename
         if not sql_path.exists():
             raise FileNotFoundError(
                 f"Stored procedure SQL file missing: {sql_path}"
             )
+        units.append(scan_unit(sql_path))
+    return units
 
-        applied = execute_file(cursor, sql_path)
-        entry["updated"] = True
-        if applied:
-            entry["date_update"] = date.today().isoformat()
-        modified = True
 
-    if modified:
-        save_config(metadata)
+def apply_units_serially(
+    cursor,
+    units: List[DeployUnit],
+    catalog: CatalogSnapshot,
+    deployments: DeploymentLog,
+    run: DeploymentRun,
+) -> None:
+    for unit in units:
+        execute_file(
+            cursor,
+            unit.path,
+            expected_tables=unit.expected_tables,
+            catalog=catalog,
+            deployments=deployments,
+            run=run,
+        )
 
 
-def main() -> None:
+def apply_units_in_parallel(
+    dsn: str,
+    units: List[DeployUnit],
+    catalog: CatalogSnapshot,
+    deployments: DeploymentLog,
+    run: DeploymentRun,
+    jobs: int,
+) -> None:
+    """Apply ``units`` on ``jobs`` connections, each file in its own transaction.
+
+    A file starts once every file it depends on has committed. Before each
+    commit the foreign keys of the tables the file defines or alters are
+    checked, so a missing index aborts that file instead of being committed.
+    """
+    dependencies = plan_units(units)
+    local = threading.local()
+    opened: List[object] = []
+    opened_lock = threading.Lock()
+
+    def apply(unit: DeployUnit) -> None:
+        if getattr(local, "connection", None) is None:
+            local.connection = psycopg2.connect(dsn)
+            with opened_lock:
+                opened.append(local.connection)
+        connection = local.connection
+        try:
+            with connection.cursor() as cursor:
+                execute_file(
+                    cursor,
+                    unit.path,
+                    expected_tables=unit.expected_tables,
+                    catalog=catalog,
+                    deployments=deployments,
+                    run=run,
+                )
+                check_foreign_key_indexes(
+                    cursor,
+                    tables=unit.defines | unit.ddl_targets,
+                    pending=run.deferred_indexes,
+                )
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+
+    pending = list(range(len(units)))
+    done: Set[int] = set()
+    running: Dict[Future, int] = {}
+    try:
+        with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="bootstrap") as pool:
+            while pending or running:
+                for position in [p for p in pending if dependencies[p] <= done]:
+                    pending.remove(position)
+                    running[pool.submit(apply, units[position])] = position
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    position = running.pop(future)
+                    try:
+                        future.result()
+                    except Exception:
+                        for other in running:
+                            other.cancel()
+                        raise
+                    done.add(position)
+    finally:
+        for connection in opened:
+            connection.close()
+
+
+def build_deferred_indexes(
+    dsn: str, deployments: DeploymentLog, run: DeploymentRun, jobs: int
+) -> None:
+    """Build the deferred indexes with CREATE INDEX CONCURRENTLY, outside any transaction.
+
+    A previous interrupted build leaves an invalid index behind, which
+    ``IF NOT EXISTS`` would accept, so invalid leftovers are dropped first.
+    Each index is recorded in ``schema_deployment`` once it is built.
+    """
+    if not run.deferred_indexes:
+        return
+
+    def build(deferred: DeferredIndex) -> None:
+        connection = psycopg2.connect(dsn)
+        connection.autocommit = True
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT NOT i.indisvalid FROM pg_index AS i"
+                    " WHERE i.indexrelid = to_regclass(%s)",
+                    (deferred.name,),
+                )
+                row = cursor.fetchone()
+                if row and row[0]:
+                    cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {deferred.name}")
+                statement = re.sub(
+                    r"^(CREATE\s+(?:UNIQUE\s+)?INDEX)\s+",
+                    r"\1 CONCURRENTLY ",
+                    deferred.statement,
+                    count=1,
+                    flags=re.IGNORECASE,
+                )
+                started = time.perf_counter()
+                cursor.execute(statement)
+                run.timings.append(
+                    StatementTiming(
+                        deferred.source_file,
+                        deferred.index,
+                        f"INDEX {deferred.name} (concurrently)",
+                        "applied",
+                        time.perf_counter() - started,
+                    )
+                )
+                deployments.save(
+                    cursor,
+                    deferred.source_file,
+                    [(deferred.content_hash, deferred.index, f"INDEX {deferred.name}")],
+                    deployments.applied.get(deferred.source_file, set()) | {deferred.content_hash},
+                )
+            with _PRINT_LOCK:
+                print(f"Built index {deferred.name} on {deferred.table} concurrently.", flush=True)
+        finally:
+            connection.close()
+
+    with ThreadPoolExecutor(max_workers=max(jobs, 1), thread_name_prefix="index") as pool:
+        for future in [pool.submit(build, deferred) for deferred in run.deferred_indexes]:
+            future.result()
+
+
+def print_timing_report(run: DeploymentRun, elapsed: float, top: int) -> None:
+    timings = sorted(run.timings, key=lambda timing: timing.seconds, reverse=True)
+    print(f"Statement timings ({len(timings)} executed, slowest {min(top, len(timings))}):")
+    for timing in timings[:top]:
+        print(
+            f"  {timing.seconds:9.3f}s  {timing.source_file}#{timing.index + 1}  {timing.label}"
+        )
+    per_file: Dict[str, float] = {}
+    for timing in timings:
+        per_file[timing.source_file] = per_file.get(timing.source_file, 0.0) + timing.seconds
+    if per_file:
+        print("Time per file:")
+        for source_file, seconds in sorted(per_file.items(), key=lambda item: -item[1]):
+            print(f"  {seconds:9.3f}s  {source_file}")
+    print(f"Total elapsed: {elapsed:.3f}s")
+
+
+UNINDEXED_FOREIGN_KEYS_QUERY = """
+SELECT
+    con.conrelid::regclass::text AS table_name,
+    con.conname,
+    array_agg(att.attname::text ORDER BY key.ordinality) AS columns
+FROM pg_constraint AS con
+CROSS JOIN LATERAL unnest(con.conkey) WITH ORDINALITY AS key(attnum, ordinality)
+JOIN pg_attribute AS att
+    ON att.attrelid = con.conrelid
+   AND att.attnum = key.attnum
+WHERE con.contype = 'f'
+  AND con.connamespace = current_schema()::regnamespace
+  AND NOT EXISTS (
+        SELECT 1
+        FROM pg_index AS idx
+        WHERE idx.indrelid = con.conrelid
+          AND idx.indpred IS NULL
+          AND (string_to_array(idx.indkey::text, ' ')::int2[])[1:cardinality(con.conkey)] @> con.conkey
+          AND (string_to_array(idx.indkey::text, ' ')::int2[])[1:cardinality(con.conkey)] <@ con.conkey
+  )
+GROUP BY con.conrelid, con.conname
+ORDER BY 1, 2
+"""
+
+
+def check_foreign_key_indexes(
+    cursor,
+    *,
+    tables: Optional[Set[str]] = None,
+    pending: Iterable[DeferredIndex] = (),
+) -> None:
+    """Fail when a foreign key has no index leading with its columns.
+
+    Without such an index every join from the parent (and every parent
+    delete) sequentially scans the referencing table. ``tables`` limits the
+    check to those tables. Indexes in ``pending`` are still to be built
+    concurrently and count as present.
+    """
+    pending = list(pending)
+
+    def covered_later(table: str, columns: List[str]) -> bool:
+        return any(
+            _object_name(index.table) == table
+            and set(index.columns[: len(columns)]) == set(columns)
+            for index in pending
+        )
+
+    cursor.execute(UNINDEXED_FOREIGN_KEYS_QUERY)
+    missing = [
+        (table, constraint, columns)
+        for table, constraint, columns in cursor.fetchall()
+        if (tables is None or _object_name(table) in tables)
+        and not covered_later(_object_name(table), columns)
+    ]
+    if not missing:
+        if tables is None:
+            print("All foreign keys are covered by an index.")
+        return
+    details = "; ".join(
+        f"{table}.{constraint} ({', '.join(columns)})"
+        for table, constraint, columns in missing
+    )
+    raise RuntimeError(f"Foreign keys without a supporting index: {details}")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Apply the schema, supporting objects, stored procedures and seed data."
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-apply every statement, ignoring the hashes recorded in schema_deployment.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=int(os.getenv("BOOTSTRAP_JOBS", "1")),
+        help=(
+            "Apply independent files on this many connections, each file in its own "
+            "transaction (default: 1, everything in a single transaction)."
+        ),
+    )
+    parser.add_argument(
+        "--concurrent-index-rows",
+        type=int,
+        default=DEFAULT_CONCURRENT_INDEX_ROWS,
+        help=(
+            "Build new indexes on existing tables with at least this many rows "
+            "using CREATE INDEX CONCURRENTLY after the main transaction; "
+            f"negative disables it (default: {DEFAULT_CONCURRENT_INDEX_ROWS})."
+        ),
+    )
+    parser.add_argument(
+        "--vocabulary-dir",
+        type=Path,
+        default=os.getenv("BOOTSTRAP_VOCABULARY_DIR") or None,
+        help=(
+            "Bulk-load <vocabulary>.csv/.tsv[.gz] files from this directory after the "
+            "schema (see database/load_vocabulary.py)."
+        ),
+    )
+    parser.add_argument(
+        "--report-top",
+        type=int,
+        default=20,
+        help="Number of slowest statements listed in the timing report (default: 20).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    started = time.perf_counter()
     dsn = build_dsn()
     print("Connecting to PostgreSQL with DSN:", dsn)
+    units = collect_units()
+    run = DeploymentRun(
+        concurrent_index_rows=(
+            args.concurrent_index_rows if args.concurrent_index_rows >= 0 else None
+        )
+    )
     with psycopg2.connect(dsn) as connection:
         connection.autocommit = False
         with connection.cursor() as cursor:
-            deploy_tables(cursor)
-            for sql_file in iter_sql_files(SUPPORTING_FILES):
-                execute_file(cursor, sql_file)
-            deploy_stored_procedures(cursor)
+            deployments = DeploymentLog.load(cursor, force=args.force)
+            catalog = CatalogSnapshot.load(cursor)
+            if args.jobs > 1:
+                connection.commit()
+                apply_units_in_parallel(dsn, units, catalog, deployments, run, args.jobs)
+            else:
+                apply_units_serially(cursor, units, catalog, deployments, run)
+            if args.vocabulary_dir:
+                print(f"Loading vocabularies from {args.vocabulary_dir} ...")
+                for result in load_vocabulary_dir(cursor, args.vocabulary_dir):
+                    print(f"  {result.summary()}")
+            # Runs before the commit in every mode; deferred indexes count as
+            # present since they are built right after it.
+            check_foreign_key_indexes(cursor, pending=run.deferred_indexes)
         connection.commit()
+    build_deferred_indexes(dsn, deployments, run, args.jobs)
+    print_timing_report(run, time.perf_counter() - started, args.report_top)
     print("Bootstrap completed successfully.")
 
 
 if __name__ == "__main__":
     main()
-
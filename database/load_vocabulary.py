@@ -0,0 +1,390 @@
+"""Bulk loader for the large controlled vocabularies.
+
+``vocabulary_seed.sql`` only ships a handful of rows. Full code lists (the
+ISO country list, ICD-10, MeSH/DeCS and institution registries) are loaded
+from CSV or TSV files instead::
+
+    python -m database.load_vocabulary country countries.csv
+    python -m database.load_vocabulary icd10 icd10.tsv.gz
+    python -m database.load_vocabulary --dir /data/vocabularies
+
+Each file is streamed into a temporary staging table with ``COPY`` and merged
+into its ``vocabulary_*`` table by a single ``INSERT ... ON CONFLICT DO
+UPDATE`` that only touches rows whose values changed, so reloading the same
+file is a no-op. The first line of a file names its columns; columns the
+vocabulary does not know are ignored, and columns absent from the file keep
+their current values. The same functions back ``manage.py load_vocabulary``
+and the ``--vocabulary-dir`` stage of ``database.bootstrap``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import gzip
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Mapping, Optional, TextIO, Tuple
+
+import psycopg2
+
+STAGING_TABLE = "vocabulary_staging"
+
+SOURCE_SUFFIXES = (".csv", ".tsv", ".csv.gz", ".tsv.gz")
+
+
+@dataclass(frozen=True)
+class CodeLookup:
+    """Resolve a code from the file into the id of another vocabulary table."""
+
+    column: str
+    table: str
+    key: str = "code"
+
+
+@dataclass(frozen=True)
+class VocabularySpec:
+    """How the columns of a source file map onto one ``vocabulary_*`` table.
+
+    ``key`` lists the expressions of the unique index used as the conflict
+    target, written against the target column names. ``expressions`` wraps
+    the text value of a column (``{}``) before it is cast to the column type.
+    """
+
+    table: str
+    key: Tuple[str, ...]
+    columns: Tuple[str, ...]
+    required: Tuple[str, ...]
+    lookups: Mapping[str, CodeLookup] = field(default_factory=dict)
+    constants: Mapping[str, str] = field(default_factory=dict)
+    expressions: Mapping[str, str] = field(default_factory=dict)
+
+
+def _condition_spec(code_system: str) -> VocabularySpec:
+    return VocabularySpec(
+        "vocabulary_condition",
+        key=("code_system", "code"),
+        columns=("code", "name", "parent_code", "is_active"),
+        required=("code", "name"),
+        lookups={
+            "category": CodeLookup("condition_category_id", "vocabulary_condition_category")
+        },
+        constants={"code_system": code_system},
+        expressions={"code": "upper({})", "parent_code": "upper({})"},
+    )
+
+
+# Loaded in this order by ``load_vocabulary_dir`` so lookups find their targets.
+VOCABULARIES: "OrderedDict[str, VocabularySpec]" = OrderedDict(
+    [
+        (
+            "country",
+            VocabularySpec(
+                "vocabulary_country",
+                key=("iso_alpha2",),
+                columns=(
+                    "iso_alpha2",
+                    "iso_alpha3",
+                    "iso_numeric",
+                    "ibge_code",
+                    "name",
+                    "official_name",
+                    "continent",
+                    "is_active",
+                ),
+                required=("iso_alpha2", "name"),
+                expressions={"iso_alpha2": "upper({})", "iso_alpha3": "upper({})"},
+            ),
+        ),
+        (
+            "institution",
+            VocabularySpec(
+                "vocabulary_institution",
+                key=("normalize_institution_name(name)",),
+                columns=(
+                    "name",
+                    "legal_name",
+                    "acronym",
+                    "registration_code",
+                    "state",
+                    "city",
+                    "address",
+                    "postal_code",
+                    "phone",
+                    "email",
+                    "website",
+                    "is_active",
+                ),
+                required=("name",),
+                lookups={
+                    "country": CodeLookup("country_id", "vocabulary_country", "iso_alpha2"),
+                    "institution_type": CodeLookup(
+                        "institution_type_id", "vocabulary_institution_type"
+                    ),
+                    "institution_scope": CodeLookup(
+                        "institution_scope_id", "vocabulary_institution_scope"
+                    ),
+                    "institution_nature": CodeLookup(
+                        "institution_nature_id", "vocabulary_institution_nature"
+                    ),
+                },
+                expressions={"name": "regexp_replace({}, '\\s+', ' ', 'g')"},
+            ),
+        ),
+        ("icd10", _condition_spec("ICD10")),
+        ("mesh", _condition_spec("MESH")),
+        ("decs", _condition_spec("DECS")),
+    ]
+)
+
+
+@dataclass
+class VocabularyLoadResult:
+    vocabulary: str
+    table: str
+    staged: int = 0
+    skipped: int = 0
+    duplicates: int = 0
+    unresolved: int = 0
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    seconds: float = 0.0
+
+    def summary(self) -> str:
+        text = (
+            f"{self.vocabulary} -> {self.table}: {self.inserted} inserted,"
+            f" {self.updated} updated, {self.unchanged} unchanged"
+            f" ({self.staged} rows read in {self.seconds:.2f}s)"
+        )
+        notes = []
+        if self.skipped:
+            notes.append(f"{self.skipped} without required values skipped")
+        if self.duplicates:
+            notes.append(f"{self.duplicates} duplicate keys collapsed")
+        if self.unresolved:
+            notes.append(f"{self.unresolved} with unknown lookup codes")
+        return text + (f"; {', '.join(notes)}" if notes else "")
+
+
+def open_source(path: Path) -> TextIO:
+    """Open a (possibly gzip-compressed) source file as text, dropping a UTF-8 BOM."""
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8-sig", newline="")
+    return path.open("r", encoding="utf-8-sig", newline="")
+
+
+def source_delimiter(path: Path) -> str:
+    suffixes = path.suffixes[-2:] if path.suffix == ".gz" else path.suffixes[-1:]
+    return "\t" if suffixes and suffixes[0] == ".tsv" else ","
+
+
+def _column_types(cursor, table: str) -> Dict[str, str]:
+    cursor.execute(
+        """
+        SELECT a.attname, format_type(a.atttypid, a.atttypmod)
+        FROM pg_attribute AS a
+        WHERE a.attrelid = to_regclass(%s) AND a.attnum > 0 AND NOT a.attisdropped
+        """,
+        [table],
+    )
+    types = dict(cursor.fetchall())
+    if not types:
+        raise ValueError(f"Vocabulary table {table} does not exist; run the bootstrap first.")
+    return types
+
+
+def _merge_query(spec: VocabularySpec, header: List[str], types: Mapping[str, str]) -> str:
+    """Build the single statement that merges the staging table into ``spec.table``."""
+
+    def value(position: int) -> str:
+        return f"NULLIF(btrim(s.c{position}), '')"
+
+    projections: "OrderedDict[str, str]" = OrderedDict()
+    joins: List[str] = []
+    unresolved: List[str] = []
+    for column, constant in spec.constants.items():
+        projections[column] = f"'{constant}'::{types[column]}"
+    for position, name in enumerate(header):
+        if name in spec.columns and name not in projections:
+            expression = spec.expressions.get(name, "{}").format(value(position))
+            projections[name] = f"({expression})::{types[name]}"
+        elif name in spec.lookups and spec.lookups[name].column not in projections:
+            lookup = spec.lookups[name]
+            alias = f"l{position}"
+            joins.append(
+                f"LEFT JOIN {lookup.table} AS {alias}"
+                f" ON {alias}.{lookup.key} = upper({value(position)})"
+            )
+            projections[lookup.column] = f"{alias}.id"
+            unresolved.append(f"({value(position)} IS NOT NULL AND {alias}.id IS NULL)")
+
+    columns = list(projections)
+    key = ", ".join(spec.key)
+    column_list = ", ".join(columns)
+    updatable = [
+        column for column in columns if column not in spec.constants and column not in spec.key
+    ]
+    conflict_action = "DO NOTHING"
+    if updatable:
+        assignments = ", ".join(f"{column} = EXCLUDED.{column}" for column in updatable)
+        changed = (
+            f"ROW({', '.join(f'target.{column}' for column in updatable)})"
+            f" IS DISTINCT FROM ROW({', '.join(f'EXCLUDED.{column}' for column in updatable)})"
+        )
+        conflict_action = f"DO UPDATE SET {assignments}, updated_at = NOW() WHERE {changed}"
+    required = " AND ".join(f"{column} IS NOT NULL" for column in spec.required)
+    select_list = ", ".join(
+        f"{expression} AS {column}" for column, expression in projections.items()
+    )
+    return f"""
+        WITH projected AS (
+            SELECT
+                s.line,
+                {select_list},
+                {" OR ".join(unresolved) or "FALSE"} AS unresolved
+            FROM {STAGING_TABLE} AS s
+            {" ".join(joins)}
+        ),
+        accepted AS (
+            SELECT * FROM projected WHERE {required}
+        ),
+        source AS (
+            SELECT DISTINCT ON ({key}) {column_list}
+            FROM accepted
+            ORDER BY {key}, line DESC
+        ),
+        merged AS (
+            INSERT INTO {spec.table} AS target ({column_list})
+            SELECT {column_list} FROM source
+            ON CONFLICT ({key}) {conflict_action}
+            RETURNING (xmax = 0) AS inserted
+        )
+        SELECT
+            (SELECT count(*) FROM projected),
+            (SELECT count(*) FROM accepted),
+            (SELECT count(*) FROM source),
+            (SELECT count(*) FROM accepted WHERE unresolved),
+            count(*) FILTER (WHERE inserted),
+            count(*) FILTER (WHERE NOT inserted)
+        FROM merged
+    """
+
+
+def load_vocabulary(
+    cursor, vocabulary: str, source: TextIO, *, delimiter: str = ","
+) -> VocabularyLoadResult:
+    """COPY ``source`` into a staging table and merge it into the vocabulary.
+
+    ``cursor`` may be a psycopg2 cursor or a Django cursor wrapping one; the
+    caller owns the transaction.
+    """
+    try:
+        spec = VOCABULARIES[vocabulary]
+    except KeyError:
+        raise ValueError(
+            f"Unknown vocabulary {vocabulary!r}; expected one of {', '.join(VOCABULARIES)}."
+        ) from None
+    started = time.perf_counter()
+    header_line = source.readline()
+    header = [
+        name.strip().lower()
+        for name in next(csv.reader([header_line], delimiter=delimiter), [])
+    ]
+    missing = [
+        column for column in spec.key if column in spec.columns and column not in header
+    ] + [column for column in spec.required if column not in header]
+    if missing:
+        raise ValueError(
+            f"{vocabulary} source is missing the column(s): {', '.join(sorted(set(missing)))}."
+        )
+    types = _column_types(cursor, spec.table)
+
+    cursor.execute(f"DROP TABLE IF EXISTS pg_temp.{STAGING_TABLE}")
+    cursor.execute(
+        f"CREATE TEMP TABLE {STAGING_TABLE} (line BIGSERIAL, "
+        + ", ".join(f"c{position} TEXT" for position in range(len(header)))
+        + ") ON COMMIT DROP"
+    )
+    copy_options = "FORMAT csv" + (", DELIMITER E'\\t'" if delimiter == "\t" else "")
+    cursor.copy_expert(
+        f"COPY {STAGING_TABLE} ({', '.join(f'c{position}' for position in range(len(header)))})"
+        f" FROM STDIN WITH ({copy_options})",
+        source,
+    )
+    cursor.execute(f"ANALYZE {STAGING_TABLE}")
+    cursor.execute(_merge_query(spec, header, types))
+    staged, accepted, distinct, unresolved, inserted, updated = cursor.fetchone()
+    cursor.execute(f"DROP TABLE {STAGING_TABLE}")
+    return VocabularyLoadResult(
+        vocabulary,
+        spec.table,
+        staged=staged,
+        skipped=staged - accepted,
+        duplicates=accepted - distinct,
+        unresolved=unresolved,
+        inserted=inserted,
+        updated=updated,
+        unchanged=distinct - inserted - updated,
+        seconds=time.perf_counter() - started,
+    )
+
+
+def load_vocabulary_file(cursor, vocabulary: str, path: Path) -> VocabularyLoadResult:
+    with open_source(path) as source:
+        return load_vocabulary(cursor, vocabulary, source, delimiter=source_delimiter(path))
+
+
+def iter_vocabulary_files(directory: Path) -> Iterator[Tuple[str, Path]]:
+    """Yield ``(vocabulary, path)`` for files named after a vocabulary, in load order."""
+    for vocabulary in VOCABULARIES:
+        for suffix in SOURCE_SUFFIXES:
+            path = directory / f"{vocabulary}{suffix}"
+            if path.exists():
+                yield vocabulary, path
+
+
+def load_vocabulary_dir(cursor, directory: Path) -> List[VocabularyLoadResult]:
+    if not directory.is_dir():
+        raise FileNotFoundError(f"Vocabulary directory not found: {directory}")
+    return [
+        load_vocabulary_file(cursor, vocabulary, path)
+        for vocabulary, path in iter_vocabulary_files(directory)
+    ]
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Load CSV/TSV vocabulary files into the vocabulary_* tables."
+    )
+    parser.add_argument("vocabulary", nargs="?", choices=list(VOCABULARIES))
+    parser.add_argument("path", nargs="?", type=Path, help="CSV or TSV file, optionally gzipped.")
+    parser.add_argument(
+        "--dir",
+        type=Path,
+        help="Load every <vocabulary>.csv/.tsv[.gz] file found in this directory.",
+    )
+    args = parser.parse_args(argv)
+    if bool(args.dir) == bool(args.vocabulary and args.path):
+        parser.error("pass either a vocabulary and a file, or --dir")
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    from database.bootstrap import build_dsn
+
+    args = parse_args(argv)
+    with psycopg2.connect(build_dsn()) as connection:
+        with connection.cursor() as cursor:
+            if args.dir:
+                results = load_vocabulary_dir(cursor, args.dir)
+            else:
+                results = [load_vocabulary_file(cursor, args.vocabulary, args.path)]
+    for result in results:
+        print(result.summary())
+
+
+if __name__ == "__main__":
+    main()
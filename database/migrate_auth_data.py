@@ -2,15 +2,25 @@
 
 The migration can now work with either an explicit list of source columns or a
 set of columns to ignore for each table, ensuring inserts only reference fields
-that exist in the target schema.
+that exist in the target schema. The same machinery is reused by
+``migrate_trial_data`` through the transform, lookup and provenance hints of
+``TableSpec``.
 """
 from __future__ import annotations
 
 import argparse
+import datetime
+import io
+import json
 import logging
 import os
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Sequence, Tuple
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import closing
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
 from urllib.parse import unquote, urlparse
 
 import pymysql
@@ -21,10 +31,48 @@ from psycopg2 import sql
 
 LOGGER = logging.getLogger(__name__)
 
+# Batches the MySQL reader may buffer ahead of the PostgreSQL writer.
+DEFAULT_QUEUE_DEPTH = 2
+
+# Provenance table linking imported ``ct`` rows to their source records.
+IMPORT_LOG_TABLE = "ct_import_log"
+
+
+@dataclass(frozen=True)
+class Lookup:
+    """Resolve a source code to a PostgreSQL id through an in-memory map.
+
+    The map is read once per table from ``SELECT key, value FROM table``;
+    ``normalize`` is applied to both the map keys and the source values.
+    Unknown codes reject the row when ``required``, otherwise they become NULL.
+    """
+
+    table: str
+    key: str = "code"
+    value: str = "id"
+    required: bool = True
+    normalize: Optional[Callable[[str], str]] = None
+
+
+@dataclass(frozen=True)
+class ParentLink:
+    """Remap a column holding a legacy parent key to the imported ``ct.id``."""
+
+    column: str
+    source_system: str
+
 
 @dataclass(frozen=True)
 class TableSpec:
-    """Describes migration hints for a single auth table."""
+    """Describes migration hints for a single migrated table.
+
+    ``source`` names the MySQL table (or a ``SELECT``) to read when it differs
+    from ``name``; its columns must already carry the target column names.
+    ``transforms`` and ``lookups`` rewrite individual values on the reader
+    thread. With ``provenance`` rows receive new ids and each one is recorded
+    in ``ct_import_log`` under that source system; ``parent`` rewrites the
+    given column of a child table through those records.
+    """
 
     name: str
     pk: str = "id"
@@ -32,6 +80,11 @@ class TableSpec:
     boolean_columns: Sequence[str] = ()
     columns: Optional[Sequence[str]] = None
     ignore_columns: Sequence[str] = ()
+    source: Optional[str] = None
+    transforms: Mapping[str, Callable[[object], object]] = field(default_factory=dict)
+    lookups: Mapping[str, Lookup] = field(default_factory=dict)
+    provenance: Optional[str] = None
+    parent: Optional[ParentLink] = None
 
 
 TABLE_SPECS: Sequence[TableSpec] = (
@@ -75,12 +128,32 @@ class MigrationError(Exception):
     """Raised when required connection details are missing."""
 
 
-def parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(
-        description=(
-            "Copy Django auth_* data from a legacy MySQL database into the new "
-            "PostgreSQL schema while preserving primary keys and relationships."
-        )
+class RowRejected(Exception):
+    """Raised by a transform or lookup to skip a single source row."""
+
+    def __init__(self, reason: str, details: Optional[Dict[str, object]] = None) -> None:
+        super().__init__(reason)
+        self.reason = reason
+        self.details = details or {}
+
+
+DESCRIPTION = (
+    "Copy Django auth_* data from a legacy MySQL database into the new "
+    "PostgreSQL schema while preserving primary keys and relationships."
+)
+
+
+def parse_args(description: str = DESCRIPTION) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "command",
+        nargs="?",
+        choices=("migrate", "verify"),
+        default="migrate",
+        help=(
+            "migrate copies the tables (default); verify compares source and target "
+            "by checksumming primary key ranges and reports the keys that differ."
+        ),
     )
     parser.add_argument(
         "--mysql-dsn",
@@ -102,6 +175,75 @@ def parse_args() -> argparse.Namespace:
         default=int(os.environ.get("MIGRATION_BATCH_SIZE", 500)),
         help="Number of rows to transfer per transaction (default: 500).",
     )
+    parser.add_argument(
+        "--mode",
+        choices=("insert", "copy"),
+        default=os.environ.get("MIGRATION_MODE", "insert"),
+        help=(
+            "How batches reach PostgreSQL: multi-row INSERT statements or a "
+            "streamed COPY FROM STDIN (default: insert)."
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=int(os.environ.get("MIGRATION_JOBS", 1)),
+        help=(
+            "Number of tables (or table ranges) migrated concurrently, each on its "
+            "own pair of connections (default: 1)."
+        ),
+    )
+    parser.add_argument(
+        "--split-rows",
+        type=int,
+        default=int(os.environ.get("MIGRATION_SPLIT_ROWS", 0)),
+        help=(
+            "Split tables whose primary key spans more than this many values into "
+            "ranges of that size that can run in parallel (default: 0, no splitting)."
+        ),
+    )
+    parser.add_argument(
+        "--no-resume",
+        dest="resume",
+        action="store_false",
+        help=(
+            "Do not read or write the migration_checkpoint table; by default a "
+            "rerun resumes each table after its last committed primary key."
+        ),
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Discard existing checkpoints and migrate every table from the start.",
+    )
+    parser.add_argument(
+        "--progress-interval",
+        type=float,
+        default=float(os.environ.get("MIGRATION_PROGRESS_INTERVAL", 10)),
+        help="Seconds between progress log lines; 0 disables them (default: 10).",
+    )
+    parser.add_argument(
+        "--summary-file",
+        help="Write the final JSON summary to this file instead of standard output.",
+    )
+    parser.add_argument(
+        "--verify-fanout",
+        type=int,
+        default=DEFAULT_VERIFY_FANOUT,
+        help=(
+            "verify: number of sub-ranges checksummed per query when a range "
+            f"differs (default: {DEFAULT_VERIFY_FANOUT})."
+        ),
+    )
+    parser.add_argument(
+        "--verify-leaf-keys",
+        type=int,
+        default=DEFAULT_VERIFY_LEAF_KEYS,
+        help=(
+            "verify: ranges spanning at most this many keys are compared row by "
+            f"row (default: {DEFAULT_VERIFY_LEAF_KEYS})."
+        ),
+    )
     parser.add_argument(
         "--log-level",
         default=os.environ.get("MIGRATION_LOG_LEVEL", "INFO"),
@@ -177,7 +319,7 @@ def open_mysql_connection(params: Dict[str, object]) -> pymysql.connections.Conn
         password=params.get("password"),
         database=params["database"],
         charset="utf8mb4",
-        cursorclass=pymysql.cursors.DictCursor,
+        cursorclass=pymysql.cursors.SSCursor,
     )
 
 
@@ -192,56 +334,514 @@ def open_postgres_connection(params: Dict[str, object]) -> psycopg2.extensions.c
     )
 
 
-def _convert_booleans(row: Dict[str, object], boolean_columns: Sequence[str]) -> None:
-    for column in boolean_columns:
-        if column in row and row[column] is not None:
-            value = row[column]
-            if isinstance(value, bool):
-                row[column] = value
-            elif isinstance(value, (int, float)):
-                row[column] = bool(value)
-            elif isinstance(value, str):
-                row[column] = value.strip().lower() in {"1", "t", "true", "y", "yes"}
-            else:
-                row[column] = bool(value)
+def _convert_boolean(value: object) -> object:
+    if value is None or isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return bool(value)
+    if isinstance(value, str):
+        return value.strip().lower() in {"1", "t", "true", "y", "yes"}
+    return bool(value)
 
 
-def _check_conflicts(
+def _create_staging_table(
     pg_cursor: psycopg2.extensions.cursor,
     table: TableSpec,
-    row: Dict[str, object],
-) -> Optional[SkippedRecord]:
-    pk_value = row.get(table.pk)
-    if pk_value is not None:
+    column_order: Sequence[str],
+) -> sql.Identifier:
+    """Create an empty temp table shaped like the migrated columns of ``table``.
+
+    Rows are cleared on every commit, so each batch starts from an empty table.
+    """
+    staging = sql.Identifier(f"migrate_stage_{table.name}")
+    pg_cursor.execute(sql.SQL("DROP TABLE IF EXISTS {}").format(staging))
+    pg_cursor.execute(
+        sql.SQL(
+            "CREATE TEMP TABLE {staging} ON COMMIT DELETE ROWS AS "
+            "SELECT 0::BIGINT AS migration_row, {columns} FROM {table} WITH NO DATA"
+        ).format(
+            staging=staging,
+            columns=sql.SQL(", ").join(map(sql.Identifier, column_order)),
+            table=sql.Identifier(table.name),
+        )
+    )
+    return staging
+
+
+def _conflict_checks(table: TableSpec, column_order: Sequence[str]) -> List[Sequence[str]]:
+    """Return the column tuples to check, primary key first.
+
+    Tuples referencing columns that are not migrated cannot collide and are
+    left out, and so do keys that are replaced on insert: the primary key of
+    a ``provenance`` table and the ``parent`` column of a child table.
+    """
+    migrated = set(column_order)
+    if table.provenance or table.parent:
+        migrated.discard(table.pk)
+    if table.parent:
+        migrated.discard(table.parent.column)
+    checks = [(table.pk,)] + [tuple(constraint) for constraint in table.unique_checks]
+    return [columns for columns in checks if all(column in migrated for column in columns)]
+
+
+def _remove_unlinked(
+    pg_cursor: psycopg2.extensions.cursor,
+    table: TableSpec,
+    staging: sql.Identifier,
+) -> List[SkippedRecord]:
+    """Drop staged rows whose ``ct_import_log`` link rules them out.
+
+    Rows of a ``provenance`` table that were imported before are skipped, as
+    are rows of a ``parent``-linked table whose parent was never imported.
+    """
+    log = sql.Identifier(IMPORT_LOG_TABLE)
+    pk = sql.Identifier(table.pk)
+    if table.provenance:
         pg_cursor.execute(
-            f"SELECT 1 FROM {table.name} WHERE {table.pk} = %s",
-            (pk_value,),
+            sql.SQL(
+                "DELETE FROM {staging} AS s USING {log} AS l "
+                "WHERE l.source_system = %s AND l.source_identifier = s.{pk}::text "
+                "RETURNING s.{pk}, l.ct_id"
+            ).format(staging=staging, log=log, pk=pk),
+            (table.provenance,),
         )
-        if pg_cursor.fetchone():
-            return SkippedRecord(
+        return [
+            SkippedRecord(
                 table=table.name,
-                reason=f"primary key {table.pk} collision",
-                details={table.pk: pk_value},
+                reason="already imported",
+                details={table.pk: legacy_pk, "ct_id": ct_id},
             )
-    for constraint in table.unique_checks:
-        values = [row.get(column) for column in constraint]
-        if all(value is None for value in values):
-            continue
-        where_clause = " AND ".join(f"{column} = %s" for column in constraint)
+            for legacy_pk, ct_id in pg_cursor.fetchall()
+        ]
+    if table.parent:
+        parent = sql.Identifier(table.parent.column)
         pg_cursor.execute(
-            f"SELECT {table.pk} FROM {table.name} WHERE {where_clause}",
-            values,
+            sql.SQL(
+                "DELETE FROM {staging} AS s WHERE NOT EXISTS ("
+                "SELECT 1 FROM {log} AS l "
+                "WHERE l.source_system = %s AND l.source_identifier = s.{parent}::text"
+                ") RETURNING s.{pk}, s.{parent}"
+            ).format(staging=staging, log=log, pk=pk, parent=parent),
+            (table.parent.source_system,),
         )
-        existing = pg_cursor.fetchone()
-        if existing:
-            details = {column: row.get(column) for column in constraint}
-            details[table.pk] = existing[0]
-            return SkippedRecord(
+        return [
+            SkippedRecord(
                 table=table.name,
-                reason="unique constraint conflict",
-                details=details,
+                reason="missing parent",
+                details={table.pk: legacy_pk, table.parent.column: parent_pk},
             )
-    return None
+            for legacy_pk, parent_pk in pg_cursor.fetchall()
+        ]
+    return []
+
+
+def _insert_query(
+    table: TableSpec, staging: sql.Identifier, column_order: Sequence[str]
+) -> sql.Composed:
+    """Build the statement that moves the staged batch into ``table``.
+
+    Plain tables keep their source keys. A ``provenance`` table draws new keys
+    from its sequence and logs ``legacy key -> new key`` in
+    ``ct_import_log``; a ``parent``-linked table drops its own key and reads
+    the parent key back from that log.
+    """
+    target = sql.Identifier(table.name)
+    if table.provenance:
+        others = [column for column in column_order if column != table.pk]
+        return sql.SQL(
+            "WITH numbered AS ("
+            "SELECT s.*, nextval(pg_get_serial_sequence({table_name}, {pk_name})) "
+            "AS migration_new_id FROM {staging} AS s ORDER BY s.migration_row"
+            "), inserted AS ("
+            "INSERT INTO {target} ({pk}, {columns}) "
+            "SELECT migration_new_id, {columns} FROM numbered ORDER BY migration_row"
+            ") INSERT INTO {log} (ct_id, source_system, source_identifier, payload) "
+            "SELECT migration_new_id, {system}, {pk}::text, "
+            "to_jsonb(numbered) - 'migration_row' - 'migration_new_id' "
+            "FROM numbered ORDER BY migration_row"
+        ).format(
+            table_name=sql.Literal(table.name),
+            pk_name=sql.Literal(table.pk),
+            staging=staging,
+            target=target,
+            pk=sql.Identifier(table.pk),
+            columns=sql.SQL(", ").join(map(sql.Identifier, others)),
+            log=sql.Identifier(IMPORT_LOG_TABLE),
+            system=sql.Literal(table.provenance),
+        )
+    if table.parent:
+        columns = [column for column in column_order if column != table.pk]
+        return sql.SQL(
+            "INSERT INTO {target} ({columns}) SELECT {values} FROM {staging} AS s "
+            "JOIN LATERAL ("
+            "SELECT l.ct_id FROM {log} AS l "
+            "WHERE l.source_system = {system} AND l.source_identifier = s.{parent}::text "
+            "ORDER BY l.id DESC LIMIT 1"
+            ") AS linked ON TRUE ORDER BY s.migration_row"
+        ).format(
+            target=target,
+            columns=sql.SQL(", ").join(map(sql.Identifier, columns)),
+            values=sql.SQL(", ").join(
+                sql.SQL("linked.ct_id")
+                if column == table.parent.column
+                else sql.SQL("s.{}").format(sql.Identifier(column))
+                for column in columns
+            ),
+            staging=staging,
+            log=sql.Identifier(IMPORT_LOG_TABLE),
+            system=sql.Literal(table.parent.source_system),
+            parent=sql.Identifier(table.parent.column),
+        )
+    return sql.SQL(
+        "INSERT INTO {target} ({columns}) SELECT {columns} FROM {staging} ORDER BY migration_row"
+    ).format(
+        target=target,
+        columns=sql.SQL(", ").join(map(sql.Identifier, column_order)),
+        staging=staging,
+    )
+
+
+def _find_conflicts(
+    pg_cursor: psycopg2.extensions.cursor,
+    table: TableSpec,
+    staging: sql.Identifier,
+    checks: Sequence[Sequence[str]],
+) -> List[SkippedRecord]:
+    """Remove staged rows that collide with the target and return them as skipped records.
+
+    Every check is probed for the whole batch in a single statement; only the
+    first matching check (primary key before unique constraints) is reported.
+    """
+    if not checks:
+        return []
+    target = sql.Identifier(table.name)
+    pk = sql.Identifier(table.pk)
+    detail_columns = list(dict.fromkeys(column for columns in checks for column in columns))
+    probes = [
+        sql.SQL(
+            "(SELECT {index} AS check_index, t.{pk} AS existing_pk "
+            "FROM {target} AS t WHERE {match} LIMIT 1)"
+        ).format(
+            index=sql.Literal(index),
+            pk=pk,
+            target=target,
+            match=sql.SQL(" AND ").join(
+                sql.SQL("t.{column} = s.{column}").format(column=sql.Identifier(column))
+                for column in columns
+            ),
+        )
+        for index, columns in enumerate(checks)
+    ]
+    # Conflicting rows are removed from the staging table in the same
+    # statement, so the remainder can be copied without probing again.
+    pg_cursor.execute(
+        sql.SQL(
+            "WITH conflicts AS ("
+            "SELECT s.migration_row, c.check_index, c.existing_pk, {details} FROM {staging} AS s "
+            "CROSS JOIN LATERAL ("
+            "SELECT * FROM ({probes}) AS p ORDER BY p.check_index LIMIT 1"
+            ") AS c"
+            "), removed AS ("
+            "DELETE FROM {staging} AS s USING conflicts WHERE s.migration_row = conflicts.migration_row"
+            ") SELECT * FROM conflicts ORDER BY migration_row"
+        ).format(
+            details=sql.SQL(", ").join(
+                sql.SQL("s.{}").format(sql.Identifier(column)) for column in detail_columns
+            ),
+            staging=staging,
+            probes=sql.SQL(" UNION ALL ").join(probes),
+        )
+    )
+    conflicts = []
+    for _, check_index, existing_pk, *values in pg_cursor.fetchall():
+        row = dict(zip(detail_columns, values))
+        conflicts.append(_skipped_record(table, row, checks[check_index], existing_pk))
+    return conflicts
+
+
+def _skipped_record(
+    table: TableSpec,
+    row: Dict[str, object],
+    columns: Sequence[str],
+    existing_pk: object,
+) -> SkippedRecord:
+    if tuple(columns) == (table.pk,):
+        return SkippedRecord(
+            table=table.name,
+            reason=f"primary key {table.pk} collision",
+            details={table.pk: row.get(table.pk)},
+        )
+    details = {column: row.get(column) for column in columns}
+    details[table.pk] = existing_pk
+    return SkippedRecord(
+        table=table.name,
+        reason="unique constraint conflict",
+        details=details,
+    )
+
+
+def _copy_value(value: object) -> str:
+    """Render ``value`` as a field of a ``COPY ... (FORMAT csv, NULL '\\N')`` stream.
+
+    Non-null values are always quoted, so they can never be mistaken for NULL.
+    """
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        text = "t" if value else "f"
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        text = "\\x" + bytes(value).hex()
+    elif isinstance(value, (datetime.date, datetime.time)):
+        text = value.isoformat()
+    else:
+        text = str(value)
+    return '"' + text.replace('"', '""') + '"'
+
+
+class CopyPipe(io.RawIOBase):
+    """Readable stream that renders staged rows as COPY CSV on demand.
+
+    ``copy_expert`` pulls fixed-size chunks and rows are rendered only as
+    needed to fill the next one, so the CSV text of a batch is never held in
+    memory as a whole.
+    """
+
+    def __init__(self, rows: Sequence[Tuple[object, ...]]) -> None:
+        super().__init__()
+        self.rows = iter(enumerate(rows))
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            item = next(self.rows, None)
+            if item is None:
+                break
+            index, row = item
+            fields = [str(index)] + [_copy_value(value) for value in row]
+            self._buffer += (",".join(fields) + "\n").encode("utf-8")
+        if size < 0:
+            size = len(self._buffer)
+        chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
+
+
+def _stage_with_insert(
+    pg_cursor: psycopg2.extensions.cursor,
+    stage_query: sql.Composed,
+    batch: Sequence[Tuple[object, ...]],
+) -> None:
+    psycopg2.extras.execute_values(
+        pg_cursor,
+        stage_query.as_string(pg_cursor),
+        [(index,) + row for index, row in enumerate(batch)],
+        page_size=len(batch),
+    )
+
+
+def _stage_with_copy(
+    pg_cursor: psycopg2.extensions.cursor,
+    staging: sql.Identifier,
+    column_order: Sequence[str],
+    batch: Sequence[Tuple[object, ...]],
+) -> None:
+    pg_cursor.copy_expert(
+        sql.SQL(
+            "COPY {staging} (migration_row, {columns}) FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+        ).format(
+            staging=staging,
+            columns=sql.SQL(", ").join(map(sql.Identifier, column_order)),
+        ),
+        CopyPipe(batch),
+    )
+
+
+class _End:
+    """Queue marker for the end of the source rows."""
+
+
+class BatchReader(threading.Thread):
+    """Read source rows from an unbuffered MySQL cursor into a bounded queue.
+
+    Rows are converted by ``project`` into the staged tuples; rows it rejects
+    are reported as skipped records of ``table``. Each batch carries the
+    primary key of its last source row. Because the queue holds at most
+    ``queue_depth`` batches, MySQL reads ahead while PostgreSQL writes, but
+    never by more than that.
+    """
+
+    def __init__(
+        self,
+        mysql_cursor: pymysql.cursors.SSCursor,
+        table: TableSpec,
+        source_columns: Sequence[str],
+        project: Callable[[Tuple[object, ...]], Tuple[object, ...]],
+        batch_size: int,
+        queue_depth: int = DEFAULT_QUEUE_DEPTH,
+    ) -> None:
+        super().__init__(name="mysql-reader", daemon=True)
+        self.mysql_cursor = mysql_cursor
+        self.table = table
+        self.pk_position = (
+            source_columns.index(table.pk) if table.pk in source_columns else None
+        )
+        self.project = project
+        self.batch_size = batch_size
+        self.batches: "queue.Queue[object]" = queue.Queue(maxsize=queue_depth)
+        self.stopped = threading.Event()
+
+    def run(self) -> None:
+        try:
+            while not self.stopped.is_set():
+                rows = self.mysql_cursor.fetchmany(self.batch_size)
+                if not rows:
+                    break
+                last_pk = rows[-1][self.pk_position] if self.pk_position is not None else None
+                self._put(self._convert(rows) + (last_pk,))
+        except Exception as exc:  # handed to the consumer thread
+            self._put(exc)
+        finally:
+            self._put(_End)
+
+    def __iter__(
+        self,
+    ) -> Iterator[Tuple[List[Tuple[object, ...]], List[SkippedRecord], object]]:
+        """Yield ``(rows, rejected, last_pk)`` per batch.
+
+        ``last_pk`` is the source key of the last row read, rejected or not.
+        """
+        while True:
+            item = self.batches.get()
+            if item is _End:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+    def stop(self) -> None:
+        self.stopped.set()
+        self.join()
+
+    def _convert(
+        self, rows: Sequence[Tuple[object, ...]]
+    ) -> Tuple[List[Tuple[object, ...]], List[SkippedRecord]]:
+        converted: List[Tuple[object, ...]] = []
+        rejected: List[SkippedRecord] = []
+        for row in rows:
+            try:
+                converted.append(self.project(row))
+            except RowRejected as exc:
+                details: Dict[str, object] = {}
+                if self.pk_position is not None:
+                    details[self.table.pk] = row[self.pk_position]
+                details.update(exc.details)
+                rejected.append(
+                    SkippedRecord(table=self.table.name, reason=exc.reason, details=details)
+                )
+        return converted, rejected
+
+    def _put(self, item: object) -> None:
+        while not self.stopped.is_set():
+            try:
+                self.batches.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+
+
+def _abandon_unbuffered_query(
+    mysql_conn: pymysql.connections.Connection, mysql_cursor: pymysql.cursors.SSCursor
+) -> None:
+    """Drop ``mysql_conn`` instead of draining the rest of an unbuffered result.
+
+    ``SSCursor.close()``, which also runs on garbage collection, reads every
+    remaining row before it returns. After a failure in the middle of a large
+    table that takes about as long as the migration itself. Closing the socket
+    discards the rows and stops the server-side query. Detaching the cursor
+    keeps its ``close()`` from reading from the closed connection.
+    """
+    if mysql_conn.open:
+        mysql_conn.close()
+    mysql_cursor.connection = None
+
+
+def _source_relation(table: TableSpec) -> str:
+    """Return the MySQL ``FROM`` target for ``table``, wrapping ``SELECT`` sources."""
+    source = (table.source or table.name).strip()
+    if source.split(None, 1)[0].upper() in ("SELECT", "WITH"):
+        return f"({source}) AS src"
+    return source
+
+
+def _load_lookups(
+    pg_cursor: psycopg2.extensions.cursor, table: TableSpec
+) -> Dict[str, Dict[str, object]]:
+    """Read the code -> id map behind every lookup of ``table``."""
+    maps: Dict[str, Dict[str, object]] = {}
+    for column, lookup in table.lookups.items():
+        pg_cursor.execute(
+            sql.SQL("SELECT {key}, {value} FROM {table} WHERE {key} IS NOT NULL").format(
+                key=sql.Identifier(lookup.key),
+                value=sql.Identifier(lookup.value),
+                table=sql.Identifier(lookup.table),
+            )
+        )
+        normalize = lookup.normalize or str
+        maps[column] = {normalize(str(key)): value for key, value in pg_cursor.fetchall()}
+    return maps
+
+
+def _row_projector(
+    table: TableSpec,
+    source_columns: Sequence[str],
+    column_order: Sequence[str],
+    lookup_maps: Mapping[str, Mapping[str, object]],
+) -> Callable[[Tuple[object, ...]], Tuple[object, ...]]:
+    """Return a function turning a source row into the staged tuple.
+
+    Per column, booleans are converted first, then the transform runs, then
+    the lookup maps the result to an id.
+    """
+    boolean_set = set(table.boolean_columns)
+    steps = [
+        (
+            column,
+            source_columns.index(column),
+            column in boolean_set,
+            table.transforms.get(column),
+            table.lookups.get(column),
+            lookup_maps.get(column, {}),
+        )
+        for column in column_order
+    ]
+
+    def project(row: Tuple[object, ...]) -> Tuple[object, ...]:
+        values = []
+        for column, position, is_boolean, transform, lookup, mapping in steps:
+            value = row[position]
+            if is_boolean:
+                value = _convert_boolean(value)
+            if transform is not None:
+                try:
+                    value = transform(value)
+                except (TypeError, ValueError) as exc:
+                    raise RowRejected(f"invalid {column}", {column: row[position]}) from exc
+            if lookup is not None and value is not None:
+                key = (lookup.normalize or str)(str(value))
+                if key in mapping:
+                    value = mapping[key]
+                elif lookup.required:
+                    raise RowRejected(f"unknown {lookup.table} code", {column: value})
+                else:
+                    value = None
+            elif lookup is not None and lookup.required:
+                raise RowRejected(f"missing {column}", {column: None})
+            values.append(value)
+        return tuple(values)
+
+    return project
 
 
 def _reset_identity(pg_cursor: psycopg2.extensions.cursor, table: TableSpec) -> None:
@@ -274,75 +874,348 @@ def _get_postgres_columns(
     return [row[0] for row in pg_cursor.fetchall()]
 
 
+def _column_order(
+    table: TableSpec, destination_columns: Sequence[str], source_columns: Sequence[str]
+) -> List[str]:
+    """Return the columns copied for ``table``: present on both sides and not ignored."""
+    destination_column_set = set(destination_columns)
+    source_column_set = set(source_columns)
+    ignore_set = set(table.ignore_columns)
+    preferred_order = list(table.columns) if table.columns else list(destination_columns)
+    if not preferred_order:
+        preferred_order = list(source_columns)
+    column_order = [
+        column
+        for column in preferred_order
+        if column in destination_column_set
+        and column in source_column_set
+        and column not in ignore_set
+    ]
+    if not column_order:
+        raise MigrationError(
+            f"No common columns found for table {table.name}."
+        )
+    return column_order
+
+
+CHECKPOINT_TABLE_DDL = """
+    CREATE TABLE IF NOT EXISTS migration_checkpoint (
+        table_name TEXT NOT NULL,
+        part TEXT NOT NULL,
+        last_pk BIGINT,
+        rows_inserted BIGINT NOT NULL DEFAULT 0,
+        rows_skipped BIGINT NOT NULL DEFAULT 0,
+        completed_at TIMESTAMPTZ,
+        updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+        PRIMARY KEY (table_name, part)
+    )
+"""
+
+
+def _checkpoint_part(pk_range: Optional[Tuple[int, int]]) -> str:
+    return f"{pk_range[0]}-{pk_range[1]}" if pk_range else "*"
+
+
+def _load_checkpoint(
+    pg_cursor: psycopg2.extensions.cursor, table: TableSpec, part: str
+) -> Tuple[Optional[int], bool]:
+    """Return ``(last_pk, completed)`` recorded for ``table``/``part``."""
+    pg_cursor.execute(
+        "SELECT last_pk, completed_at IS NOT NULL FROM migration_checkpoint"
+        " WHERE table_name = %s AND part = %s",
+        (table.name, part),
+    )
+    row = pg_cursor.fetchone()
+    return (row[0], row[1]) if row else (None, False)
+
+
+def _save_checkpoint(
+    pg_cursor: psycopg2.extensions.cursor,
+    table: TableSpec,
+    part: str,
+    last_pk: Optional[int],
+    inserted: int,
+    skipped: int,
+    completed: bool = False,
+) -> None:
+    """Advance the checkpoint; runs in the transaction that commits the batch."""
+    pg_cursor.execute(
+        """
+        INSERT INTO migration_checkpoint AS mc
+            (table_name, part, last_pk, rows_inserted, rows_skipped, completed_at)
+        VALUES (%s, %s, %s, %s, %s, CASE WHEN %s THEN NOW() END)
+        ON CONFLICT (table_name, part) DO UPDATE
+        SET last_pk = COALESCE(EXCLUDED.last_pk, mc.last_pk),
+            rows_inserted = mc.rows_inserted + EXCLUDED.rows_inserted,
+            rows_skipped = mc.rows_skipped + EXCLUDED.rows_skipped,
+            completed_at = EXCLUDED.completed_at,
+            updated_at = NOW()
+        """,
+        (table.name, part, last_pk, inserted, skipped, completed),
+    )
+
+
+@dataclass
+class TableProgress:
+    """Counters for one migrated table, summed over its PK ranges."""
+
+    expected: int = 0
+    read: int = 0
+    inserted: int = 0
+    skipped: Dict[str, int] = field(default_factory=dict)
+    resumed_parts: int = 0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    def rate(self, now: float) -> float:
+        if self.started_at is None:
+            return 0.0
+        elapsed = (self.finished_at or now) - self.started_at
+        return self.read / elapsed if elapsed > 0 else 0.0
+
+
+class MigrationProgress:
+    """Thread-safe progress counters with a periodic log reporter."""
+
+    def __init__(self, interval: float = 10.0) -> None:
+        self.interval = interval
+        self.tables: Dict[str, TableProgress] = {}
+        self.started_at = time.monotonic()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._reporter = threading.Thread(
+            target=self._report_loop, name="migration-progress", daemon=True
+        )
+
+    def start(self) -> None:
+        if self.interval > 0:
+            self._reporter.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._reporter.is_alive():
+            self._reporter.join()
+
+    def begin(self, table: str, expected: int, resumed: bool) -> None:
+        with self._lock:
+            entry = self.tables.setdefault(table, TableProgress())
+            entry.expected += expected
+            entry.resumed_parts += int(resumed)
+            if entry.started_at is None:
+                entry.started_at = time.monotonic()
+            entry.finished_at = None
+
+    def record_batch(
+        self, table: str, read: int, inserted: int, skipped: Sequence[SkippedRecord]
+    ) -> None:
+        with self._lock:
+            entry = self.tables[table]
+            entry.read += read
+            entry.inserted += inserted
+            for record in skipped:
+                entry.skipped[record.reason] = entry.skipped.get(record.reason, 0) + 1
+
+    def finish(self, table: str) -> None:
+        with self._lock:
+            entry = self.tables.setdefault(table, TableProgress())
+            entry.finished_at = time.monotonic()
+        LOGGER.info("%s", self._describe(table, entry, time.monotonic()))
+
+    def summary(self) -> Dict[str, object]:
+        now = time.monotonic()
+        with self._lock:
+            tables = {
+                name: {
+                    "rows_expected": entry.expected,
+                    "rows_read": entry.read,
+                    "rows_inserted": entry.inserted,
+                    "rows_skipped": sum(entry.skipped.values()),
+                    "skipped_by_reason": dict(entry.skipped),
+                    "resumed_parts": entry.resumed_parts,
+                    "elapsed_seconds": round(
+                        (entry.finished_at or now) - entry.started_at if entry.started_at else 0.0,
+                        3,
+                    ),
+                    "rows_per_second": round(entry.rate(now), 1),
+                    "completed": entry.finished_at is not None,
+                }
+                for name, entry in self.tables.items()
+            }
+        return {
+            "elapsed_seconds": round(now - self.started_at, 3),
+            "rows_inserted": sum(entry["rows_inserted"] for entry in tables.values()),
+            "rows_skipped": sum(entry["rows_skipped"] for entry in tables.values()),
+            "tables": tables,
+        }
+
+    def _report_loop(self) -> None:
+        while not self._stopped.wait(self.interval):
+            now = time.monotonic()
+            with self._lock:
+                active = [
+                    (name, entry)
+                    for name, entry in self.tables.items()
+                    if entry.started_at is not None and entry.finished_at is None
+                ]
+                lines = [self._describe(name, entry, now) for name, entry in active]
+            for line in lines:
+                LOGGER.info("%s", line)
+
+    @staticmethod
+    def _describe(name: str, entry: TableProgress, now: float) -> str:
+        rate = entry.rate(now)
+        parts = [f"{name}: {entry.read}/{entry.expected} rows"]
+        if entry.expected:
+            parts.append(f"({min(entry.read / entry.expected, 1.0):.1%})")
+        parts.append(f"{rate:.0f} rows/s")
+        if entry.finished_at is None and rate > 0 and entry.expected > entry.read:
+            eta = datetime.timedelta(seconds=round((entry.expected - entry.read) / rate))
+            parts.append(f"ETA {eta}")
+        if entry.skipped:
+            reasons = ", ".join(
+                f"{reason}: {count}" for reason, count in sorted(entry.skipped.items())
+            )
+            parts.append(f"skipped {sum(entry.skipped.values())} ({reasons})")
+        return " ".join(parts)
+
+
 def migrate_table(
     mysql_conn: pymysql.connections.Connection,
     pg_conn: psycopg2.extensions.connection,
     table: TableSpec,
     batch_size: int,
     skipped: List[SkippedRecord],
-) -> None:
-    LOGGER.info("Migrating table %s", table.name)
+    mode: str = "insert",
+    pk_range: Optional[Tuple[int, int]] = None,
+    reset_identity: bool = True,
+    checkpoints: bool = False,
+    progress: Optional[MigrationProgress] = None,
+) -> int:
+    """Copy ``table`` (or the half-open ``pk_range`` of it) and return the rows inserted.
+
+    With ``checkpoints`` the last committed source key is stored in
+    ``migration_checkpoint`` with every batch, and a rerun resumes after it.
+    """
+    if pk_range:
+        LOGGER.info("Migrating table %s, %s in [%d, %d)", table.name, table.pk, *pk_range)
+    else:
+        LOGGER.info("Migrating table %s", table.name)
     inserted = 0
+    part = _checkpoint_part(pk_range)
     with pg_conn.cursor() as pg_cursor:
         destination_columns = _get_postgres_columns(pg_cursor, table.name)
-    destination_column_set = set(destination_columns)
-    with mysql_conn.cursor() as mysql_cursor:
+        lookup_maps = _load_lookups(pg_cursor, table)
+        resume_after, completed = (
+            _load_checkpoint(pg_cursor, table, part) if checkpoints else (None, False)
+        )
+    pg_conn.commit()
+    if completed:
+        LOGGER.info("Skipping %s (%s): checkpoint marks it complete", table.name, part)
+        return 0
+    if resume_after is not None:
+        LOGGER.info("Resuming %s after %s = %s", table.name, table.pk, resume_after)
+    conditions: List[str] = []
+    params: List[object] = []
+    if pk_range:
+        conditions.append(f"{table.pk} >= %s AND {table.pk} < %s")
+        params.extend(pk_range)
+    if resume_after is not None:
+        conditions.append(f"{table.pk} > %s")
+        params.append(resume_after)
+    where_clause = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+    source = _source_relation(table)
+    if progress:
+        with mysql_conn.cursor() as count_cursor:
+            count_cursor.execute(f"SELECT COUNT(*) FROM {source}{where_clause}", params)
+            progress.begin(table.name, int(count_cursor.fetchone()[0]), resume_after is not None)
+    mysql_cursor = mysql_conn.cursor(pymysql.cursors.SSCursor)
+    try:
         select_clause = (
             ", ".join(table.columns) if table.columns else "*"
         )
         mysql_cursor.execute(
-            f"SELECT {select_clause} FROM {table.name} ORDER BY {table.pk}"
+            f"SELECT {select_clause} FROM {source}{where_clause} ORDER BY {table.pk}",
+            params,
         )
         source_columns = [desc[0] for desc in mysql_cursor.description]
-        source_column_set = set(source_columns)
-        ignore_set = set(table.ignore_columns)
-        preferred_order = list(table.columns) if table.columns else list(destination_columns)
-        if not preferred_order:
-            preferred_order = source_columns
-        column_order = [
-            column
-            for column in preferred_order
-            if column in destination_column_set
-            and column in source_column_set
-            and column not in ignore_set
-        ]
-        if not column_order:
+        column_order = _column_order(table, destination_columns, source_columns)
+        if (table.provenance or table.parent) and table.pk not in column_order:
+            raise MigrationError(f"Source of {table.name} must provide {table.pk}.")
+        if table.parent and table.parent.column not in column_order:
             raise MigrationError(
-                f"No common columns found for table {table.name}."
+                f"Source of {table.name} must provide {table.parent.column}."
             )
-        while True:
-            rows = mysql_cursor.fetchmany(batch_size)
-            if not rows:
-                break
-            pg_cursor = pg_conn.cursor()
-            try:
-                to_insert: List[Tuple[object, ...]] = []
-                for row in rows:
-                    _convert_booleans(row, table.boolean_columns)
-                    conflict = _check_conflicts(pg_cursor, table, row)
-                    if conflict:
+        checks = _conflict_checks(table, column_order)
+        with pg_conn.cursor() as pg_cursor:
+            staging = _create_staging_table(pg_cursor, table, column_order)
+        pg_conn.commit()
+        insert_query = _insert_query(table, staging, column_order)
+        stage_query = sql.SQL("INSERT INTO {staging} (migration_row, {columns}) VALUES %s").format(
+            staging=staging,
+            columns=sql.SQL(", ").join(map(sql.Identifier, column_order)),
+        )
+        reader = BatchReader(
+            mysql_cursor,
+            table,
+            source_columns,
+            _row_projector(table, source_columns, column_order, lookup_maps),
+            batch_size,
+        )
+        reader.start()
+        try:
+            for batch, rejected, last_pk in reader:
+                pg_cursor = pg_conn.cursor()
+                try:
+                    conflicts = list(rejected)
+                    batch_inserted = 0
+                    if batch:
+                        if mode == "copy":
+                            _stage_with_copy(pg_cursor, staging, column_order, batch)
+                        else:
+                            _stage_with_insert(pg_cursor, stage_query, batch)
+                        conflicts += _remove_unlinked(pg_cursor, table, staging)
+                        conflicts += _find_conflicts(pg_cursor, table, staging, checks)
+                        pg_cursor.execute(insert_query)
+                        batch_inserted = pg_cursor.rowcount
+                    for conflict in conflicts:
                         skipped.append(conflict)
                         LOGGER.warning("Skipping row: %s", conflict.as_message())
-                        continue
-                    values = tuple(row.get(column) for column in column_order)
-                    to_insert.append(values)
-                if to_insert:
-                    psycopg2.extras.execute_values(
-                        pg_cursor,
-                        f"INSERT INTO {table.name} ({', '.join(column_order)}) VALUES %s",
-                        to_insert,
-                    )
-                    inserted += len(to_insert)
-                pg_conn.commit()
-            except Exception:
-                pg_conn.rollback()
-                raise
-            finally:
-                pg_cursor.close()
-            LOGGER.debug("Processed batch of %d rows from %s", len(rows), table.name)
+                    if checkpoints:
+                        _save_checkpoint(
+                            pg_cursor,
+                            table,
+                            part,
+                            last_pk if isinstance(last_pk, int) else None,
+                            batch_inserted,
+                            len(conflicts),
+                        )
+                    # Committing also empties the staging table.
+                    pg_conn.commit()
+                    inserted += batch_inserted
+                    if progress:
+                        progress.record_batch(
+                            table.name, len(batch) + len(rejected), batch_inserted, conflicts
+                        )
+                except Exception:
+                    pg_conn.rollback()
+                    raise
+                finally:
+                    pg_cursor.close()
+                LOGGER.debug("Processed batch of %d rows from %s", len(batch), table.name)
+        finally:
+            reader.stop()
+    except BaseException:
+        _abandon_unbuffered_query(mysql_conn, mysql_cursor)
+        raise
+    # Every row has been read, so closing does not drain anything.
+    mysql_cursor.close()
     pg_cursor = pg_conn.cursor()
     try:
-        _reset_identity(pg_cursor, table)
+        pg_cursor.execute(sql.SQL("DROP TABLE IF EXISTS {}").format(staging))
+        if reset_identity:
+            _reset_identity(pg_cursor, table)
+        if checkpoints:
+            _save_checkpoint(pg_cursor, table, part, None, 0, 0, completed=True)
         pg_conn.commit()
     except Exception:
         pg_conn.rollback()
@@ -350,10 +1223,432 @@ def migrate_table(
     finally:
         pg_cursor.close()
     LOGGER.info("Inserted %d rows into %s", inserted, table.name)
+    return inserted
+
+
+def _table_dependencies(
+    pg_cursor: psycopg2.extensions.cursor, tables: Sequence[TableSpec]
+) -> Dict[str, Set[str]]:
+    """Map each table to the other migrated tables it references by foreign key."""
+    names = [table.name for table in tables]
+    pg_cursor.execute(
+        """
+        SELECT child.relname, parent.relname
+        FROM pg_constraint AS con
+        JOIN pg_class AS child ON child.oid = con.conrelid
+        JOIN pg_class AS parent ON parent.oid = con.confrelid
+        JOIN pg_namespace AS ns ON ns.oid = child.relnamespace
+        WHERE con.contype = 'f'
+          AND ns.nspname = current_schema()
+          AND child.relname = ANY(%s)
+          AND parent.relname = ANY(%s)
+          AND child.oid <> parent.oid
+        """,
+        (names, names),
+    )
+    dependencies: Dict[str, Set[str]] = {name: set() for name in names}
+    for child, parent in pg_cursor.fetchall():
+        dependencies[child].add(parent)
+    return dependencies
+
+
+def _pk_ranges(
+    mysql_conn: pymysql.connections.Connection, table: TableSpec, split_rows: int
+) -> List[Optional[Tuple[int, int]]]:
+    """Split ``table`` into half-open ranges spanning ``split_rows`` primary key values.
+
+    Tables with a non-integer key or a span below ``split_rows`` are migrated
+    as a single unit (``[None]``).
+    """
+    if split_rows <= 0:
+        return [None]
+    with mysql_conn.cursor() as mysql_cursor:
+        mysql_cursor.execute(
+            f"SELECT MIN({table.pk}), MAX({table.pk}) FROM {_source_relation(table)}"
+        )
+        low, high = mysql_cursor.fetchone()
+    if not isinstance(low, int) or not isinstance(high, int) or high - low < split_rows:
+        return [None]
+    return [(start, min(start + split_rows, high + 1)) for start in range(low, high + 1, split_rows)]
+
 
+def migrate_tables(
+    mysql_params: Dict[str, object],
+    postgres_params: Dict[str, object],
+    tables: Sequence[TableSpec],
+    batch_size: int,
+    mode: str = "insert",
+    jobs: int = 1,
+    split_rows: int = 0,
+    checkpoints: bool = False,
+    restart: bool = False,
+    progress: Optional[MigrationProgress] = None,
+) -> List[SkippedRecord]:
+    """Migrate ``tables`` on ``jobs`` workers, starting each once its FK parents are done.
+
+    With ``split_rows`` large tables are divided into primary key ranges that
+    are migrated concurrently. Ranges of one table cannot collide with each
+    other because the source enforces the same keys and unique constraints.
+    ``checkpoints`` makes the run resumable; ``restart`` discards the
+    checkpoints of ``tables`` first.
+    """
+    skipped: List[SkippedRecord] = []
+    opened: List[object] = []
+    opened_lock = threading.Lock()
+    local = threading.local()
+
+    def run_part(table: TableSpec, pk_range: Optional[Tuple[int, int]]) -> int:
+        # Each worker thread keeps its own pair of connections. A failed part
+        # drops its MySQL connection (see _abandon_unbuffered_query).
+        if getattr(local, "pg_conn", None) is None:
+            local.mysql_conn = open_mysql_connection(mysql_params)
+            local.pg_conn = open_postgres_connection(postgres_params)
+            local.pg_conn.autocommit = False
+            with opened_lock:
+                opened.extend((local.mysql_conn, local.pg_conn))
+        elif not local.mysql_conn.open:
+            local.mysql_conn = open_mysql_connection(mysql_params)
+            with opened_lock:
+                opened.append(local.mysql_conn)
+        return migrate_table(
+            local.mysql_conn,
+            local.pg_conn,
+            table,
+            batch_size,
+            skipped,
+            mode,
+            pk_range=pk_range,
+            reset_identity=pk_range is None,
+            checkpoints=checkpoints,
+            progress=progress,
+        )
+
+    with open_mysql_connection(mysql_params) as mysql_conn, closing(
+        open_postgres_connection(postgres_params)
+    ) as pg_conn:
+        with pg_conn.cursor() as pg_cursor:
+            dependencies = _table_dependencies(pg_cursor, tables)
+            if checkpoints:
+                pg_cursor.execute(CHECKPOINT_TABLE_DDL)
+                if restart:
+                    pg_cursor.execute(
+                        "DELETE FROM migration_checkpoint WHERE table_name = ANY(%s)",
+                        ([table.name for table in tables],),
+                    )
+        pg_conn.commit()
+        parts = {table.name: _pk_ranges(mysql_conn, table, split_rows) for table in tables}
+
+        pending = list(tables)
+        remaining_parts: Dict[str, int] = {}
+        done: Set[str] = set()
+        running: Dict[Future, TableSpec] = {}
+        try:
+            with ThreadPoolExecutor(max_workers=max(jobs, 1), thread_name_prefix="migrate") as pool:
+                while pending or running:
+                    ready = [table for table in pending if dependencies[table.name] <= done]
+                    for table in ready:
+                        pending.remove(table)
+                        remaining_parts[table.name] = len(parts[table.name])
+                        for pk_range in parts[table.name]:
+                            running[pool.submit(run_part, table, pk_range)] = table
+                    if not running:
+                        names = ", ".join(table.name for table in pending)
+                        raise MigrationError(f"Circular foreign keys between: {names}")
+                    finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        table = running.pop(future)
+                        try:
+                            future.result()
+                        except Exception:
+                            for other in running:
+                                other.cancel()
+                            raise
+                        remaining_parts[table.name] -= 1
+                        if remaining_parts[table.name]:
+                            continue
+                        if len(parts[table.name]) > 1:
+                            with pg_conn.cursor() as pg_cursor:
+                                _reset_identity(pg_cursor, table)
+                            pg_conn.commit()
+                        if progress:
+                            progress.finish(table.name)
+                        done.add(table.name)
+        finally:
+            for connection in opened:
+                if isinstance(connection, pymysql.connections.Connection) and not connection.open:
+                    continue
+                connection.close()
+    return skipped
+
+
+# Ranges spanning at most this many keys are compared row by row.
+DEFAULT_VERIFY_LEAF_KEYS = 1000
+# Sub-ranges checksummed per query when a range differs.
+DEFAULT_VERIFY_FANOUT = 16
+# Differing keys listed per table in the summary.
+VERIFY_REPORT_LIMIT = 1000
+
+_TIMESTAMP_TYPES = {"timestamp with time zone", "timestamp without time zone"}
+
+
+@dataclass
+class TableVerification:
+    """Result of comparing one table between MySQL and PostgreSQL."""
+
+    table: str
+    status: str = "match"
+    note: Optional[str] = None
+    source_rows: int = 0
+    target_rows: int = 0
+    queries: int = 0
+    ranges_compared: int = 0
+    differences: Dict[str, int] = field(default_factory=dict)
+    keys: List[Dict[str, object]] = field(default_factory=list)
+
+    def record(self, kind: str, pk: object) -> None:
+        self.status = "mismatch"
+        self.differences[kind] = self.differences.get(kind, 0) + 1
+        if len(self.keys) < VERIFY_REPORT_LIMIT:
+            self.keys.append({"pk": pk, "kind": kind})
+
+
+def _normalized_value(column: str, data_type: str, is_boolean: bool, dialect: str) -> str:
+    """Return an SQL expression rendering ``column`` identically on both engines.
+
+    NULL and the empty string stay distinguishable, booleans become 0/1 and
+    timestamps are printed in UTC with microseconds (MySQL datetimes are
+    assumed to hold UTC, as Django writes them with ``USE_TZ``).
+    """
+    if dialect == "mysql":
+        quoted = "`" + column.replace("`", "``") + "`"
+        if data_type in _TIMESTAMP_TYPES:
+            text = f"DATE_FORMAT({quoted}, '%%Y-%%m-%%d %%H:%%i:%%s.%%f')"
+        elif data_type == "date":
+            text = f"DATE_FORMAT({quoted}, '%%Y-%%m-%%d')"
+        else:
+            text = f"CAST({quoted} AS CHAR)"
+    else:
+        quoted = '"' + column.replace('"', '""') + '"'
+        if data_type == "timestamp with time zone":
+            text = f"to_char({quoted} AT TIME ZONE 'UTC', 'YYYY-MM-DD HH24:MI:SS.US')"
+        elif data_type == "timestamp without time zone":
+            text = f"to_char({quoted}, 'YYYY-MM-DD HH24:MI:SS.US')"
+        elif data_type == "date":
+            text = f"to_char({quoted}, 'YYYY-MM-DD')"
+        else:
+            text = f"{quoted}::text"
+    if is_boolean or data_type == "boolean":
+        text = f"CASE WHEN {quoted} THEN '1' ELSE '0' END"
+    return f"CASE WHEN {quoted} IS NULL THEN 'n' ELSE CONCAT('v', {text}) END"
+
+
+def _row_hash(columns: Sequence[Tuple[str, str, bool]], dialect: str) -> str:
+    values = ", ".join(
+        _normalized_value(column, data_type, is_boolean, dialect)
+        for column, data_type, is_boolean in columns
+    )
+    return f"MD5(CONCAT_WS('|', {values}))"
+
+
+def _hash_term(row_hash: str, dialect: str) -> str:
+    """Map a row hash to a 60-bit integer; summed, it gives an order-independent checksum."""
+    if dialect == "mysql":
+        return f"CAST(CONV(SUBSTRING({row_hash}, 1, 15), 16, 10) AS UNSIGNED)"
+    return f"('x' || substr({row_hash}, 1, 15))::bit(60)::bigint"
+
+
+class _VerifySide:
+    """Checksum queries for one side of a verification (``mysql`` or ``postgres``)."""
+
+    def __init__(
+        self,
+        connection: object,
+        dialect: str,
+        relation: str,
+        pk: str,
+        columns: Sequence[Tuple[str, str, bool]],
+        result: TableVerification,
+    ) -> None:
+        self.connection = connection
+        self.dialect = dialect
+        self.relation = relation
+        self.pk = pk
+        self.row_hash = _row_hash(columns, dialect)
+        self.result = result
+
+    def _query(self, query: str, params: Sequence[object]) -> List[Tuple[object, ...]]:
+        self.result.queries += 1
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(query, params)
+            return list(cursor.fetchall())
+        finally:
+            cursor.close()
+
+    def extent(self) -> Tuple[object, object, int]:
+        ((low, high, count),) = self._query(
+            f"SELECT MIN({self.pk}), MAX({self.pk}), COUNT(*) FROM {self.relation}", ()
+        )
+        return low, high, int(count)
+
+    def checksum(self) -> Tuple[int, int]:
+        ((count, total),) = self._query(
+            f"SELECT COUNT(*), SUM({_hash_term(self.row_hash, self.dialect)}) "
+            f"FROM {self.relation}",
+            (),
+        )
+        return int(count), int(total or 0)
+
+    def buckets(self, low: int, high: int, step: int) -> Dict[int, Tuple[int, int]]:
+        """Return ``{bucket: (rows, checksum)}`` for ``[low, high)`` split every ``step`` keys."""
+        divide = "DIV" if self.dialect == "mysql" else "/"
+        rows = self._query(
+            f"SELECT ({self.pk} - %s) {divide} %s AS bucket, COUNT(*), "
+            f"SUM({_hash_term(self.row_hash, self.dialect)}) FROM {self.relation} "
+            f"WHERE {self.pk} >= %s AND {self.pk} < %s GROUP BY 1",
+            (low, step, low, high),
+        )
+        return {int(bucket): (int(count), int(total)) for bucket, count, total in rows}
+
+    def row_hashes(self, low: int, high: int) -> Dict[object, str]:
+        rows = self._query(
+            f"SELECT {self.pk}, {self.row_hash} FROM {self.relation} "
+            f"WHERE {self.pk} >= %s AND {self.pk} < %s",
+            (low, high),
+        )
+        return dict(rows)
+
+
+def verify_table(
+    mysql_conn: pymysql.connections.Connection,
+    pg_conn: psycopg2.extensions.connection,
+    table: TableSpec,
+    fanout: int = DEFAULT_VERIFY_FANOUT,
+    leaf_keys: int = DEFAULT_VERIFY_LEAF_KEYS,
+) -> TableVerification:
+    """Compare ``table`` on both sides by checksumming primary key ranges.
 
-def main() -> None:
-    args = parse_args()
+    Each range is split into ``fanout`` buckets whose row counts and summed
+    row hashes are computed by one grouped query per side; only buckets that
+    differ are split further, and ranges of at most ``leaf_keys`` keys are
+    compared row by row. Identical tables cost a handful of queries.
+    """
+    result = TableVerification(table.name)
+    if table.provenance or table.parent or table.transforms or table.lookups:
+        result.status = "skipped"
+        result.note = "rows are re-keyed or rewritten during migration"
+        return result
+    with pg_conn.cursor() as pg_cursor:
+        pg_cursor.execute(
+            """
+            SELECT column_name, data_type
+            FROM information_schema.columns
+            WHERE table_schema = current_schema()
+              AND table_name = %s
+            ORDER BY ordinal_position
+            """,
+            (table.name,),
+        )
+        data_types = dict(pg_cursor.fetchall())
+    pg_conn.commit()
+    source = _source_relation(table)
+    with mysql_conn.cursor() as mysql_cursor:
+        select_clause = ", ".join(table.columns) if table.columns else "*"
+        mysql_cursor.execute(f"SELECT {select_clause} FROM {source} LIMIT 0")
+        source_columns = [desc[0] for desc in mysql_cursor.description]
+        mysql_cursor.fetchall()
+    boolean_set = set(table.boolean_columns)
+    columns = [
+        (column, data_types[column], column in boolean_set)
+        for column in _column_order(table, list(data_types), source_columns)
+    ]
+    mysql_side = _VerifySide(mysql_conn, "mysql", source, table.pk, columns, result)
+    target = sql.Identifier(table.name).as_string(pg_conn)
+    pg_side = _VerifySide(pg_conn, "postgres", target, table.pk, columns, result)
+    try:
+        source_low, source_high, result.source_rows = mysql_side.extent()
+        target_low, target_high, result.target_rows = pg_side.extent()
+        lows = [value for value in (source_low, target_low) if value is not None]
+        highs = [value for value in (source_high, target_high) if value is not None]
+        if not lows:
+            return result
+        if not all(isinstance(value, int) for value in lows + highs):
+            # Without an integer key there is nothing to bisect.
+            if mysql_side.checksum() != pg_side.checksum():
+                result.status = "mismatch"
+                result.note = "checksums differ; primary key is not an integer"
+            return result
+        pending = [(min(lows), max(highs) + 1)]
+        while pending:
+            low, high = pending.pop()
+            result.ranges_compared += 1
+            if high - low <= leaf_keys:
+                _compare_rows(
+                    mysql_side.row_hashes(low, high), pg_side.row_hashes(low, high), result
+                )
+                continue
+            step = -(-(high - low) // max(fanout, 2))
+            source_buckets = mysql_side.buckets(low, high, step)
+            target_buckets = pg_side.buckets(low, high, step)
+            for bucket in sorted(set(source_buckets) | set(target_buckets), reverse=True):
+                if source_buckets.get(bucket) != target_buckets.get(bucket):
+                    start = low + bucket * step
+                    pending.append((start, min(start + step, high)))
+    finally:
+        pg_conn.rollback()
+    return result
+
+
+def _compare_rows(
+    source: Dict[object, str], target: Dict[object, str], result: TableVerification
+) -> None:
+    for pk in sorted(set(source) | set(target)):
+        if pk not in target:
+            result.record("missing in target", pk)
+        elif pk not in source:
+            result.record("not in source", pk)
+        elif source[pk] != target[pk]:
+            result.record("different values", pk)
+
+
+def verify_tables(
+    mysql_params: Dict[str, object],
+    postgres_params: Dict[str, object],
+    tables: Sequence[TableSpec],
+    fanout: int = DEFAULT_VERIFY_FANOUT,
+    leaf_keys: int = DEFAULT_VERIFY_LEAF_KEYS,
+) -> List[TableVerification]:
+    results = []
+    with open_mysql_connection(mysql_params) as mysql_conn, closing(
+        open_postgres_connection(postgres_params)
+    ) as pg_conn:
+        for table in tables:
+            LOGGER.info("Verifying table %s", table.name)
+            result = verify_table(mysql_conn, pg_conn, table, fanout, leaf_keys)
+            if result.status == "mismatch":
+                LOGGER.warning(
+                    "%s differs (%s rows in MySQL, %s in PostgreSQL): %s",
+                    table.name,
+                    result.source_rows,
+                    result.target_rows,
+                    ", ".join(f"{kind}: {count}" for kind, count in result.differences.items())
+                    or result.note,
+                )
+            elif result.status == "skipped":
+                LOGGER.info("Skipping %s: %s", table.name, result.note)
+            else:
+                LOGGER.info(
+                    "%s matches (%d rows, %d queries)",
+                    table.name,
+                    result.source_rows,
+                    result.queries,
+                )
+            results.append(result)
+    return results
+
+
+def main(table_specs: Sequence[TableSpec] = TABLE_SPECS, description: str = DESCRIPTION) -> None:
+    args = parse_args(description)
     logging.basicConfig(level=args.log_level.upper(), format="%(levelname)s: %(message)s")
     try:
         mysql_params = mysql_connection_kwargs(args.mysql_dsn)
@@ -365,13 +1660,47 @@ def main() -> None:
     LOGGER.debug("MySQL connection parameters resolved to: %s", mysql_params)
     LOGGER.debug("PostgreSQL connection parameters resolved to: %s", postgres_params)
 
-    skipped: List[SkippedRecord] = []
-    with open_mysql_connection(mysql_params) as mysql_conn, open_postgres_connection(
-        postgres_params
-    ) as pg_conn:
-        pg_conn.autocommit = False
-        for table in TABLE_SPECS:
-            migrate_table(mysql_conn, pg_conn, table, args.batch_size, skipped)
+    if args.command == "verify":
+        results = verify_tables(
+            mysql_params,
+            postgres_params,
+            table_specs,
+            fanout=args.verify_fanout,
+            leaf_keys=args.verify_leaf_keys,
+        )
+        _write_summary(
+            {
+                "tables": {
+                    result.table: {
+                        key: value for key, value in asdict(result).items() if key != "table"
+                    }
+                    for result in results
+                },
+                "queries": sum(result.queries for result in results),
+            },
+            args.summary_file,
+        )
+        if any(result.status == "mismatch" for result in results):
+            raise SystemExit(1)
+        return
+
+    progress = MigrationProgress(args.progress_interval)
+    progress.start()
+    try:
+        skipped = migrate_tables(
+            mysql_params,
+            postgres_params,
+            table_specs,
+            args.batch_size,
+            mode=args.mode,
+            jobs=args.jobs,
+            split_rows=args.split_rows,
+            checkpoints=args.resume,
+            restart=args.restart,
+            progress=progress,
+        )
+    finally:
+        progress.stop()
 
     if skipped:
         LOGGER.warning("%d records were skipped during migration:", len(skipped))
@@ -380,6 +1709,21 @@ def main() -> None:
     else:
         LOGGER.info("Migration completed without skipped records.")
 
+    summary = progress.summary()
+    summary["skipped"] = [
+        {"table": record.table, "reason": record.reason, "details": record.details}
+        for record in skipped
+    ]
+    _write_summary(summary, args.summary_file)
+
+
+def _write_summary(summary: Dict[str, object], path: Optional[str]) -> None:
+    output = json.dumps(summary, indent=2, default=str)
+    if path:
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(output + "\n")
+    else:
+        print(output)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,257 @@
+"""Utility to migrate legacy ReBEC trial records from MySQL into the ``ct`` schema.
+
+It reuses the batched, streaming machinery of ``migrate_auth_data``. Legacy
+trials receive new ``ct`` ids and every one of them is recorded in
+``ct_import_log`` (source system ``rebec``, source identifier = legacy id,
+payload = the imported row), which is also how child rows find their new
+parent id and how reruns recognise trials that were imported already.
+
+The source queries follow the legacy OpenTrials-based ReBEC dump
+(``repository_*`` and ``vocabulary_*`` tables); adjust them if a dump uses
+different names.
+"""
+from __future__ import annotations
+
+import datetime
+import re
+from typing import Optional, Sequence
+
+from database.migrate_auth_data import Lookup, ParentLink, TableSpec, main as _main
+
+
+SOURCE_SYSTEM = "rebec"
+
+DESCRIPTION = (
+    "Copy legacy ReBEC trials and their child records from MySQL into the ct "
+    "tables, recording the provenance of every trial in ct_import_log."
+)
+
+# Legacy recruitment status labels that do not normalise to a current code.
+LEGACY_RECRUITMENT_STATUS = {
+    "SUSPENDED": "ACTIVE_NOT_RECRUITING",
+    "ACTIVE": "ACTIVE_NOT_RECRUITING",
+    "WITHDRAWN": "TERMINATED",
+}
+
+# Legacy phase labels ("0", "1", "phase 2", ...). Combined phases and N/A
+# have no equivalent in vocabulary_study_phase and are imported as NULL.
+LEGACY_STUDY_PHASE = {
+    "0": "EARLY_PHASE1",
+    "1": "PHASE1",
+    "2": "PHASE2",
+    "3": "PHASE3",
+    "4": "PHASE4",
+}
+
+
+def _vocabulary_code(value: object) -> Optional[str]:
+    """Turn a legacy label such as ``"not yet recruiting"`` into ``NOT_YET_RECRUITING``."""
+    if value is None:
+        return None
+    code = re.sub(r"[^A-Z0-9]+", "_", str(value).upper()).strip("_")
+    return code or None
+
+
+def _recruitment_status(value: object) -> Optional[str]:
+    code = _vocabulary_code(value)
+    return LEGACY_RECRUITMENT_STATUS.get(code, code) if code else None
+
+
+def _study_phase(value: object) -> Optional[str]:
+    if value is None:
+        return None
+    label = re.sub(r"(?i)phase|\s+", "", str(value))
+    return LEGACY_STUDY_PHASE.get(label)
+
+
+def _outcome_type(value: object) -> str:
+    code = _vocabulary_code(value)
+    return code if code in ("PRIMARY", "SECONDARY") else "OTHER"
+
+
+def _legacy_date(value: object) -> Optional[datetime.date]:
+    """Parse the partial dates (``YYYY-MM`` or ``YYYY-MM-DD``) stored by the legacy forms."""
+    if value is None or isinstance(value, datetime.date):
+        return value
+    text = str(value).strip()
+    if not text:
+        return None
+    if re.fullmatch(r"\d{4}-\d{2}", text):
+        text += "-01"
+    return datetime.date.fromisoformat(text[:10])
+
+
+def _normalize_name(value: str) -> str:
+    """Python twin of the ``normalize_institution_name`` SQL function."""
+    return " ".join(value.split()).lower()
+
+
+COUNTRY = Lookup("vocabulary_country", key="iso_alpha2", normalize=str.upper)
+OPTIONAL_COUNTRY = Lookup(
+    "vocabulary_country", key="iso_alpha2", required=False, normalize=str.upper
+)
+INSTITUTION = Lookup(
+    "vocabulary_institution", key="name", required=False, normalize=_normalize_name
+)
+PARENT = ParentLink("ct_id", SOURCE_SYSTEM)
+
+
+TRIAL_TABLE_SPECS: Sequence[TableSpec] = (
+    TableSpec(
+        "ct",
+        source="""
+            SELECT
+                t.id,
+                COALESCE(NULLIF(t.trial_id, ''), CONCAT('LEGACY-', t.id)) AS register_id,
+                NULLIF(t.utrn_number, '') AS universal_trial_number,
+                COALESCE(NULLIF(t.public_title, ''), t.scientific_title) AS public_title,
+                t.scientific_title,
+                NULLIF(t.scientific_acronym, '') AS acronym,
+                rs.label AS recruitment_status_id,
+                sp.label AS study_phase_id,
+                t.target_sample_size AS enrollment_target,
+                COALESCE(t.enrollment_start_actual, t.enrollment_start_planned) AS study_start_date,
+                COALESCE(t.enrollment_end_actual, t.enrollment_end_planned) AS completion_date,
+                sponsor.name AS primary_sponsor_id,
+                1 AS is_imported,
+                t.status = 'published' AS is_public,
+                t.created AS created_at,
+                t.updated AS updated_at
+            FROM repository_clinicaltrial AS t
+            LEFT JOIN vocabulary_recruitmentstatus AS rs ON rs.id = t.recruitment_status_id
+            LEFT JOIN vocabulary_studyphase AS sp ON sp.id = t.phase_id
+            LEFT JOIN repository_institution AS sponsor ON sponsor.id = t.primary_sponsor_id
+        """,
+        unique_checks=(("register_id",),),
+        boolean_columns=("is_imported", "is_public"),
+        transforms={
+            "recruitment_status_id": _recruitment_status,
+            "study_phase_id": _study_phase,
+            "study_start_date": _legacy_date,
+            "completion_date": _legacy_date,
+        },
+        lookups={
+            "recruitment_status_id": Lookup("vocabulary_recruitment_status"),
+            "study_phase_id": Lookup("vocabulary_study_phase", required=False),
+            "primary_sponsor_id": INSTITUTION,
+        },
+        provenance=SOURCE_SYSTEM,
+    ),
+    TableSpec(
+        "ct_identifier",
+        # The target is unique per (trial, type, value); keep one row per pair.
+        source="""
+            SELECT
+                MIN(n.id) AS id,
+                n.trial_id AS ct_id,
+                'secondary' AS identifier_type,
+                n.id_number AS identifier_value,
+                MIN(n.issuing_authority) AS issuing_authority
+            FROM repository_trialnumber AS n
+            WHERE n.id_number <> ''
+            GROUP BY n.trial_id, n.id_number
+        """,
+        parent=PARENT,
+    ),
+    TableSpec(
+        "ct_location",
+        source="""
+            SELECT rc.id, rc.clinicaltrial_id AS ct_id, cc.label AS country_id
+            FROM repository_clinicaltrial_recruitment_country AS rc
+            JOIN vocabulary_countrycode AS cc ON cc.id = rc.countrycode_id
+        """,
+        lookups={"country_id": COUNTRY},
+        parent=PARENT,
+    ),
+    TableSpec(
+        "ct_condition",
+        source="""
+            SELECT
+                d.id,
+                d.trial_id AS ct_id,
+                COALESCE(NULLIF(d.text, ''), d.code) AS condition_name,
+                CASE WHEN d.vocabulary IN ('MeSH', 'DeCS') THEN NULLIF(d.code, '') END AS mesh_term
+            FROM repository_descriptor AS d
+            WHERE d.aspect = 'HealthCondition'
+        """,
+        parent=PARENT,
+    ),
+    TableSpec(
+        "ct_intervention",
+        source="""
+            SELECT d.id, d.trial_id AS ct_id, COALESCE(NULLIF(d.text, ''), d.code) AS name
+            FROM repository_descriptor AS d
+            WHERE d.aspect = 'Intervention'
+        """,
+        parent=PARENT,
+    ),
+    TableSpec(
+        "ct_contact",
+        # Three join tables share repository_contact; the key is made unique
+        # per role so batches can still be resumed by primary key.
+        source="""
+            SELECT
+                link.id * 3 + link.role_index AS id,
+                link.trial_id AS ct_id,
+                link.contact_role,
+                TRIM(CONCAT_WS(' ', c.firstname, NULLIF(c.middlename, ''), c.lastname))
+                    AS person_name,
+                NULLIF(c.email, '') AS email,
+                NULLIF(c.telephone, '') AS phone,
+                affiliation.name AS institution_id,
+                cc.label AS country_id
+            FROM (
+                SELECT id, trial_id, contact_id, 0 AS role_index, 'public' AS contact_role
+                FROM repository_publiccontact
+                UNION ALL
+                SELECT id, trial_id, contact_id, 1, 'scientific' FROM repository_scientificcontact
+                UNION ALL
+                SELECT id, trial_id, contact_id, 2, 'site' FROM repository_sitecontact
+            ) AS link
+            JOIN repository_contact AS c ON c.id = link.contact_id
+            LEFT JOIN repository_institution AS affiliation ON affiliation.id = c.affiliation_id
+            LEFT JOIN vocabulary_countrycode AS cc ON cc.id = c.country_id
+        """,
+        lookups={"institution_id": INSTITUTION, "country_id": OPTIONAL_COUNTRY},
+        parent=PARENT,
+    ),
+    TableSpec(
+        "ct_outcome",
+        source="""
+            SELECT
+                o.id,
+                o.trial_id AS ct_id,
+                o.interest AS outcome_type,
+                o.description AS title,
+                o.description
+            FROM repository_outcome AS o
+            WHERE o.description <> ''
+        """,
+        transforms={"outcome_type": _outcome_type},
+        parent=PARENT,
+    ),
+    TableSpec(
+        "ct_document",
+        source="""
+            SELECT
+                a.id,
+                a.trial_id AS ct_id,
+                'attachment' AS document_type,
+                NULLIF(a.description, '') AS description,
+                COALESCE(NULLIF(a.attach_url, ''), a.file) AS url,
+                NULLIF(a.file, '') AS file_name,
+                NOT a.public AS is_confidential
+            FROM repository_clinicaltrialattachment AS a
+        """,
+        boolean_columns=("is_confidential",),
+        parent=PARENT,
+    ),
+)
+
+
+def main() -> None:
+    _main(TRIAL_TABLE_SPECS, DESCRIPTION)
+
+
+if __name__ == "__main__":
+    main()
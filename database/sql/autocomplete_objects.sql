@@ -0,0 +1,37 @@
+-- Search keys and indexes behind the form autocomplete endpoints.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Function: autocomplete_key(p_text TEXT)
+-- Lower-cased, accent-free, whitespace-collapsed key ("São  Paulo" ->
+-- "sao paulo"). unaccent() is only STABLE because its dictionary could
+-- change; naming the dictionary makes the wrapper safe to index.
+
+CREATE OR REPLACE FUNCTION autocomplete_key(p_text TEXT)
+RETURNS TEXT AS $$
+    SELECT lower(unaccent('unaccent'::regdictionary, regexp_replace(btrim(p_text), '\s+', ' ', 'g')));
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+
+-- Prefix lookups are range scans ("key >= 'abc' AND key < 'abc' || chr(1114111)")
+-- on C-collated btree indexes, which also return rows in order so
+-- "ORDER BY ... LIMIT" stops early. The GiST trigram indexes serve the fuzzy
+-- fallback ordered by word-similarity distance ("<<->").
+
+CREATE INDEX IF NOT EXISTS vocabulary_institution_autocomplete_prefix_idx
+    ON vocabulary_institution ((autocomplete_key(name) COLLATE "C"));
+CREATE INDEX IF NOT EXISTS vocabulary_institution_autocomplete_trgm_idx
+    ON vocabulary_institution USING gist (autocomplete_key(name) gist_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS vocabulary_country_autocomplete_prefix_idx
+    ON vocabulary_country ((autocomplete_key(name) COLLATE "C"));
+CREATE INDEX IF NOT EXISTS vocabulary_country_autocomplete_trgm_idx
+    ON vocabulary_country USING gist (autocomplete_key(name) gist_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS vocabulary_condition_autocomplete_prefix_idx
+    ON vocabulary_condition ((autocomplete_key(name) COLLATE "C"));
+CREATE INDEX IF NOT EXISTS vocabulary_condition_autocomplete_trgm_idx
+    ON vocabulary_condition USING gist (autocomplete_key(name) gist_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS ct_condition_mesh_term_autocomplete_prefix_idx
+    ON ct_condition ((autocomplete_key(mesh_term) COLLATE "C"))
+    WHERE mesh_term IS NOT NULL;
@@ -59,6 +59,23 @@ COMMENT ON COLUMN ct.responsible_institution_id IS 'Institution responsible for
 COMMENT ON COLUMN ct.primary_sponsor_id IS 'Primary sponsor institution.';
 COMMENT ON COLUMN ct.study_sponsor_id IS 'Administrative sponsor or funding source.';
 
+-- Keyset pagination order for the public trial listing (newest first).
+CREATE INDEX IF NOT EXISTS ct_updated_at_id_idx
+    ON ct (updated_at, id)
+    WHERE is_public;
+
+-- Foreign-key indexes.
+CREATE INDEX IF NOT EXISTS ct_recruitment_status_id_idx
+    ON ct (recruitment_status_id);
+CREATE INDEX IF NOT EXISTS ct_study_phase_id_idx
+    ON ct (study_phase_id);
+CREATE INDEX IF NOT EXISTS ct_responsible_institution_id_idx
+    ON ct (responsible_institution_id);
+CREATE INDEX IF NOT EXISTS ct_primary_sponsor_id_idx
+    ON ct (primary_sponsor_id);
+CREATE INDEX IF NOT EXISTS ct_study_sponsor_id_idx
+    ON ct (study_sponsor_id);
+
 -- Secondary identifiers associated with a clinical trial.
 -- Author: Diego Tostes – <https://www.linkedin.com/in/diegotostes/>
 CREATE SEQUENCE IF NOT EXISTS ct_identifier_id_seq;
@@ -97,6 +114,11 @@ ALTER SEQUENCE ct_institution_id_seq OWNED BY ct_institution.id;
 
 COMMENT ON TABLE ct_institution IS 'Associates registered institutions to the clinical trial with a specific role.';
 
+CREATE INDEX IF NOT EXISTS ct_institution_ct_id_idx
+    ON ct_institution (ct_id);
+CREATE INDEX IF NOT EXISTS ct_institution_institution_id_idx
+    ON ct_institution (institution_id);
+
 -- Contact information for the clinical trial.
 -- Author: Diego Tostes – <https://www.linkedin.com/in/diegotostes/>
 CREATE SEQUENCE IF NOT EXISTS ct_contact_id_seq;
@@ -119,6 +141,13 @@ ALTER SEQUENCE ct_contact_id_seq OWNED BY ct_contact.id;
 
 COMMENT ON TABLE ct_contact IS 'Contact roster for the trial (scientific and public contacts).';
 
+CREATE INDEX IF NOT EXISTS ct_contact_ct_id_id_idx
+    ON ct_contact (ct_id, id);
+CREATE INDEX IF NOT EXISTS ct_contact_institution_id_idx
+    ON ct_contact (institution_id);
+CREATE INDEX IF NOT EXISTS ct_contact_country_id_idx
+    ON ct_contact (country_id);
+
 -- Reported conditions linked to the trial.
 -- Author: Diego Tostes – <https://www.linkedin.com/in/diegotostes/>
 CREATE SEQUENCE IF NOT EXISTS ct_condition_id_seq;
@@ -137,6 +166,11 @@ ALTER SEQUENCE ct_condition_id_seq OWNED BY ct_condition.id;
 
 COMMENT ON TABLE ct_condition IS 'Diseases or health conditions targeted by the clinical trial.';
 
+CREATE INDEX IF NOT EXISTS ct_condition_ct_id_condition_name_idx
+    ON ct_condition (ct_id, condition_name);
+CREATE INDEX IF NOT EXISTS ct_condition_condition_category_id_idx
+    ON ct_condition (condition_category_id);
+
 -- Declared keywords supporting free-text search.
 -- Author: Diego Tostes – <https://www.linkedin.com/in/diegotostes/>
 CREATE SEQUENCE IF NOT EXISTS ct_keyword_id_seq;
@@ -154,6 +188,9 @@ ALTER SEQUENCE ct_keyword_id_seq OWNED BY ct_keyword.id;
 
 COMMENT ON TABLE ct_keyword IS 'Search keywords supplied by the registrant.';
 
+CREATE INDEX IF NOT EXISTS ct_keyword_ct_id_idx
+    ON ct_keyword (ct_id);
+
 -- Study interventions.
 -- Author: Diego Tostes – <https://www.linkedin.com/in/diegotostes/>
 CREATE SEQUENCE IF NOT EXISTS ct_intervention_id_seq;
@@ -175,6 +212,13 @@ ALTER SEQUENCE ct_intervention_id_seq OWNED BY ct_intervention.id;
 
 COMMENT ON TABLE ct_intervention IS 'Interventions evaluated in the clinical trial.';
 
+CREATE INDEX IF NOT EXISTS ct_intervention_ct_id_name_idx
+    ON ct_intervention (ct_id, name);
+CREATE INDEX IF NOT EXISTS ct_intervention_intervention_type_id_idx
+    ON ct_intervention (intervention_type_id);
+CREATE INDEX IF NOT EXISTS ct_intervention_intervention_category_id_idx
+    ON ct_intervention (intervention_category_id);
+
 -- Outcome measures declared by the investigators.
 -- Author: Diego Tostes – <https://www.linkedin.com/in/diegotostes/>
 CREATE SEQUENCE IF NOT EXISTS ct_outcome_id_seq;
@@ -196,6 +240,9 @@ ALTER SEQUENCE ct_outcome_id_seq OWNED BY ct_outcome.id;
 
 COMMENT ON TABLE ct_outcome IS 'Primary and secondary outcome measures for the clinical trial.';
 
+CREATE INDEX IF NOT EXISTS ct_outcome_ct_id_idx
+    ON ct_outcome (ct_id);
+
 -- Recruitment locations and facilities.
 -- Author: Diego Tostes – <https://www.linkedin.com/in/diegotostes/>
 CREATE SEQUENCE IF NOT EXISTS ct_location_id_seq;
@@ -217,6 +264,13 @@ ALTER SEQUENCE ct_location_id_seq OWNED BY ct_location.id;
 
 COMMENT ON TABLE ct_location IS 'Geographic locations where the trial recruits participants.';
 
+CREATE INDEX IF NOT EXISTS ct_location_ct_id_idx
+    ON ct_location (ct_id);
+CREATE INDEX IF NOT EXISTS ct_location_country_id_idx
+    ON ct_location (country_id);
+CREATE INDEX IF NOT EXISTS ct_location_institution_id_idx
+    ON ct_location (institution_id);
+
 -- Documents uploaded or referenced by the registrant.
 -- Author: Diego Tostes – <https://www.linkedin.com/in/diegotostes/>
 CREATE SEQUENCE IF NOT EXISTS ct_document_id_seq;
@@ -229,6 +283,7 @@ CREATE TABLE IF NOT EXISTS ct_document (
     url TEXT,
     file_name TEXT,
     version TEXT,
+    is_confidential BOOLEAN NOT NULL DEFAULT FALSE,
     uploaded_at TIMESTAMPTZ DEFAULT NOW(),
     created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
     updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
@@ -236,7 +291,13 @@ CREATE TABLE IF NOT EXISTS ct_document (
 
 ALTER SEQUENCE ct_document_id_seq OWNED BY ct_document.id;
 
+ALTER TABLE ct_document ADD COLUMN IF NOT EXISTS is_confidential BOOLEAN NOT NULL DEFAULT FALSE;
+
 COMMENT ON TABLE ct_document IS 'Registry documents (protocols, consent forms, approvals).';
+COMMENT ON COLUMN ct_document.is_confidential IS 'Confidential documents are kept out of the public trial payload.';
+
+CREATE INDEX IF NOT EXISTS ct_document_ct_id_uploaded_at_id_idx
+    ON ct_document (ct_id, uploaded_at, id);
 
 -- Ethics committee approvals linked to the trial.
 -- Author: Diego Tostes – <https://www.linkedin.com/in/diegotostes/>
@@ -258,6 +319,13 @@ ALTER SEQUENCE ct_ethics_approval_id_seq OWNED BY ct_ethics_approval.id;
 
 COMMENT ON TABLE ct_ethics_approval IS 'Institutional review board approvals associated with the trial.';
 
+CREATE INDEX IF NOT EXISTS ct_ethics_approval_ct_id_idx
+    ON ct_ethics_approval (ct_id);
+CREATE INDEX IF NOT EXISTS ct_ethics_approval_institution_id_idx
+    ON ct_ethics_approval (institution_id);
+CREATE INDEX IF NOT EXISTS ct_ethics_approval_country_id_idx
+    ON ct_ethics_approval (country_id);
+
 -- Recruitment milestones to trace historical changes.
 -- Author: Diego Tostes – <https://www.linkedin.com/in/diegotostes/>
 CREATE SEQUENCE IF NOT EXISTS ct_status_history_id_seq;
@@ -276,6 +344,11 @@ ALTER SEQUENCE ct_status_history_id_seq OWNED BY ct_status_history.id;
 
 COMMENT ON TABLE ct_status_history IS 'Historical log of recruitment status transitions for the trial.';
 
+CREATE INDEX IF NOT EXISTS ct_status_history_ct_id_status_date_id_idx
+    ON ct_status_history (ct_id, status_date DESC, id DESC);
+CREATE INDEX IF NOT EXISTS ct_status_history_recruitment_status_id_idx
+    ON ct_status_history (recruitment_status_id);
+
 -- Auditing table capturing raw import metadata.
 -- Author: Diego Tostes – <https://www.linkedin.com/in/diegotostes/>
 CREATE SEQUENCE IF NOT EXISTS ct_import_log_id_seq;
@@ -295,3 +368,9 @@ ALTER SEQUENCE ct_import_log_id_seq OWNED BY ct_import_log.id;
 
 COMMENT ON TABLE ct_import_log IS 'Stores metadata about imported records from external registries.';
 
+CREATE INDEX IF NOT EXISTS ct_import_log_ct_id_idx
+    ON ct_import_log (ct_id);
+-- Resolves legacy keys to ct ids during migrations (migrate_trial_data).
+CREATE INDEX IF NOT EXISTS ct_import_log_source_idx
+    ON ct_import_log (source_system, source_identifier);
+
@@ -0,0 +1,16 @@
+-- Register codes reserved ahead of bulk approvals.
+-- Codes come from allocate_register_codes() and are handed out by
+-- claim_register_codes(), which skips rows locked by concurrent claims.
+
+CREATE TABLE IF NOT EXISTS ct_register_code_pool (
+    code VARCHAR(15) PRIMARY KEY,
+    prefix VARCHAR(3) NOT NULL,
+    allocated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    claimed_at TIMESTAMPTZ
+);
+
+CREATE INDEX IF NOT EXISTS ct_register_code_pool_available_idx
+    ON ct_register_code_pool (prefix, allocated_at, code)
+    WHERE claimed_at IS NULL;
+
+COMMENT ON TABLE ct_register_code_pool IS 'Preallocated register codes; claimed_at is set when a code is handed out.';
@@ -21,31 +21,286 @@ BEGIN
 END;
 $$;
 
--- Function: generate_register_code(prefix VARCHAR(3))
--- Author: REBEC Modernization Team
+-- Trigger function: mark_trial_payload_stale()
+-- Flags the cached document of the affected trial as stale. Only the first
+-- change per transaction writes (NOW() is the transaction timestamp), so a
+-- bulk child insert costs a single cache row update.
+
+CREATE OR REPLACE FUNCTION mark_trial_payload_stale()
+RETURNS TRIGGER AS $$
+DECLARE
+    v_ct_ids BIGINT[];
+BEGIN
+    IF TG_TABLE_NAME = 'ct' THEN
+        IF TG_OP = 'INSERT' THEN
+            INSERT INTO ct_payload_cache (ct_id, is_stale, invalidated_at)
+            VALUES (NEW.id, TRUE, NOW())
+            ON CONFLICT (ct_id) DO NOTHING;
+            RETURN NULL;
+        END IF;
+        IF TG_OP = 'DELETE' THEN
+            RETURN NULL;
+        END IF;
+        v_ct_ids := ARRAY[NEW.id];
+    ELSIF TG_OP = 'INSERT' THEN
+        v_ct_ids := ARRAY[NEW.ct_id];
+    ELSIF TG_OP = 'DELETE' THEN
+        v_ct_ids := ARRAY[OLD.ct_id];
+    ELSE
+        v_ct_ids := ARRAY[NEW.ct_id, OLD.ct_id];
+    END IF;
+
+    UPDATE ct_payload_cache
+    SET is_stale = TRUE,
+        invalidated_at = NOW(),
+        updated_at = NOW()
+    WHERE ct_id = ANY(v_ct_ids)
+      AND (NOT is_stale OR invalidated_at IS DISTINCT FROM NOW());
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
 
-CREATE OR REPLACE FUNCTION generate_register_code(prefix VARCHAR(3))
+DO $$
+DECLARE
+    v_table TEXT;
+BEGIN
+    FOREACH v_table IN ARRAY ARRAY[
+        'ct',
+        'ct_identifier',
+        'ct_institution',
+        'ct_contact',
+        'ct_condition',
+        'ct_keyword',
+        'ct_intervention',
+        'ct_outcome',
+        'ct_location',
+        'ct_document',
+        'ct_ethics_approval',
+        'ct_status_history'
+    ] LOOP
+        IF NOT EXISTS (
+            SELECT 1 FROM pg_trigger WHERE tgname = v_table || '_mark_payload_stale'
+        ) THEN
+            EXECUTE format(
+                'CREATE TRIGGER %I AFTER INSERT OR UPDATE OR DELETE ON %I'
+                ' FOR EACH ROW EXECUTE FUNCTION mark_trial_payload_stale()',
+                v_table || '_mark_payload_stale',
+                v_table
+            );
+        END IF;
+    END LOOP;
+END;
+$$;
+
+-- Trigger function: mark_trial_payloads_stale_by_vocabulary()
+-- Statement-level companion for the vocabulary tables whose names and codes
+-- are copied into the cached documents. Each trigger argument names a
+-- referencing column ('ct_location.country_id'), optionally reached through
+-- another vocabulary ('ct.responsible_institution_id via
+-- vocabulary_institution.country_id'). Only rows whose values actually
+-- changed invalidate anything. Deletes are blocked by the foreign keys and
+-- new rows are not referenced yet, so only updates are tracked.
+
+CREATE OR REPLACE FUNCTION mark_trial_payloads_stale_by_vocabulary()
+RETURNS TRIGGER AS $$
+DECLARE
+    v_ids BIGINT[];
+    v_ref TEXT;
+    v_target TEXT;
+    v_via TEXT;
+    v_table TEXT;
+    v_column TEXT;
+    v_keys TEXT;
+BEGIN
+    SELECT array_agg(new_row.id)
+    INTO v_ids
+    FROM new_rows AS new_row
+    JOIN old_rows AS old_row ON old_row.id = new_row.id
+    WHERE ROW(new_row.*) IS DISTINCT FROM ROW(old_row.*);
+
+    IF v_ids IS NULL THEN
+        RETURN NULL;
+    END IF;
+
+    FOREACH v_ref IN ARRAY TG_ARGV LOOP
+        v_target := split_part(v_ref, ' via ', 1);
+        v_via := split_part(v_ref, ' via ', 2);
+        v_table := split_part(v_target, '.', 1);
+        v_column := split_part(v_target, '.', 2);
+        IF v_via = '' THEN
+            v_keys := '$1';
+        ELSE
+            v_keys := format(
+                'ARRAY(SELECT via.id FROM %I AS via WHERE via.%I = ANY($1))',
+                split_part(v_via, '.', 1),
+                split_part(v_via, '.', 2)
+            );
+        END IF;
+
+        EXECUTE format(
+            'UPDATE ct_payload_cache AS pc'
+            ' SET is_stale = TRUE, invalidated_at = NOW(), updated_at = NOW()'
+            ' FROM %I AS ref'
+            ' WHERE ref.%I = ANY(%s)'
+            '   AND pc.ct_id = ref.%I'
+            '   AND (NOT pc.is_stale OR pc.invalidated_at IS DISTINCT FROM NOW())',
+            v_table,
+            v_column,
+            v_keys,
+            CASE WHEN v_table = 'ct' THEN 'id' ELSE 'ct_id' END
+        ) USING v_ids;
+    END LOOP;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+DECLARE
+    v_trigger RECORD;
+BEGIN
+    FOR v_trigger IN
+        SELECT refs.table_name, refs.columns
+        FROM (VALUES
+            ('vocabulary_recruitment_status',
+             ARRAY['ct.recruitment_status_id', 'ct_status_history.recruitment_status_id']),
+            ('vocabulary_study_phase',
+             ARRAY['ct.study_phase_id']),
+            ('vocabulary_institution',
+             ARRAY['ct.primary_sponsor_id', 'ct.responsible_institution_id',
+                   'ct_location.institution_id']),
+            ('vocabulary_country',
+             ARRAY['ct_location.country_id',
+                   'ct.responsible_institution_id via vocabulary_institution.country_id']),
+            ('vocabulary_intervention_type',
+             ARRAY['ct_intervention.intervention_type_id']),
+            ('vocabulary_intervention_category',
+             ARRAY['ct_intervention.intervention_category_id']),
+            ('vocabulary_condition_category',
+             ARRAY['ct_condition.condition_category_id'])
+        ) AS refs (table_name, columns)
+    LOOP
+        IF NOT EXISTS (
+            SELECT 1 FROM pg_trigger WHERE tgname = v_trigger.table_name || '_mark_payload_stale'
+        ) THEN
+            EXECUTE format(
+                'CREATE TRIGGER %I AFTER UPDATE ON %I'
+                ' REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows'
+                ' FOR EACH STATEMENT EXECUTE FUNCTION mark_trial_payloads_stale_by_vocabulary(%s)',
+                v_trigger.table_name || '_mark_payload_stale',
+                v_trigger.table_name,
+                (SELECT string_agg(quote_literal(ref), ', ') FROM unnest(v_trigger.columns) AS ref)
+            );
+        END IF;
+    END LOOP;
+END;
+$$;
+
+-- Trigger function: notify_vocabulary_change()
+-- Publishes the changed table on the vocabulary_changed channel so
+-- application processes can drop their cached vocabularies.
+
+CREATE OR REPLACE FUNCTION notify_vocabulary_change()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('vocabulary_changed', TG_TABLE_NAME);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+DECLARE
+    v_table TEXT;
+BEGIN
+    FOR v_table IN
+        SELECT tablename
+        FROM pg_tables
+        WHERE schemaname = current_schema()
+          AND tablename LIKE 'vocabulary\_%'
+    LOOP
+        IF NOT EXISTS (
+            SELECT 1 FROM pg_trigger WHERE tgname = v_table || '_notify_change'
+        ) THEN
+            EXECUTE format(
+                'CREATE TRIGGER %I AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON %I'
+                ' FOR EACH STATEMENT EXECUTE FUNCTION notify_vocabulary_change()',
+                v_table || '_notify_change',
+                v_table
+            );
+        END IF;
+    END LOOP;
+END;
+$$;
+
+-- Function: normalize_institution_name(p_name TEXT)
+-- Case- and whitespace-insensitive key used to deduplicate institutions.
+-- The unique index below is the conflict target of get_or_create_sponsor(),
+-- so existing duplicates must be merged before it can be built.
+
+CREATE OR REPLACE FUNCTION normalize_institution_name(p_name TEXT)
 RETURNS TEXT AS $$
+    SELECT lower(regexp_replace(btrim(p_name), '\s+', ' ', 'g'));
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+
+-- One-off merge of institutions whose names differ only in case or
+-- whitespace, run until the unique index exists. Every foreign key found in
+-- the catalog is repointed to the oldest row of each group, then the other
+-- rows are deleted.
+
+DO $$
 DECLARE
-    v_candidate TEXT;
-    v_prefix TEXT := UPPER(prefix);
+    v_fk RECORD;
 BEGIN
-    IF prefix IS NULL OR LENGTH(prefix) <> 3 THEN
-        RAISE EXCEPTION 'Prefix must be exactly three characters';
+    IF to_regclass('vocabulary_institution_normalized_name_uniq') IS NOT NULL
+       OR NOT EXISTS (
+           SELECT 1
+           FROM vocabulary_institution
+           GROUP BY normalize_institution_name(name)
+           HAVING count(*) > 1
+       ) THEN
+        RETURN;
     END IF;
 
+    CREATE TEMP TABLE vocabulary_institution_merge ON COMMIT DROP AS
+    SELECT grouped.id AS duplicate_id, grouped.survivor_id
+    FROM (
+        SELECT
+            id,
+            min(id) OVER (PARTITION BY normalize_institution_name(name)) AS survivor_id
+        FROM vocabulary_institution
+    ) AS grouped
+    WHERE grouped.id <> grouped.survivor_id;
+
+    FOR v_fk IN
+        SELECT con.conrelid::regclass AS table_name, att.attname AS column_name
+        FROM pg_constraint AS con
+        JOIN pg_attribute AS att
+          ON att.attrelid = con.conrelid
+         AND att.attnum = con.conkey[1]
+        WHERE con.contype = 'f'
+          AND con.confrelid = 'vocabulary_institution'::regclass
+          AND cardinality(con.conkey) = 1
     LOOP
-        v_candidate := v_prefix || UPPER(SUBSTRING(md5(random()::text || clock_timestamp()::text), 1, 6));
-        EXIT WHEN NOT EXISTS (
-            SELECT 1
-            FROM trials
-            WHERE public_identifier = v_candidate
+        EXECUTE format(
+            'UPDATE %s AS t SET %I = m.survivor_id'
+            ' FROM vocabulary_institution_merge AS m WHERE t.%I = m.duplicate_id',
+            v_fk.table_name,
+            v_fk.column_name,
+            v_fk.column_name
         );
     END LOOP;
 
-    RETURN v_candidate;
+    DELETE FROM vocabulary_institution AS vi
+    USING vocabulary_institution_merge AS m
+    WHERE vi.id = m.duplicate_id;
+
+    DROP TABLE vocabulary_institution_merge;
 END;
-$$ LANGUAGE plpgsql;
+$$;
+
+CREATE UNIQUE INDEX IF NOT EXISTS vocabulary_institution_normalized_name_uniq
+    ON vocabulary_institution (normalize_institution_name(name));
 
 -- Function: get_full_trial_json_auto_multilang(p_ct_id INTEGER)
 -- Author: REBEC Modernization Team
@@ -0,0 +1,28 @@
+-- Prebuilt trial documents served by primary-key lookup.
+-- Rows are marked stale by triggers on ct, its child tables and the
+-- vocabularies copied into the documents (see supporting_objects.sql) and
+-- rebuilt in batches by refresh_trial_payload_cache().
+
+CREATE TABLE IF NOT EXISTS ct_payload_cache (
+    ct_id BIGINT PRIMARY KEY REFERENCES ct(id) ON DELETE CASCADE,
+    payload JSONB,
+    content_hash TEXT,
+    built_at TIMESTAMPTZ,
+    is_stale BOOLEAN NOT NULL DEFAULT TRUE,
+    invalidated_at TIMESTAMPTZ,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS ct_payload_cache_stale_idx
+    ON ct_payload_cache (ct_id)
+    WHERE is_stale;
+
+COMMENT ON TABLE ct_payload_cache IS 'Cached output of get_full_trials_json_auto_multilang keyed by ct.id.';
+COMMENT ON COLUMN ct_payload_cache.content_hash IS 'md5 of the cached payload text.';
+COMMENT ON COLUMN ct_payload_cache.invalidated_at IS 'Transaction timestamp of the most recent change that made the row stale.';
+
+-- Read counters. Sequences are non-transactional and cheap to bump, so
+-- counting hits does not turn every cached read into a row update.
+CREATE SEQUENCE IF NOT EXISTS ct_payload_cache_hit_seq;
+CREATE SEQUENCE IF NOT EXISTS ct_payload_cache_miss_seq;
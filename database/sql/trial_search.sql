@@ -0,0 +1,15 @@
+-- Full-text search document for each clinical trial.
+-- The weighted tsvector combines titles, summary, keywords, conditions and
+-- intervention names and is maintained by the triggers declared in
+-- trial_search_objects.sql.
+
+CREATE TABLE IF NOT EXISTS ct_search (
+    ct_id BIGINT PRIMARY KEY REFERENCES ct(id) ON DELETE CASCADE,
+    search_vector TSVECTOR NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS ct_search_search_vector_idx
+    ON ct_search USING GIN (search_vector);
+
+COMMENT ON TABLE ct_search IS 'Bilingual (Portuguese/English) weighted search vector per trial.';
@@ -0,0 +1,162 @@
+-- Search configuration, helpers, and triggers maintaining ct_search.
+
+CREATE EXTENSION IF NOT EXISTS unaccent;
+
+-- Accent-insensitive copies of the built-in Portuguese and English
+-- configurations so "coracao" matches "coração".
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'rebec_portuguese') THEN
+        CREATE TEXT SEARCH CONFIGURATION rebec_portuguese (COPY = pg_catalog.portuguese);
+        ALTER TEXT SEARCH CONFIGURATION rebec_portuguese
+            ALTER MAPPING FOR hword, hword_part, word
+            WITH unaccent, portuguese_stem;
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'rebec_english') THEN
+        CREATE TEXT SEARCH CONFIGURATION rebec_english (COPY = pg_catalog.english);
+        ALTER TEXT SEARCH CONFIGURATION rebec_english
+            ALTER MAPPING FOR hword, hword_part, word
+            WITH unaccent, english_stem;
+    END IF;
+END;
+$$;
+
+-- Function: bilingual_tsvector(p_text TEXT, p_weight "char")
+
+CREATE OR REPLACE FUNCTION bilingual_tsvector(p_text TEXT, p_weight "char")
+RETURNS TSVECTOR AS $$
+    SELECT setweight(
+        to_tsvector('rebec_portuguese', COALESCE(p_text, ''))
+        || to_tsvector('rebec_english', COALESCE(p_text, '')),
+        p_weight
+    );
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Function: bilingual_tsquery(p_query TEXT)
+
+CREATE OR REPLACE FUNCTION bilingual_tsquery(p_query TEXT)
+RETURNS TSQUERY AS $$
+    SELECT websearch_to_tsquery('rebec_portuguese', COALESCE(p_query, ''))
+        || websearch_to_tsquery('rebec_english', COALESCE(p_query, ''))
+        || websearch_to_tsquery('simple', COALESCE(p_query, ''));
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Function: refresh_trial_search_documents(p_ct_ids BIGINT[])
+-- Rebuilds the search vector of the given trials from ct and its keyword,
+-- condition, and intervention rows.
+
+CREATE OR REPLACE FUNCTION refresh_trial_search_documents(p_ct_ids BIGINT[])
+RETURNS VOID AS $$
+    INSERT INTO ct_search (ct_id, search_vector, updated_at)
+    SELECT
+        c.id,
+        setweight(to_tsvector('simple', c.register_id), 'A')
+            || bilingual_tsvector(concat_ws(' ', c.public_title, c.scientific_title, c.acronym), 'A')
+            || bilingual_tsvector(terms.text, 'B')
+            || bilingual_tsvector(c.brief_summary, 'C'),
+        NOW()
+    FROM ct AS c
+    LEFT JOIN LATERAL (
+        SELECT string_agg(term.value, ' ') AS text
+        FROM (
+            SELECT ck.keyword
+            FROM ct_keyword AS ck
+            WHERE ck.ct_id = c.id
+            UNION ALL
+            SELECT concat_ws(' ', cc.condition_name, cc.mesh_term)
+            FROM ct_condition AS cc
+            WHERE cc.ct_id = c.id
+            UNION ALL
+            SELECT concat_ws(' ', ci.name, ci.other_names)
+            FROM ct_intervention AS ci
+            WHERE ci.ct_id = c.id
+        ) AS term(value)
+    ) AS terms ON TRUE
+    WHERE c.id = ANY(p_ct_ids)
+    ON CONFLICT (ct_id) DO UPDATE
+    SET search_vector = EXCLUDED.search_vector,
+        updated_at = EXCLUDED.updated_at;
+$$ LANGUAGE sql;
+
+-- Trigger function: refresh_trial_search()
+-- ct uses a row trigger limited to the indexed columns, while child tables
+-- use statement triggers with transition tables so a bulk insert rebuilds each
+-- affected trial once.
+
+CREATE OR REPLACE FUNCTION refresh_trial_search()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_TABLE_NAME = 'ct' THEN
+        PERFORM refresh_trial_search_documents(ARRAY[NEW.id]);
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM refresh_trial_search_documents(ARRAY(SELECT DISTINCT ct_id FROM new_rows));
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM refresh_trial_search_documents(ARRAY(SELECT DISTINCT ct_id FROM old_rows));
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+DECLARE
+    v_table TEXT;
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_trigger WHERE tgname = 'ct_refresh_search'
+    ) THEN
+        CREATE TRIGGER ct_refresh_search
+        AFTER INSERT OR UPDATE OF register_id, public_title, scientific_title, acronym, brief_summary
+        ON ct
+        FOR EACH ROW
+        EXECUTE FUNCTION refresh_trial_search();
+    END IF;
+
+    FOREACH v_table IN ARRAY ARRAY['ct_keyword', 'ct_condition', 'ct_intervention'] LOOP
+        IF NOT EXISTS (
+            SELECT 1 FROM pg_trigger WHERE tgname = v_table || '_refresh_search_ins'
+        ) THEN
+            EXECUTE format(
+                'CREATE TRIGGER %I AFTER INSERT ON %I'
+                ' REFERENCING NEW TABLE AS new_rows'
+                ' FOR EACH STATEMENT EXECUTE FUNCTION refresh_trial_search()',
+                v_table || '_refresh_search_ins',
+                v_table
+            );
+        END IF;
+        IF NOT EXISTS (
+            SELECT 1 FROM pg_trigger WHERE tgname = v_table || '_refresh_search_upd'
+        ) THEN
+            EXECUTE format(
+                'CREATE TRIGGER %I AFTER UPDATE ON %I'
+                ' REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows'
+                ' FOR EACH STATEMENT EXECUTE FUNCTION refresh_trial_search()',
+                v_table || '_refresh_search_upd',
+                v_table
+            );
+        END IF;
+        IF NOT EXISTS (
+            SELECT 1 FROM pg_trigger WHERE tgname = v_table || '_refresh_search_del'
+        ) THEN
+            EXECUTE format(
+                'CREATE TRIGGER %I AFTER DELETE ON %I'
+                ' REFERENCING OLD TABLE AS old_rows'
+                ' FOR EACH STATEMENT EXECUTE FUNCTION refresh_trial_search()',
+                v_table || '_refresh_search_del',
+                v_table
+            );
+        END IF;
+    END LOOP;
+END;
+$$;
+
+-- Backfill trials that predate the search table.
+SELECT refresh_trial_search_documents(ARRAY(
+    SELECT c.id
+    FROM ct AS c
+    LEFT JOIN ct_search AS s ON s.ct_id = c.id
+    WHERE s.ct_id IS NULL
+));
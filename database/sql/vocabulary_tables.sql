@@ -105,6 +105,15 @@ CREATE UNIQUE INDEX IF NOT EXISTS vocabulary_institution_name_legal_name_uniq
 
 ALTER SEQUENCE vocabulary_institution_id_seq OWNED BY vocabulary_institution.id;
 
+CREATE INDEX IF NOT EXISTS vocabulary_institution_institution_type_id_idx
+    ON vocabulary_institution (institution_type_id);
+CREATE INDEX IF NOT EXISTS vocabulary_institution_institution_scope_id_idx
+    ON vocabulary_institution (institution_scope_id);
+CREATE INDEX IF NOT EXISTS vocabulary_institution_institution_nature_id_idx
+    ON vocabulary_institution (institution_nature_id);
+CREATE INDEX IF NOT EXISTS vocabulary_institution_country_id_idx
+    ON vocabulary_institution (country_id);
+
 -- High-level classification for interventions.
 -- Author: Diego Tostes – <https://www.linkedin.com/in/diegotostes/
 CREATE SEQUENCE IF NOT EXISTS vocabulary_intervention_category_id_seq;
@@ -140,6 +149,9 @@ CREATE TABLE IF NOT EXISTS vocabulary_intervention_type (
 
 ALTER SEQUENCE vocabulary_intervention_type_id_seq OWNED BY vocabulary_intervention_type.id;
 
+CREATE INDEX IF NOT EXISTS vocabulary_intervention_type_intervention_category_id_idx
+    ON vocabulary_intervention_type (intervention_category_id);
+
 -- Granular breakdown for intervention types capturing sub classifications.
 -- Author: Diego Tostes – <https://www.linkedin.com/in/diegotostes/
 CREATE SEQUENCE IF NOT EXISTS vocabulary_intervention_subtype_id_seq;
@@ -180,6 +192,11 @@ CREATE UNIQUE INDEX IF NOT EXISTS vocabulary_intervention_name_type_uniq
 
 ALTER SEQUENCE vocabulary_intervention_id_seq OWNED BY vocabulary_intervention.id;
 
+CREATE INDEX IF NOT EXISTS vocabulary_intervention_intervention_type_id_idx
+    ON vocabulary_intervention (intervention_type_id);
+CREATE INDEX IF NOT EXISTS vocabulary_intervention_intervention_subtype_id_idx
+    ON vocabulary_intervention (intervention_subtype_id);
+
 -- Recruitment lifecycle statuses for registered clinical trials.
 -- Author: Diego Tostes – <https://www.linkedin.com/in/diegotostes/
 CREATE SEQUENCE IF NOT EXISTS vocabulary_recruitment_status_id_seq;
@@ -229,6 +246,28 @@ CREATE TABLE IF NOT EXISTS vocabulary_condition_category (
 
 ALTER SEQUENCE vocabulary_condition_category_id_seq OWNED BY vocabulary_condition_category.id;
 
+-- Condition terminologies (ICD-10, MeSH, DeCS) loaded in bulk by database/load_vocabulary.py.
+-- Author: REBEC Modernization Team
+CREATE SEQUENCE IF NOT EXISTS vocabulary_condition_id_seq;
+
+CREATE TABLE IF NOT EXISTS vocabulary_condition (
+    id BIGINT PRIMARY KEY DEFAULT nextval('vocabulary_condition_id_seq'),
+    condition_category_id BIGINT REFERENCES vocabulary_condition_category(id),
+    code_system VARCHAR(20) NOT NULL,
+    code VARCHAR(50) NOT NULL,
+    name TEXT NOT NULL,
+    parent_code VARCHAR(50),
+    is_active BOOLEAN NOT NULL DEFAULT TRUE,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    CONSTRAINT vocabulary_condition_system_code_uniq UNIQUE (code_system, code)
+);
+
+ALTER SEQUENCE vocabulary_condition_id_seq OWNED BY vocabulary_condition.id;
+
+CREATE INDEX IF NOT EXISTS vocabulary_condition_condition_category_id_idx
+    ON vocabulary_condition (condition_category_id);
+
 -- Secondary identifier types captured for harmonised registry references.
 -- Author: Diego Tostes – <https://www.linkedin.com/in/diegotostes/
 CREATE SEQUENCE IF NOT EXISTS vocabulary_secondary_identify_type_id_seq;
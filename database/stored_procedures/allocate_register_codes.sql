@@ -0,0 +1,49 @@
+CREATE OR REPLACE FUNCTION allocate_register_codes(p_prefix TEXT, p_count INTEGER DEFAULT 1)
+RETURNS SETOF TEXT
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_alphabet CONSTANT TEXT := '0123456789ABCDEFGHJKMNPQRSTVWXYZ';
+    v_prefix TEXT := upper(p_prefix);
+    v_sequence TEXT;
+    v_value BIGINT;
+    v_body TEXT;
+    v_position INTEGER;
+BEGIN
+    IF p_prefix IS NULL OR p_prefix !~ '^[A-Za-z]{3}$' THEN
+        RAISE EXCEPTION 'Prefix must be exactly three letters';
+    END IF;
+    IF p_count IS NULL OR p_count < 1 THEN
+        RAISE EXCEPTION 'Code count must be a positive integer';
+    END IF;
+
+    -- One sequence per prefix. Sequences never block concurrent callers and
+    -- never hand out the same value twice, so no uniqueness probe is needed.
+    v_sequence := format('register_code_%s_seq', lower(v_prefix));
+    IF to_regclass(v_sequence) IS NULL THEN
+        BEGIN
+            EXECUTE format(
+                'CREATE SEQUENCE IF NOT EXISTS %I MINVALUE 0 MAXVALUE 33554431 START 0 NO CYCLE',
+                v_sequence
+            );
+        EXCEPTION
+            WHEN unique_violation OR duplicate_table THEN
+                NULL;  -- created by a concurrent caller
+        END;
+    END IF;
+
+    FOR v_value IN
+        SELECT nextval(v_sequence::regclass) FROM generate_series(1, p_count)
+    LOOP
+        -- Multiplying by an odd constant modulo 2^25 is a bijection, so
+        -- consecutive values map to distinct, non-adjacent codes.
+        v_value := (v_value * 15485863) % 33554432;
+        v_body := '';
+        FOR v_position IN 1..5 LOOP
+            v_body := substr(v_alphabet, (v_value % 32)::INTEGER + 1, 1) || v_body;
+            v_value := v_value / 32;
+        END LOOP;
+        RETURN NEXT v_prefix || '-' || v_body || register_code_check_character(v_body);
+    END LOOP;
+END;
+$$;
@@ -0,0 +1,81 @@
+CREATE OR REPLACE FUNCTION autocomplete_conditions(
+    p_query TEXT,
+    p_limit INTEGER DEFAULT 10
+)
+RETURNS TABLE (
+    value TEXT,
+    label TEXT,
+    detail TEXT
+)
+LANGUAGE plpgsql
+STABLE
+AS $$
+DECLARE
+    v_key TEXT := autocomplete_key(p_query);
+    v_limit INTEGER := LEAST(GREATEST(COALESCE(p_limit, 10), 1), 50);
+    v_found INTEGER := 0;
+    v_rows INTEGER;
+BEGIN
+    IF v_key IS NULL OR v_key = '' THEN
+        RETURN;
+    END IF;
+
+    -- value is stored in ct_condition.mesh_term, so only MeSH/DeCS terms carry one.
+    RETURN QUERY
+    SELECT
+        CASE WHEN v.code_system IN ('MESH', 'DECS') THEN v.code::TEXT END,
+        v.name,
+        v.code_system || ' ' || v.code
+    FROM vocabulary_condition AS v
+    WHERE autocomplete_key(v.name) COLLATE "C" >= v_key COLLATE "C"
+      AND autocomplete_key(v.name) COLLATE "C" < (v_key || chr(1114111)) COLLATE "C"
+      AND v.is_active
+    ORDER BY autocomplete_key(v.name) COLLATE "C"
+    LIMIT v_limit;
+
+    GET DIAGNOSTICS v_found = ROW_COUNT;
+    IF v_found >= v_limit THEN
+        RETURN;
+    END IF;
+
+    -- Terms already used by trials but missing from the vocabulary.
+    RETURN QUERY
+    SELECT used.mesh_term, used.condition_name, 'MESH ' || used.mesh_term
+    FROM (
+        SELECT DISTINCT ON (autocomplete_key(c.mesh_term) COLLATE "C")
+            c.mesh_term,
+            c.condition_name
+        FROM ct_condition AS c
+        WHERE c.mesh_term IS NOT NULL
+          AND autocomplete_key(c.mesh_term) COLLATE "C" >= v_key COLLATE "C"
+          AND autocomplete_key(c.mesh_term) COLLATE "C" < (v_key || chr(1114111)) COLLATE "C"
+          AND NOT EXISTS (
+              SELECT 1 FROM vocabulary_condition AS v
+              WHERE v.code = c.mesh_term AND v.code_system IN ('MESH', 'DECS')
+          )
+        ORDER BY autocomplete_key(c.mesh_term) COLLATE "C"
+        LIMIT v_limit - v_found
+    ) AS used;
+
+    GET DIAGNOSTICS v_rows = ROW_COUNT;
+    v_found := v_found + v_rows;
+    IF v_found >= v_limit OR length(v_key) < 3 THEN
+        RETURN;
+    END IF;
+
+    RETURN QUERY
+    SELECT
+        CASE WHEN v.code_system IN ('MESH', 'DECS') THEN v.code::TEXT END,
+        v.name,
+        v.code_system || ' ' || v.code
+    FROM vocabulary_condition AS v
+    WHERE v_key <% autocomplete_key(v.name)
+      AND NOT (
+          autocomplete_key(v.name) COLLATE "C" >= v_key COLLATE "C"
+          AND autocomplete_key(v.name) COLLATE "C" < (v_key || chr(1114111)) COLLATE "C"
+      )
+      AND v.is_active
+    ORDER BY v_key <<-> autocomplete_key(v.name)
+    LIMIT v_limit - v_found;
+END;
+$$;
@@ -0,0 +1,64 @@
+CREATE OR REPLACE FUNCTION autocomplete_countries(
+    p_query TEXT,
+    p_limit INTEGER DEFAULT 10
+)
+RETURNS TABLE (
+    value TEXT,
+    label TEXT,
+    detail TEXT
+)
+LANGUAGE plpgsql
+STABLE
+AS $$
+DECLARE
+    v_key TEXT := autocomplete_key(p_query);
+    v_limit INTEGER := LEAST(GREATEST(COALESCE(p_limit, 10), 1), 50);
+    v_found INTEGER := 0;
+    v_iso_id BIGINT;
+BEGIN
+    IF v_key IS NULL OR v_key = '' THEN
+        RETURN;
+    END IF;
+
+    IF length(v_key) = 2 THEN
+        SELECT c.id INTO v_iso_id
+        FROM vocabulary_country AS c
+        WHERE c.iso_alpha2 = upper(v_key) AND c.is_active;
+        IF v_iso_id IS NOT NULL THEN
+            RETURN QUERY
+            SELECT c.id::TEXT, c.name, c.iso_alpha2::TEXT
+            FROM vocabulary_country AS c
+            WHERE c.id = v_iso_id;
+            v_found := 1;
+        END IF;
+    END IF;
+
+    RETURN QUERY
+    SELECT c.id::TEXT, c.name, c.iso_alpha2::TEXT
+    FROM vocabulary_country AS c
+    WHERE autocomplete_key(c.name) COLLATE "C" >= v_key COLLATE "C"
+      AND autocomplete_key(c.name) COLLATE "C" < (v_key || chr(1114111)) COLLATE "C"
+      AND c.is_active
+      AND c.id IS DISTINCT FROM v_iso_id
+    ORDER BY autocomplete_key(c.name) COLLATE "C"
+    LIMIT v_limit - v_found;
+
+    GET DIAGNOSTICS v_found = ROW_COUNT;
+    v_found := v_found + (v_iso_id IS NOT NULL)::INTEGER;
+    IF v_found >= v_limit OR length(v_key) < 3 THEN
+        RETURN;
+    END IF;
+
+    RETURN QUERY
+    SELECT c.id::TEXT, c.name, c.iso_alpha2::TEXT
+    FROM vocabulary_country AS c
+    WHERE v_key <% autocomplete_key(c.name)
+      AND NOT (
+          autocomplete_key(c.name) COLLATE "C" >= v_key COLLATE "C"
+          AND autocomplete_key(c.name) COLLATE "C" < (v_key || chr(1114111)) COLLATE "C"
+      )
+      AND c.is_active
+    ORDER BY v_key <<-> autocomplete_key(c.name)
+    LIMIT v_limit - v_found;
+END;
+$$;
@@ -0,0 +1,51 @@
+CREATE OR REPLACE FUNCTION autocomplete_institutions(
+    p_query TEXT,
+    p_limit INTEGER DEFAULT 10
+)
+RETURNS TABLE (
+    value TEXT,
+    label TEXT,
+    detail TEXT
+)
+LANGUAGE plpgsql
+STABLE
+AS $$
+DECLARE
+    v_key TEXT := autocomplete_key(p_query);
+    v_limit INTEGER := LEAST(GREATEST(COALESCE(p_limit, 10), 1), 50);
+    v_found INTEGER;
+BEGIN
+    IF v_key IS NULL OR v_key = '' THEN
+        RETURN;
+    END IF;
+
+    RETURN QUERY
+    SELECT i.id::TEXT, i.name, concat_ws(' · ', i.acronym, i.city, c.iso_alpha2::TEXT)
+    FROM vocabulary_institution AS i
+    LEFT JOIN vocabulary_country AS c ON c.id = i.country_id
+    WHERE autocomplete_key(i.name) COLLATE "C" >= v_key COLLATE "C"
+      AND autocomplete_key(i.name) COLLATE "C" < (v_key || chr(1114111)) COLLATE "C"
+      AND i.is_active
+    ORDER BY autocomplete_key(i.name) COLLATE "C"
+    LIMIT v_limit;
+
+    GET DIAGNOSTICS v_found = ROW_COUNT;
+    IF v_found >= v_limit OR length(v_key) < 3 THEN
+        RETURN;
+    END IF;
+
+    -- Every prefix match was returned above, so exclude them by the same range.
+    RETURN QUERY
+    SELECT i.id::TEXT, i.name, concat_ws(' · ', i.acronym, i.city, c.iso_alpha2::TEXT)
+    FROM vocabulary_institution AS i
+    LEFT JOIN vocabulary_country AS c ON c.id = i.country_id
+    WHERE v_key <% autocomplete_key(i.name)
+      AND NOT (
+          autocomplete_key(i.name) COLLATE "C" >= v_key COLLATE "C"
+          AND autocomplete_key(i.name) COLLATE "C" < (v_key || chr(1114111)) COLLATE "C"
+      )
+      AND i.is_active
+    ORDER BY v_key <<-> autocomplete_key(i.name)
+    LIMIT v_limit - v_found;
+END;
+$$;
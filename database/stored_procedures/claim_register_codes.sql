@@ -0,0 +1,43 @@
+CREATE OR REPLACE FUNCTION claim_register_codes(p_prefix TEXT, p_count INTEGER DEFAULT 1)
+RETURNS SETOF TEXT
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_codes TEXT[];
+    v_claimed INTEGER;
+BEGIN
+    IF p_count IS NULL OR p_count < 1 THEN
+        RAISE EXCEPTION 'Code count must be a positive integer';
+    END IF;
+
+    -- SKIP LOCKED lets concurrent approvals take disjoint codes from the
+    -- pool without waiting on each other.
+    WITH picked AS (
+        SELECT pool.code
+        FROM ct_register_code_pool AS pool
+        WHERE pool.prefix = upper(p_prefix)
+          AND pool.claimed_at IS NULL
+        ORDER BY pool.allocated_at, pool.code
+        LIMIT p_count
+        FOR UPDATE SKIP LOCKED
+    ),
+    claimed AS (
+        UPDATE ct_register_code_pool AS pool
+        SET claimed_at = NOW()
+        FROM picked
+        WHERE pool.code = picked.code
+        RETURNING pool.code
+    )
+    SELECT array_agg(claimed.code ORDER BY claimed.code)
+    INTO v_codes
+    FROM claimed;
+
+    v_claimed := COALESCE(cardinality(v_codes), 0);
+    RETURN QUERY SELECT unnest(v_codes);
+
+    -- An empty or exhausted pool falls back to the sequence.
+    IF v_claimed < p_count THEN
+        RETURN QUERY SELECT allocate_register_codes(p_prefix, p_count - v_claimed);
+    END IF;
+END;
+$$;
@@ -0,0 +1,197 @@
+CREATE OR REPLACE FUNCTION create_trial_from_json(p_trial JSONB)
+RETURNS BIGINT
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_ct_id BIGINT;
+    v_recruitment_status_id BIGINT;
+    v_study_phase_id BIGINT;
+    v_primary_sponsor_id BIGINT;
+BEGIN
+    IF p_trial IS NULL OR jsonb_typeof(p_trial) <> 'object' THEN
+        RAISE EXCEPTION 'Trial document must be a JSON object';
+    END IF;
+
+    -- Lookups accept either resolved ids (as sent by the web form, which
+    -- reads them from the vocabulary cache) or codes (for import callers).
+    v_recruitment_status_id := COALESCE(
+        (p_trial->>'recruitment_status_id')::BIGINT,
+        (SELECT id FROM vocabulary_recruitment_status WHERE code = p_trial->>'recruitment_status_code')
+    );
+    IF v_recruitment_status_id IS NULL THEN
+        RAISE EXCEPTION 'Unknown recruitment status code: %', p_trial->>'recruitment_status_code';
+    END IF;
+
+    IF p_trial ? 'study_phase_id' OR p_trial ? 'study_phase_code' THEN
+        v_study_phase_id := COALESCE(
+            (p_trial->>'study_phase_id')::BIGINT,
+            (SELECT id FROM vocabulary_study_phase WHERE code = p_trial->>'study_phase_code')
+        );
+        IF v_study_phase_id IS NULL AND p_trial->>'study_phase_code' IS NOT NULL THEN
+            RAISE EXCEPTION 'Unknown study phase code: %', p_trial->>'study_phase_code';
+        END IF;
+    END IF;
+
+    -- A sponsor picked from the autocomplete arrives with its id; free text
+    -- is matched (or created) by name.
+    v_primary_sponsor_id := COALESCE(
+        (p_trial#>>'{primary_sponsor,id}')::BIGINT,
+        get_or_create_sponsor(
+            p_trial#>>'{primary_sponsor,name}',
+            p_trial#>>'{primary_sponsor,type}',
+            p_trial#>>'{primary_sponsor,email}'
+        )
+    );
+
+    INSERT INTO ct (
+        register_id,
+        public_title,
+        scientific_title,
+        acronym,
+        recruitment_status_id,
+        study_phase_id,
+        brief_summary,
+        detailed_description,
+        primary_sponsor_id,
+        responsible_institution_id
+    )
+    VALUES (
+        p_trial->>'register_id',
+        p_trial->>'public_title',
+        COALESCE(p_trial->>'scientific_title', p_trial->>'public_title'),
+        p_trial->>'acronym',
+        v_recruitment_status_id,
+        v_study_phase_id,
+        p_trial->>'brief_summary',
+        p_trial->>'detailed_description',
+        v_primary_sponsor_id,
+        (p_trial->>'responsible_institution_id')::BIGINT
+    )
+    RETURNING id INTO v_ct_id;
+
+    WITH loc AS (
+        -- A column definition list cannot be combined with WITH ORDINALITY
+        -- directly, so it goes inside ROWS FROM.
+        SELECT *
+        FROM ROWS FROM (
+            jsonb_to_recordset(COALESCE(p_trial->'locations', '[]'::jsonb)) AS (
+                country_id BIGINT,
+                state TEXT,
+                city TEXT,
+                institution_id BIGINT,
+                site_name TEXT,
+                postal_code TEXT,
+                status TEXT
+            )
+        ) WITH ORDINALITY AS l(
+            country_id,
+            state,
+            city,
+            institution_id,
+            site_name,
+            postal_code,
+            status,
+            ord
+        )
+    )
+    INSERT INTO ct_location (ct_id, country_id, state, city, institution_id, postal_code, status)
+    SELECT
+        v_ct_id,
+        loc.country_id,
+        loc.state,
+        loc.city,
+        COALESCE(loc.institution_id, site.sponsor_id),
+        loc.postal_code,
+        loc.status
+    FROM loc
+    LEFT JOIN get_or_create_sponsors(ARRAY(SELECT loc.site_name FROM loc ORDER BY loc.ord)) AS site
+        ON site.ord = loc.ord
+    ORDER BY loc.ord;
+
+    INSERT INTO ct_intervention (
+        ct_id,
+        intervention_type_id,
+        intervention_category_id,
+        name,
+        description,
+        other_names,
+        arm_group
+    )
+    SELECT
+        v_ct_id,
+        iv.intervention_type_id,
+        COALESCE(iv.intervention_category_id, it.intervention_category_id),
+        iv.name,
+        iv.description,
+        iv.other_names,
+        iv.arm_group
+    FROM jsonb_to_recordset(COALESCE(p_trial->'interventions', '[]'::jsonb)) AS iv(
+        intervention_type_id BIGINT,
+        intervention_category_id BIGINT,
+        name TEXT,
+        description TEXT,
+        other_names TEXT,
+        arm_group TEXT
+    )
+    LEFT JOIN vocabulary_intervention_type AS it ON it.id = iv.intervention_type_id;
+
+    INSERT INTO ct_condition (ct_id, condition_name, condition_category_id, mesh_term)
+    SELECT v_ct_id, cond.condition_name, cond.condition_category_id, cond.mesh_term
+    FROM jsonb_to_recordset(COALESCE(p_trial->'conditions', '[]'::jsonb)) AS cond(
+        condition_name TEXT,
+        condition_category_id BIGINT,
+        mesh_term TEXT
+    );
+
+    INSERT INTO ct_document (ct_id, document_type, description, url, file_name, version, is_confidential)
+    SELECT
+        v_ct_id,
+        doc.document_type,
+        doc.description,
+        doc.url,
+        doc.file_name,
+        doc.version,
+        COALESCE(doc.is_confidential, FALSE)
+    FROM jsonb_to_recordset(COALESCE(p_trial->'documents', '[]'::jsonb)) AS doc(
+        document_type TEXT,
+        description TEXT,
+        url TEXT,
+        file_name TEXT,
+        version TEXT,
+        is_confidential BOOLEAN
+    );
+
+    INSERT INTO ct_keyword (ct_id, keyword)
+    SELECT DISTINCT v_ct_id, btrim(kw.keyword)
+    FROM jsonb_array_elements_text(COALESCE(p_trial->'keywords', '[]'::jsonb)) AS kw(keyword)
+    WHERE btrim(kw.keyword) <> '';
+
+    INSERT INTO ct_contact (ct_id, contact_role, person_name, email, phone, institution_id, country_id)
+    SELECT
+        v_ct_id,
+        contact.contact_role,
+        contact.person_name,
+        contact.email,
+        contact.phone,
+        contact.institution_id,
+        contact.country_id
+    FROM jsonb_to_recordset(COALESCE(p_trial->'contacts', '[]'::jsonb)) AS contact(
+        contact_role TEXT,
+        person_name TEXT,
+        email TEXT,
+        phone TEXT,
+        institution_id BIGINT,
+        country_id BIGINT
+    );
+
+    INSERT INTO ct_identifier (ct_id, identifier_type, identifier_value, issuing_authority)
+    SELECT v_ct_id, ident.identifier_type, ident.identifier_value, ident.issuing_authority
+    FROM jsonb_to_recordset(COALESCE(p_trial->'identifiers', '[]'::jsonb)) AS ident(
+        identifier_type TEXT,
+        identifier_value TEXT,
+        issuing_authority TEXT
+    );
+
+    RETURN v_ct_id;
+END;
+$$;
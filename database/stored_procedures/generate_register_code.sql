@@ -0,0 +1,6 @@
+CREATE OR REPLACE FUNCTION generate_register_code(prefix VARCHAR(3))
+RETURNS TEXT
+LANGUAGE sql
+AS $$
+    SELECT code FROM claim_register_codes(prefix, 1) AS code LIMIT 1;
+$$;
@@ -0,0 +1,28 @@
+CREATE OR REPLACE FUNCTION get_cached_trial_json(p_ct_id BIGINT)
+RETURNS JSONB
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_payload JSONB;
+BEGIN
+    IF p_ct_id IS NULL THEN
+        RAISE EXCEPTION 'Trial identifier cannot be null';
+    END IF;
+
+    SELECT payload
+    INTO v_payload
+    FROM ct_payload_cache
+    WHERE ct_id = p_ct_id
+      AND NOT is_stale;
+
+    IF v_payload IS NOT NULL THEN
+        PERFORM nextval('ct_payload_cache_hit_seq');
+        RETURN v_payload;
+    END IF;
+
+    -- Misses are served live and left for refresh_trial_payload_cache() so
+    -- the read path never writes to the cache table.
+    PERFORM nextval('ct_payload_cache_miss_seq');
+    RETURN get_full_trial_json_auto_multilang(p_ct_id::INTEGER);
+END;
+$$;
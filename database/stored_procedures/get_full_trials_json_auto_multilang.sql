@@ -0,0 +1,293 @@
+-- p_sections was added after the first release; drop the old signature so
+-- three-argument calls do not become ambiguous.
+DROP FUNCTION IF EXISTS get_full_trials_json_auto_multilang(BIGINT[], TIMESTAMPTZ, BOOLEAN);
+
+CREATE OR REPLACE FUNCTION get_full_trials_json_auto_multilang(
+    p_ct_ids BIGINT[] DEFAULT NULL,
+    p_updated_since TIMESTAMPTZ DEFAULT NULL,
+    p_public_only BOOLEAN DEFAULT FALSE,
+    p_sections TEXT[] DEFAULT NULL
+)
+RETURNS TABLE (
+    ct_id BIGINT,
+    payload JSONB
+)
+LANGUAGE sql
+STABLE
+AS $$
+    -- Each child table is aggregated once for the whole selection and joined
+    -- back by ct_id, instead of running one LATERAL subquery per trial. Kept
+    -- as a plain SQL function so the planner can inline it and stream rows
+    -- to server-side cursors instead of materializing the whole result.
+    --
+    -- p_sections lists the child collections to include (NULL means all of
+    -- them). The filter on each aggregate depends only on the parameter, so
+    -- the planner turns it into a one-time filter and never scans the child
+    -- table of a section that was not asked for; its key is then removed
+    -- from the document.
+    WITH selected AS (
+        SELECT c.id
+        FROM ct AS c
+        WHERE (p_ct_ids IS NULL OR c.id = ANY(p_ct_ids))
+          AND (p_updated_since IS NULL OR c.updated_at > p_updated_since)
+          AND (NOT p_public_only OR c.is_public)
+    ),
+    location_data AS (
+        SELECT
+            cl.ct_id,
+            jsonb_agg(
+                jsonb_build_object(
+                    'ct_location_id', cl.id,
+                    'country', jsonb_build_object(
+                        'id', loc_country.id,
+                        'code', loc_country.iso_alpha2,
+                        'name', loc_country.name
+                    ),
+                    'state', cl.state,
+                    'city', cl.city,
+                    'institution', CASE
+                        WHEN loc_inst.id IS NULL THEN NULL
+                        ELSE jsonb_build_object(
+                            'id', loc_inst.id,
+                            'name', loc_inst.name
+                        )
+                    END,
+                    'postal_code', cl.postal_code,
+                    'status', cl.status
+                ) ORDER BY loc_country.name, cl.state, cl.city
+            ) AS locations
+        FROM ct_location AS cl
+        JOIN selected AS s ON s.id = cl.ct_id
+        JOIN vocabulary_country AS loc_country ON loc_country.id = cl.country_id
+        LEFT JOIN vocabulary_institution AS loc_inst ON loc_inst.id = cl.institution_id
+        WHERE p_sections IS NULL OR 'locations' = ANY(p_sections)
+        GROUP BY cl.ct_id
+    ),
+    intervention_data AS (
+        SELECT
+            ci.ct_id,
+            jsonb_agg(
+                jsonb_build_object(
+                    'ct_intervention_id', ci.id,
+                    'name', ci.name,
+                    'description', ci.description,
+                    'intervention_type', CASE
+                        WHEN it.id IS NULL THEN NULL
+                        ELSE jsonb_build_object(
+                            'id', it.id,
+                            'code', it.code,
+                            'description', it.description
+                        )
+                    END,
+                    'intervention_category', CASE
+                        WHEN icat.id IS NULL THEN NULL
+                        ELSE jsonb_build_object(
+                            'id', icat.id,
+                            'code', icat.code,
+                            'description', icat.description
+                        )
+                    END
+                ) ORDER BY ci.name
+            ) AS interventions
+        FROM ct_intervention AS ci
+        JOIN selected AS s ON s.id = ci.ct_id
+        LEFT JOIN vocabulary_intervention_type AS it ON it.id = ci.intervention_type_id
+        LEFT JOIN vocabulary_intervention_category AS icat ON icat.id = ci.intervention_category_id
+        WHERE p_sections IS NULL OR 'interventions' = ANY(p_sections)
+        GROUP BY ci.ct_id
+    ),
+    condition_data AS (
+        SELECT
+            cc.ct_id,
+            jsonb_agg(
+                jsonb_build_object(
+                    'ct_condition_id', cc.id,
+                    'condition_name', cc.condition_name,
+                    'condition_category', CASE
+                        WHEN cat.id IS NULL THEN NULL
+                        ELSE jsonb_build_object(
+                            'id', cat.id,
+                            'code', cat.code,
+                            'name', cat.name,
+                            'description', cat.description
+                        )
+                    END
+                ) ORDER BY cc.condition_name
+            ) AS conditions
+        FROM ct_condition AS cc
+        JOIN selected AS s ON s.id = cc.ct_id
+        LEFT JOIN vocabulary_condition_category AS cat ON cat.id = cc.condition_category_id
+        WHERE p_sections IS NULL OR 'conditions' = ANY(p_sections)
+        GROUP BY cc.ct_id
+    ),
+    document_data AS (
+        SELECT
+            cd.ct_id,
+            jsonb_agg(
+                jsonb_build_object(
+                    'ct_document_id', cd.id,
+                    'document_type', cd.document_type,
+                    'url', cd.url,
+                    'file_name', cd.file_name,
+                    'uploaded_at', to_jsonb(cd.uploaded_at)
+                ) ORDER BY cd.uploaded_at, cd.id
+            ) AS documents
+        FROM ct_document AS cd
+        JOIN selected AS s ON s.id = cd.ct_id
+        WHERE NOT cd.is_confidential
+          AND (p_sections IS NULL OR 'documents' = ANY(p_sections))
+        GROUP BY cd.ct_id
+    ),
+    contact_data AS (
+        SELECT
+            tc.ct_id,
+            jsonb_agg(
+                jsonb_strip_nulls(jsonb_build_object(
+                    'contact_id', tc.id,
+                    'contact_type', tc.contact_role,
+                    'person_name', tc.person_name,
+                    'email', tc.email,
+                    'phone', tc.phone
+                )) ORDER BY tc.id
+            ) AS contacts
+        FROM ct_contact AS tc
+        JOIN selected AS s ON s.id = tc.ct_id
+        WHERE p_sections IS NULL OR 'contacts' = ANY(p_sections)
+        GROUP BY tc.ct_id
+    ),
+    identifier_data AS (
+        SELECT
+            ti.ct_id,
+            jsonb_agg(
+                jsonb_strip_nulls(jsonb_build_object(
+                    'identifier_id', ti.id,
+                    'identifier_type', ti.identifier_type,
+                    'identifier_value', ti.identifier_value,
+                    'issued_by', ti.issuing_authority
+                )) ORDER BY ti.id
+            ) AS identifiers
+        FROM ct_identifier AS ti
+        JOIN selected AS s ON s.id = ti.ct_id
+        WHERE p_sections IS NULL OR 'identifiers' = ANY(p_sections)
+        GROUP BY ti.ct_id
+    ),
+    status_history_data AS (
+        SELECT
+            tsh.ct_id,
+            jsonb_agg(
+                jsonb_strip_nulls(jsonb_build_object(
+                    'status_history_id', tsh.id,
+                    'status_date', to_jsonb(tsh.status_date),
+                    'note', tsh.comment,
+                    'recruitment_status', jsonb_build_object(
+                        'id', hrs.id,
+                        'code', hrs.code,
+                        'description', hrs.description
+                    )
+                )) ORDER BY tsh.status_date DESC, tsh.id DESC
+            ) AS status_history
+        FROM ct_status_history AS tsh
+        JOIN selected AS s ON s.id = tsh.ct_id
+        JOIN vocabulary_recruitment_status AS hrs ON hrs.id = tsh.recruitment_status_id
+        WHERE p_sections IS NULL OR 'status_history' = ANY(p_sections)
+        GROUP BY tsh.ct_id
+    )
+    SELECT
+        c.id,
+        jsonb_build_object(
+            'ct_id', c.id,
+            'register_id', c.register_id,
+            'public_title', c.public_title,
+            'scientific_title', c.scientific_title,
+            'official_title_multilang', CASE
+                WHEN c.scientific_title IS NULL THEN NULL
+                ELSE jsonb_strip_nulls(jsonb_build_object(
+                    'default', c.scientific_title,
+                    'pt-BR', c.scientific_title,
+                    'en-US', c.scientific_title
+                ))
+            END,
+            'brief_summary', c.brief_summary,
+            'brief_summary_multilang', CASE
+                WHEN c.brief_summary IS NULL THEN NULL
+                ELSE jsonb_strip_nulls(jsonb_build_object(
+                    'default', c.brief_summary,
+                    'pt-BR', c.brief_summary,
+                    'en-US', c.brief_summary
+                ))
+            END,
+            'recruitment_status', jsonb_build_object(
+                'id', rs.id,
+                'code', rs.code,
+                'description', rs.description
+            ),
+            'study_phase', CASE
+                WHEN sp.id IS NULL THEN NULL
+                ELSE jsonb_build_object(
+                    'id', sp.id,
+                    'code', sp.code,
+                    'description', sp.description
+                )
+            END,
+            'enrollment', jsonb_strip_nulls(jsonb_build_object(
+                'actual', c.enrollment_actual,
+                'target', c.enrollment_target
+            )),
+            'primary_sponsor', CASE
+                WHEN ps.id IS NULL THEN NULL
+                ELSE jsonb_build_object(
+                    'id', ps.id,
+                    'name', ps.name,
+                    'email', ps.email,
+                    'country_id', ps.country_id
+                )
+            END,
+            'responsible_institution', CASE
+                WHEN ri.id IS NULL THEN NULL
+                ELSE jsonb_build_object(
+                    'id', ri.id,
+                    'name', ri.name,
+                    'country', CASE
+                        WHEN ric.id IS NULL THEN NULL
+                        ELSE jsonb_build_object(
+                            'id', ric.id,
+                            'code', ric.iso_alpha2,
+                            'name', ric.name
+                        )
+                    END
+                )
+            END,
+            'locations', COALESCE(ld.locations, '[]'::jsonb),
+            'interventions', COALESCE(itd.interventions, '[]'::jsonb),
+            'conditions', COALESCE(cd.conditions, '[]'::jsonb),
+            'documents', COALESCE(dd.documents, '[]'::jsonb),
+            'contacts', COALESCE(ctd.contacts, '[]'::jsonb),
+            'identifiers', COALESCE(idd.identifiers, '[]'::jsonb),
+            'status_history', COALESCE(shd.status_history, '[]'::jsonb),
+            'created_at', to_jsonb(c.created_at),
+            'updated_at', to_jsonb(c.updated_at)
+        ) - ARRAY(
+            SELECT section
+            FROM unnest(ARRAY[
+                'locations', 'interventions', 'conditions', 'documents',
+                'contacts', 'identifiers', 'status_history'
+            ]) AS section
+            WHERE p_sections IS NOT NULL
+              AND section <> ALL(p_sections)
+        )
+    FROM selected AS s
+    JOIN ct AS c ON c.id = s.id
+    JOIN vocabulary_recruitment_status AS rs ON rs.id = c.recruitment_status_id
+    LEFT JOIN vocabulary_study_phase AS sp ON sp.id = c.study_phase_id
+    LEFT JOIN vocabulary_institution AS ps ON ps.id = c.primary_sponsor_id
+    LEFT JOIN vocabulary_institution AS ri ON ri.id = c.responsible_institution_id
+    LEFT JOIN vocabulary_country AS ric ON ric.id = ri.country_id
+    LEFT JOIN location_data AS ld ON ld.ct_id = c.id
+    LEFT JOIN intervention_data AS itd ON itd.ct_id = c.id
+    LEFT JOIN condition_data AS cd ON cd.ct_id = c.id
+    LEFT JOIN document_data AS dd ON dd.ct_id = c.id
+    LEFT JOIN contact_data AS ctd ON ctd.ct_id = c.id
+    LEFT JOIN identifier_data AS idd ON idd.ct_id = c.id
+    LEFT JOIN status_history_data AS shd ON shd.ct_id = c.id
+    ORDER BY c.id;
+$$;
@@ -2,24 +2,37 @@ CREATE OR REPLACE FUNCTION get_or_create_sponsor(p_name TEXT, p_type TEXT, p_ema
 RETURNS BIGINT AS $$
 DECLARE
     v_id BIGINT;
+    v_email TEXT;
 BEGIN
     IF p_name IS NULL OR btrim(p_name) = '' THEN
         RETURN NULL;
     END IF;
 
-    SELECT id INTO v_id
+    -- Fast path: an existing sponsor whose email does not change needs no
+    -- write (and burns no sequence value).
+    SELECT id, email INTO v_id, v_email
     FROM vocabulary_institution
-    WHERE name = p_name;
+    WHERE normalize_institution_name(name) = normalize_institution_name(p_name);
 
+    IF v_id IS NOT NULL AND (p_email IS NULL OR v_email IS NOT DISTINCT FROM p_email) THEN
+        RETURN v_id;
+    END IF;
+
+    INSERT INTO vocabulary_institution AS vi (name, email)
+    VALUES (btrim(p_name), p_email)
+    ON CONFLICT ((normalize_institution_name(name))) DO UPDATE
+    SET email = EXCLUDED.email,
+        updated_at = NOW()
+    WHERE EXCLUDED.email IS NOT NULL
+      AND vi.email IS DISTINCT FROM EXCLUDED.email
+    RETURNING id INTO v_id;
+
+    -- A concurrent transaction may have inserted the same sponsor with the
+    -- same email; ON CONFLICT waited for it, so a fresh statement sees it.
     IF v_id IS NULL THEN
-        INSERT INTO vocabulary_institution(name, email)
-        VALUES (p_name, p_email)
-        RETURNING id INTO v_id;
-    ELSE
-        UPDATE vocabulary_institution
-        SET email = COALESCE(p_email, email),
-            updated_at = NOW()
-        WHERE id = v_id;
+        SELECT id INTO v_id
+        FROM vocabulary_institution
+        WHERE normalize_institution_name(name) = normalize_institution_name(p_name);
     END IF;
 
     RETURN v_id;
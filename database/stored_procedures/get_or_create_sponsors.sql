@@ -0,0 +1,43 @@
+CREATE OR REPLACE FUNCTION get_or_create_sponsors(p_names TEXT[], p_emails TEXT[] DEFAULT NULL)
+RETURNS TABLE(ord BIGINT, sponsor_name TEXT, sponsor_id BIGINT)
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF p_emails IS NOT NULL AND cardinality(p_emails) <> cardinality(p_names) THEN
+        RAISE EXCEPTION 'Names and emails arrays must have the same length';
+    END IF;
+
+    -- One insert for every new name and every changed email. Names that
+    -- normalize to the same key are collapsed, keeping the first non-null
+    -- email, so the statement never touches the same row twice.
+    INSERT INTO vocabulary_institution AS vi (name, email)
+    SELECT src.name, src.email
+    FROM (
+        SELECT DISTINCT ON (normalize_institution_name(input.name))
+            btrim(input.name) AS name,
+            input.email
+        FROM unnest(p_names, p_emails) WITH ORDINALITY AS input(name, email, ord)
+        WHERE btrim(input.name) <> ''
+        ORDER BY normalize_institution_name(input.name), input.email IS NULL, input.ord
+    ) AS src
+    WHERE NOT EXISTS (
+        SELECT 1
+        FROM vocabulary_institution AS existing
+        WHERE normalize_institution_name(existing.name) = normalize_institution_name(src.name)
+          AND (src.email IS NULL OR existing.email IS NOT DISTINCT FROM src.email)
+    )
+    ON CONFLICT ((normalize_institution_name(name))) DO UPDATE
+    SET email = EXCLUDED.email,
+        updated_at = NOW()
+    WHERE EXCLUDED.email IS NOT NULL
+      AND vi.email IS DISTINCT FROM EXCLUDED.email;
+
+    -- Separate statement so rows committed by concurrent callers are visible.
+    RETURN QUERY
+    SELECT input.ord, input.name, inst.id
+    FROM unnest(p_names) WITH ORDINALITY AS input(name, ord)
+    LEFT JOIN vocabulary_institution AS inst
+        ON normalize_institution_name(inst.name) = normalize_institution_name(input.name)
+    ORDER BY input.ord;
+END;
+$$;
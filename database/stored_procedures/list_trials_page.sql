@@ -0,0 +1,113 @@
+CREATE OR REPLACE FUNCTION list_trials_page(
+    p_cursor_updated_at TIMESTAMPTZ DEFAULT NULL,
+    p_cursor_id BIGINT DEFAULT NULL,
+    p_direction TEXT DEFAULT 'next',
+    p_limit INTEGER DEFAULT 25,
+    p_recruitment_status_code TEXT DEFAULT NULL,
+    p_study_phase_code TEXT DEFAULT NULL,
+    p_country_code TEXT DEFAULT NULL,
+    p_search TEXT DEFAULT NULL
+)
+RETURNS TABLE (
+    ct_id BIGINT,
+    register_id VARCHAR(15),
+    public_title TEXT,
+    recruitment_status_code VARCHAR(50),
+    recruitment_status TEXT,
+    study_phase_code VARCHAR(50),
+    study_phase TEXT,
+    updated_at TIMESTAMPTZ
+)
+LANGUAGE plpgsql
+STABLE
+AS $$
+DECLARE
+    v_limit INTEGER := LEAST(GREATEST(COALESCE(p_limit, 25), 1), 100);
+    v_search TEXT := NULLIF(btrim(p_search), '');
+    v_country_code TEXT := UPPER(NULLIF(btrim(p_country_code), ''));
+    v_query TSQUERY := bilingual_tsquery(v_search);
+BEGIN
+    IF p_direction NOT IN ('next', 'prev') THEN
+        RAISE EXCEPTION 'Unknown pagination direction: %', p_direction;
+    END IF;
+
+    IF (p_cursor_updated_at IS NULL) <> (p_cursor_id IS NULL) THEN
+        RAISE EXCEPTION 'Pagination cursor requires both updated_at and id';
+    END IF;
+
+    -- Rows are ordered newest first on (updated_at, id). One extra row is
+    -- returned so callers can tell whether another page exists in the
+    -- requested direction without a separate COUNT(*).
+    IF p_direction = 'prev' THEN
+        RETURN QUERY
+        SELECT page.*
+        FROM (
+            SELECT
+                c.id,
+                c.register_id,
+                c.public_title,
+                rs.code AS status_code,
+                rs.description AS status_description,
+                sp.code AS phase_code,
+                sp.description AS phase_description,
+                c.updated_at
+            FROM ct AS c
+            JOIN vocabulary_recruitment_status AS rs ON rs.id = c.recruitment_status_id
+            LEFT JOIN vocabulary_study_phase AS sp ON sp.id = c.study_phase_id
+            WHERE c.is_public
+              AND (c.updated_at, c.id) > (p_cursor_updated_at, p_cursor_id)
+              AND (p_recruitment_status_code IS NULL OR rs.code = p_recruitment_status_code)
+              AND (p_study_phase_code IS NULL OR sp.code = p_study_phase_code)
+              AND (v_country_code IS NULL OR EXISTS (
+                    SELECT 1
+                    FROM ct_location AS cl
+                    JOIN vocabulary_country AS vc ON vc.id = cl.country_id
+                    WHERE cl.ct_id = c.id
+                      AND vc.iso_alpha2 = v_country_code
+              ))
+              AND (v_search IS NULL OR EXISTS (
+                    SELECT 1
+                    FROM ct_search AS s
+                    WHERE s.ct_id = c.id
+                      AND s.search_vector @@ v_query
+              ))
+            ORDER BY c.updated_at, c.id
+            LIMIT v_limit + 1
+        ) AS page
+        ORDER BY page.updated_at DESC, page.id DESC;
+    ELSE
+        RETURN QUERY
+        SELECT
+            c.id,
+            c.register_id,
+            c.public_title,
+            rs.code,
+            rs.description,
+            sp.code,
+            sp.description,
+            c.updated_at
+        FROM ct AS c
+        JOIN vocabulary_recruitment_status AS rs ON rs.id = c.recruitment_status_id
+        LEFT JOIN vocabulary_study_phase AS sp ON sp.id = c.study_phase_id
+        WHERE c.is_public
+          AND (p_cursor_id IS NULL OR (c.updated_at, c.id) < (p_cursor_updated_at, p_cursor_id))
+          AND (p_recruitment_status_code IS NULL OR rs.code = p_recruitment_status_code)
+          AND (p_study_phase_code IS NULL OR sp.code = p_study_phase_code)
+          AND (v_country_code IS NULL OR EXISTS (
+                SELECT 1
+                FROM ct_location AS cl
+                JOIN vocabulary_country AS vc ON vc.id = cl.country_id
+                WHERE cl.ct_id = c.id
+                  AND vc.iso_alpha2 = v_country_code
+          ))
+          AND (v_search IS NULL OR EXISTS (
+                SELECT 1
+                FROM ct_search AS s
+                WHERE s.ct_id = c.id
+                  AND s.search_vector @@ v_query
+          ))
+        ORDER BY c.updated_at DESC, c.id DESC
+        LIMIT v_limit + 1;
+    END IF;
+END;
+$$;
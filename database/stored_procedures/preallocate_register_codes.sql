@@ -0,0 +1,15 @@
+CREATE OR REPLACE FUNCTION preallocate_register_codes(p_prefix TEXT, p_count INTEGER)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_added INTEGER;
+BEGIN
+    INSERT INTO ct_register_code_pool (code, prefix)
+    SELECT code, upper(p_prefix)
+    FROM allocate_register_codes(p_prefix, p_count) AS code;
+
+    GET DIAGNOSTICS v_added = ROW_COUNT;
+    RETURN v_added;
+END;
+$$;
@@ -0,0 +1,57 @@
+CREATE OR REPLACE FUNCTION refresh_trial_payload_cache(p_batch_size INTEGER DEFAULT 500)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_refreshed INTEGER;
+BEGIN
+    IF p_batch_size IS NULL OR p_batch_size < 1 THEN
+        RAISE EXCEPTION 'Batch size must be a positive integer';
+    END IF;
+
+    -- Picks stale rows plus trials that have never been cached. The upsert
+    -- only clears the stale flag when invalidated_at is unchanged, so a
+    -- trial edited while its batch was being built stays stale.
+    WITH batch AS (
+        SELECT c.id AS ct_id, pc.invalidated_at
+        FROM ct AS c
+        LEFT JOIN ct_payload_cache AS pc ON pc.ct_id = c.id
+        WHERE pc.ct_id IS NULL OR pc.is_stale
+        ORDER BY c.id
+        LIMIT p_batch_size
+    ),
+    built AS (
+        SELECT trial.ct_id, trial.payload
+        FROM get_full_trials_json_auto_multilang(
+            (SELECT array_agg(batch.ct_id) FROM batch)
+        ) AS trial
+    )
+    INSERT INTO ct_payload_cache AS pc (
+        ct_id,
+        payload,
+        content_hash,
+        built_at,
+        is_stale,
+        invalidated_at
+    )
+    SELECT
+        built.ct_id,
+        built.payload,
+        md5(built.payload::TEXT),
+        NOW(),
+        FALSE,
+        batch.invalidated_at
+    FROM built
+    JOIN batch ON batch.ct_id = built.ct_id
+    ON CONFLICT (ct_id) DO UPDATE
+    SET payload = EXCLUDED.payload,
+        content_hash = EXCLUDED.content_hash,
+        built_at = EXCLUDED.built_at,
+        is_stale = FALSE,
+        updated_at = NOW()
+    WHERE pc.invalidated_at IS NOT DISTINCT FROM EXCLUDED.invalidated_at;
+
+    GET DIAGNOSTICS v_refreshed = ROW_COUNT;
+    RETURN v_refreshed;
+END;
+$$;
@@ -0,0 +1,28 @@
+CREATE OR REPLACE FUNCTION register_code_check_character(p_body TEXT)
+RETURNS TEXT
+LANGUAGE plpgsql
+IMMUTABLE
+AS $$
+DECLARE
+    -- Crockford base32: no I, L, O or U, so codes survive being read aloud.
+    v_alphabet CONSTANT TEXT := '0123456789ABCDEFGHJKMNPQRSTVWXYZ';
+    v_factor INTEGER := 2;
+    v_sum INTEGER := 0;
+    v_addend INTEGER;
+    v_index INTEGER;
+BEGIN
+    -- Luhn mod 32: catches every single-character error and most adjacent
+    -- transpositions.
+    FOR v_index IN REVERSE length(p_body)..1 LOOP
+        v_addend := strpos(v_alphabet, substr(p_body, v_index, 1)) - 1;
+        IF v_addend < 0 THEN
+            RAISE EXCEPTION 'Invalid register code character: %', substr(p_body, v_index, 1);
+        END IF;
+        v_addend := v_addend * v_factor;
+        v_sum := v_sum + v_addend / 32 + v_addend % 32;
+        v_factor := 3 - v_factor;
+    END LOOP;
+
+    RETURN substr(v_alphabet, (32 - v_sum % 32) % 32 + 1, 1);
+END;
+$$;
@@ -0,0 +1,62 @@
+CREATE OR REPLACE FUNCTION search_trials(
+    p_query TEXT,
+    p_limit INTEGER DEFAULT 20,
+    p_offset INTEGER DEFAULT 0
+)
+RETURNS TABLE (
+    ct_id BIGINT,
+    register_id VARCHAR(15),
+    public_title TEXT,
+    recruitment_status_code VARCHAR(50),
+    recruitment_status TEXT,
+    rank REAL,
+    snippet TEXT
+)
+LANGUAGE plpgsql
+STABLE
+AS $$
+DECLARE
+    v_query TSQUERY;
+BEGIN
+    IF p_query IS NULL OR btrim(p_query) = '' THEN
+        RETURN;
+    END IF;
+
+    v_query := bilingual_tsquery(p_query);
+
+    -- Rank against the GIN-indexed vector first and only build headlines for
+    -- the rows of the requested page.
+    RETURN QUERY
+    SELECT
+        ranked.id,
+        ranked.register_id,
+        ranked.public_title,
+        rs.code,
+        rs.description,
+        ranked.score,
+        ts_headline(
+            'rebec_portuguese',
+            COALESCE(ranked.brief_summary, ''),
+            v_query,
+            'MaxFragments=2, MaxWords=25, MinWords=10'
+        )
+    FROM (
+        SELECT
+            c.id,
+            c.register_id,
+            c.public_title,
+            c.brief_summary,
+            c.recruitment_status_id,
+            ts_rank_cd(s.search_vector, v_query) AS score
+        FROM ct_search AS s
+        JOIN ct AS c ON c.id = s.ct_id
+        WHERE s.search_vector @@ v_query
+          AND c.is_public
+        ORDER BY score DESC, c.id DESC
+        LIMIT LEAST(GREATEST(COALESCE(p_limit, 20), 1), 100)
+        OFFSET GREATEST(COALESCE(p_offset, 0), 0)
+    ) AS ranked
+    JOIN vocabulary_recruitment_status AS rs ON rs.id = ranked.recruitment_status_id
+    ORDER BY ranked.score DESC, ranked.id DESC;
+END;
+$$;